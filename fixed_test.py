@@ -1,8 +1,7 @@
 #!/usr/bin/env python
 # fixed_test.py
 
-import os
-from dotenv import load_dotenv
+from mcp_atlassian._env import load_env_once
 from mcp_atlassian.config import JiraConfig
 from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.jira.issues import IssueManager
@@ -10,21 +9,21 @@ from mcp_atlassian.jira.projects import ProjectManager
 
 def main():
     # Load environment variables
-    load_dotenv()
+    env = load_env_once()
     
     # Print environment variables for debugging
     print("Environment variables:")
-    print(f"JIRA_URL: {os.getenv('JIRA_URL')}")
-    print(f"JIRA_USERNAME: {os.getenv('JIRA_USERNAME')}")
-    print(f"JIRA_API_TOKEN: {os.getenv('JIRA_API_TOKEN')}")
+    print(f"JIRA_URL: {env['JIRA_URL']}")
+    print(f"JIRA_USERNAME: {env['JIRA_USERNAME']}")
+    print(f"JIRA_API_TOKEN: {env['JIRA_API_TOKEN']}")
     
     # Create JiraConfig manually
     config = JiraConfig(
-        url=os.getenv("JIRA_URL"),
-        username=os.getenv("JIRA_USERNAME", ""),
-        api_token=os.getenv("JIRA_API_TOKEN", ""),
-        personal_token=os.getenv("JIRA_PERSONAL_TOKEN", ""),
-        verify_ssl=os.getenv("JIRA_SSL_VERIFY", "true").lower() != "false"
+        url=env["JIRA_URL"],
+        username=env["JIRA_USERNAME"] or "",
+        api_token=env["JIRA_API_TOKEN"] or "",
+        personal_token=env["JIRA_PERSONAL_TOKEN"] or "",
+        verify_ssl=(env["JIRA_SSL_VERIFY"] or "true").lower() != "false"
     )
     
     # Initialize JiraClient directly
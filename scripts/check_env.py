@@ -0,0 +1,19 @@
+"""
+Print the Jira connection settings read from the environment and .env file.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+
+def main() -> None:
+    """Load .env without overriding the environment and print the Jira settings."""
+    load_dotenv(override=False, verbose=False)
+
+    settings = {name: os.getenv(name) for name in ("JIRA_URL", "JIRA_USERNAME", "JIRA_API_TOKEN")}
+    print("\n".join(f"{name}: {value}" for name, value in settings.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Environment loading helpers.
+"""
+
+import functools
+import os
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+# Environment variables used to configure Jira
+JIRA_ENV_VARS = (
+    "JIRA_URL",
+    "JIRA_USERNAME",
+    "JIRA_API_TOKEN",
+    "JIRA_PERSONAL_TOKEN",
+    "JIRA_SSL_VERIFY",
+    "JIRA_HTTP2",
+    "JIRA_BOARD_PAGE_SIZE",
+    "JIRA_FIELD_CACHE_TTL",
+    "JIRA_FIELD_CACHE_READS",
+    "JIRA_TRUST_RESPONSES",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_env_once() -> Dict[str, Optional[str]]:
+    """
+    Load the .env file and snapshot the Jira environment variables.
+
+    The .env file is parsed at most once per process, however many entry
+    points call this function.
+
+    Returns:
+        Dictionary mapping each Jira environment variable to its value, or None if unset
+    """
+    load_dotenv()
+    return {name: os.environ.get(name) for name in JIRA_ENV_VARS}
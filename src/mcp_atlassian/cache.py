@@ -0,0 +1,189 @@
+"""
+In-memory caches for Atlassian API responses.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Set, Tuple
+
+# Configure logging
+logger = logging.getLogger("mcp-atlassian")
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept, least recently used are evicted first
+            ttl: Number of seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is missing or expired
+
+        Returns:
+            The cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove an entry if it is present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_matching(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Remove every entry whose key matches a predicate.
+
+        Args:
+            predicate: Function returning True for keys to remove
+        """
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SWRCache(TTLCache):
+    """
+    Stale-while-revalidate cache.
+
+    Entries younger than ttl_fresh are served as they are. Entries between
+    ttl_fresh and ttl_stale are served while a background thread reloads them,
+    older entries are reloaded before returning.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_fresh: float = 30, ttl_stale: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept, least recently used are evicted first
+            ttl_fresh: Number of seconds an entry is served without reloading
+            ttl_stale: Number of seconds an entry may be served while it is reloaded
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl_stale)
+        self.ttl_fresh = ttl_fresh
+        self._refreshing: Set[Hashable] = set()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, loading it if it is missing or too old.
+
+        Args:
+            key: Cache key
+            loader: Function returning the current value, None results are not cached
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        refresh = False
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                remaining = expires_at - time.monotonic()
+                if remaining > 0:
+                    self._data.move_to_end(key)
+                    if remaining <= self.ttl - self.ttl_fresh and key not in self._refreshing:
+                        self._refreshing.add(key)
+                        refresh = True
+                else:
+                    del self._data[key]
+                    entry = None
+
+        if entry is None:
+            value = loader()
+            if value is not None:
+                self.set(key, value)
+            return value
+
+        if refresh:
+            threading.Thread(target=self._refresh, args=(key, loader), daemon=True).start()
+        return value
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """Reload a stale entry, keeping the stale value if loading fails."""
+        try:
+            value = loader()
+        except Exception as e:
+            logger.debug("Background refresh of %r failed: %s", key, e)
+            value = None
+
+        with self._lock:
+            # A key discarded while reloading must not be revived with old data
+            if key not in self._refreshing:
+                return
+            self._refreshing.discard(key)
+        if value is not None:
+            self.set(key, value)
+
+    def discard_matching(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Remove every entry whose key matches a predicate.
+
+        Reloads already running for matching keys will not store their result.
+
+        Args:
+            predicate: Function returning True for keys to remove
+        """
+        with self._lock:
+            self._refreshing = {key for key in self._refreshing if not predicate(key)}
+        super().discard_matching(predicate)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._refreshing.clear()
+        super().clear()
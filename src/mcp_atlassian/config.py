@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass
@@ -24,8 +25,13 @@ class JiraConfig:
     api_token: str = ""  # API token used as password for cloud
     personal_token: str = ""  # Personal Access Token used for Server/Data Center
     verify_ssl: bool = True  # Whether to verify SSL certificates
+    http2: bool = False  # Whether to multiplex requests over HTTP/2 (requires h2)
+    board_page_size: int = 100  # Default page size of paginated board resources
+    field_cache_ttl: int = 900  # Seconds discovered field IDs are reused, 0 disables caching
+    field_cache_max_reads: int = 1000  # Reads of cached field IDs before rediscovery
+    trust_responses: bool = False  # Whether to build models from Jira responses without validation
 
-    @property
+    @cached_property
     def is_cloud(self) -> bool:
-        """Check if this is a cloud instance."""
+        """Check if this is a cloud instance, computed once per configuration."""
         return "atlassian.net" in self.url
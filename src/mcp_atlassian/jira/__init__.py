@@ -8,10 +8,9 @@ The main entry point for external code is the JiraFetcher class, which provides
 a backward-compatible interface to the underlying implementation.
 """
 
-from .client import JiraClient
-from .issues import IssueManager
-from .projects import ProjectManager
-from .facade import JiraFetcher
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     JiraAPIError,
     JiraAuthenticationError,
@@ -24,6 +23,36 @@ from .exceptions import (
     JiraWorkflowError,
 )
 
+if TYPE_CHECKING:
+    from .client import JiraClient
+    from .issues import IssueManager
+    from .projects import ProjectManager
+    from .facade import JiraFetcher
+
+# Public classes whose modules are only imported on first access (PEP 562),
+# so importing the package does not load atlassian-python-api and friends
+_LAZY_ATTRIBUTES = {
+    "JiraClient": ".client",
+    "IssueManager": ".issues",
+    "ProjectManager": ".projects",
+    "JiraFetcher": ".facade",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily loaded public classes on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "JiraClient",
     "IssueManager",
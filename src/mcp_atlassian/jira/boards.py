@@ -2,11 +2,24 @@
 Implementation of Jira Boards API operations.
 """
 
+import functools
+import inspect
 import logging
-from typing import Any, Dict, List, Optional, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from requests import HTTPError
+
+from ..cache import SWRCache, TTLCache
+from ..config import JiraConfig
 from ..document_types import Document
-from .client import JiraClient
+from .client import (
+    MAX_RATE_LIMIT_RETRIES,
+    RATE_LIMIT_BACKOFF_SECONDS,
+    JiraClient,
+    _rate_limit_interval,
+)
 from .exceptions import (
     JiraAPIError,
     JiraPermissionError,
@@ -17,8 +30,154 @@ from .exceptions import (
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
+# Base paths of the Jira Agile API
+AGILE_API_PATH = "/rest/agile/1.0"
+_BOARD_URL = f"{AGILE_API_PATH}/board"
+
+# Maximum number of pages fetched in parallel by concurrent pagination
+MAX_CONCURRENT_PAGES = 8
+
+# Maximum number of boards queried in parallel by get_boards_issues
+MAX_CONCURRENT_BOARDS = 16
+
+# Lifetime and size of the board metadata cache
+BOARD_CACHE_TTL_SECONDS = 600
+BOARD_CACHE_MAXSIZE = 256
+
+# Board listings are served as is while fresh, and refreshed in the background while stale
+LISTING_CACHE_FRESH_SECONDS = 30
+LISTING_CACHE_STALE_SECONDS = 300
+
+
+def _paragraph_text(content: List[Any]) -> Optional[str]:
+    """
+    Extract text from ADF content made only of paragraphs of text nodes.
+
+    This is the shape of most issue descriptions, handled here without the
+    generic tree walk.
+
+    Args:
+        content: Content list of an Atlassian Document Format document
+
+    Returns:
+        Concatenated text, or None if the content has any other shape
+    """
+    parts = []
+    try:
+        for block in content:
+            if block.get("type") != "paragraph":
+                return None
+            for child in block.get("content", ()):
+                if child.get("type") != "text":
+                    return None
+                parts.append(child.get("text", ""))
+    except AttributeError:
+        return None
+    return "".join(parts)
+
+
+def _extract_adf_text(desc: Any) -> str:
+    """
+    Extract plain text from an issue description.
+
+    Args:
+        desc: Description as a string, an Atlassian Document Format node, or None
+
+    Returns:
+        Concatenated text of all text nodes, in document order
+    """
+    if not desc:
+        return ""
+    if isinstance(desc, str):
+        return desc
+    if not isinstance(desc, dict):
+        return ""
+
+    content = desc.get("content", [])
+    text = _paragraph_text(content)
+    if text is not None:
+        return text
+
+    parts = []
+    stack = deque(content)
+    while stack:
+        node = stack.popleft()
+        if not isinstance(node, dict):
+            continue
+        if node.get("type") == "text":
+            parts.append(node.get("text", ""))
+        else:
+            # Push children to the front so they are visited before later siblings
+            stack.extendleft(reversed(node.get("content", [])))
+    return "".join(parts)
+
+
+def _optional_params(*pairs: Tuple[str, Any]) -> Dict[str, Any]:
+    """Build query parameters from (name, value) pairs, skipping unset values."""
+    return {name: value for name, value in pairs if value}
+
+
+def _cache_key(method: Callable) -> Callable[..., Tuple[Any, ...]]:
+    """
+    Build a function computing cache keys for calls of a BoardManager method.
 
-class BoardManager(JiraClient):
+    The cache key is the method name followed by its bound arguments, so the
+    board ID is always the second element of the key.
+    """
+    signature = inspect.signature(method)
+
+    def key(self: "BoardManager", *args: Any, **kwargs: Any) -> Tuple[Any, ...]:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        values = list(bound.arguments.values())[1:]
+        # Lists (e.g., fields) are not hashable
+        return (method.__name__, *(tuple(v) if isinstance(v, list) else v for v in values))
+
+    return key
+
+
+def _copy_cached(value: Any) -> Any:
+    """Shallow-copy a cached list or dict, so callers mutating a result don't change the cache."""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _ttl_cached(method: Callable) -> Callable:
+    """Cache the result of a BoardManager method in the instance's board cache."""
+    cache_key = _cache_key(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "BoardManager", *args: Any, **kwargs: Any) -> Any:
+        key = cache_key(self, *args, **kwargs)
+
+        cached = self._board_cache.get(key)
+        if cached is not None:
+            return _copy_cached(cached)
+
+        result = method(self, *args, **kwargs)
+        if result is not None:
+            self._board_cache.set(key, result)
+        return _copy_cached(result)
+
+    return wrapper
+
+
+def _swr_cached(method: Callable) -> Callable:
+    """Cache the result of a BoardManager listing in the instance's stale-while-revalidate cache."""
+    cache_key = _cache_key(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "BoardManager", *args: Any, **kwargs: Any) -> Any:
+        key = cache_key(self, *args, **kwargs)
+        return _copy_cached(self._listing_cache.get_or_load(key, lambda: method(self, *args, **kwargs)))
+
+    return wrapper
+
+
+class BoardManager:
     """
     Manages Jira Board operations.
 
@@ -26,11 +185,175 @@ class BoardManager(JiraClient):
     in Jira, including operations on board elements like sprints, issues, and configurations.
     """
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the BoardManager."""
-        super().__init__(*args, **kwargs)
-        # Base path for Jira Agile API
-        self._agile_path = "/rest/agile/1.0"
+    __slots__ = (
+        "client",
+        "jira",
+        "config",
+        "_browse_prefix",
+        "_board_cache",
+        "_listing_cache",
+    )
+
+    # Issue fields used to build Documents, requested when callers don't pass fields
+    DEFAULT_ISSUE_FIELDS = ("summary", "issuetype", "status", "description")
+
+    def __init__(self, client: JiraClient):
+        """
+        Initialize the BoardManager.
+
+        Args:
+            client: JiraClient instance for interacting with the Jira API
+        """
+        self.client = client
+        self.jira = client.jira
+        self.config = client.config
+
+        # Prefix of issue URLs, shared by every converted issue
+        self._browse_prefix = f"{self.config.url}/browse/"
+
+        # Board metadata and configuration rarely change
+        self._board_cache = TTLCache(maxsize=BOARD_CACHE_MAXSIZE, ttl=BOARD_CACHE_TTL_SECONDS)
+
+        # Board issues, epics and sprints change during the day but are polled often
+        self._listing_cache = SWRCache(
+            maxsize=BOARD_CACHE_MAXSIZE,
+            ttl_fresh=LISTING_CACHE_FRESH_SECONDS,
+            ttl_stale=LISTING_CACHE_STALE_SECONDS,
+        )
+
+    def invalidate_board(self, board_id: int) -> None:
+        """
+        Evict cached metadata, configuration and listings of a board.
+
+        Args:
+            board_id: ID of the board
+        """
+        self._board_cache.discard_matching(lambda key: key[1] == board_id)
+        self._listing_cache.discard_matching(lambda key: key[1] == board_id)
+
+    @classmethod
+    def from_config(cls, config: Optional[JiraConfig] = None) -> "BoardManager":
+        """
+        Create a BoardManager with its own JiraClient.
+
+        Args:
+            config: Jira configuration. If None, it will be created from environment variables.
+
+        Returns:
+            BoardManager using a new JiraClient
+        """
+        return cls(JiraClient(config))
+
+    def _page_size(self, requested: Optional[int]) -> int:
+        """Return the requested page size, or the configured default if none was given."""
+        return self.config.board_page_size if requested is None else requested
+
+    def _rate_limited_get(self, url: str, **kwargs: Any) -> Any:
+        """
+        Send a GET request, honouring Jira rate limits.
+
+        Waits until the rate limiter allows a request, and retries responses with
+        status 429 using the Retry-After header or an exponential backoff.
+
+        Args:
+            url: URL of the resource
+            **kwargs: Additional arguments passed on to Jira.get
+
+        Returns:
+            Decoded response body
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.client._wait_for_rate_limit()
+
+            try:
+                return self.jira.get(url, **kwargs)
+            except HTTPError as e:
+                response = e.response
+                if response is None or response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                delay = max(_rate_limit_interval(response.headers), RATE_LIMIT_BACKOFF_SECONDS * 2**attempt)
+                logger.warning("Rate limited on %s, retrying in %.1fs", url, delay)
+                self.client._defer_requests(delay)
+
+    def _get_all_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        results_key: str = "issues",
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves every page of a paginated Agile API resource.
+
+        The first page is fetched to discover the total number of items, then
+        the remaining pages are fetched concurrently and merged in order.
+
+        Args:
+            url: URL of the resource
+            params: Query parameters, including startAt and maxResults
+            results_key: Key holding the list of items in each response
+
+        Returns:
+            List of all items from startAt to the end of the resource
+        """
+        response = self._rate_limited_get(url, params=params)
+        items = list(response.get(results_key, []))
+        total = response.get("total", 0)
+
+        # Step by the number of items actually returned, the server may cap maxResults
+        page_size = len(items)
+        if not page_size:
+            return items
+        starts = range(params["startAt"] + page_size, total, page_size)
+        if not starts:
+            return items
+        if page_size < params["maxResults"]:
+            logger.warning(
+                "Server returned %s of %s requested items for %s, using page size %s for remaining pages",
+                page_size, params["maxResults"], url, page_size,
+            )
+
+        def fetch_page(start: int) -> List[Dict[str, Any]]:
+            page = self._rate_limited_get(url, params={**params, "startAt": start, "maxResults": page_size})
+            return page.get(results_key, [])
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_PAGES, len(starts))) as executor:
+            for page_items in executor.map(fetch_page, starts):
+                items.extend(page_items)
+
+        return items
+
+    def _issue_to_document(self, issue: Dict[str, Any], **extra_metadata: Any) -> Document:
+        """
+        Convert an Agile API issue to a Document.
+
+        Args:
+            issue: Issue data returned by the Agile API
+            **extra_metadata: Additional metadata entries (e.g., source, sprint_id)
+
+        Returns:
+            Document with the summary and description as content
+        """
+        issue_key = issue.get("key", "")
+        fields = issue.get("fields", {})
+        summary = fields.get("summary", "")
+
+        # Extract description - plain text or Atlassian Document Format
+        description = _extract_adf_text(fields.get("description"))
+
+        # Construct content
+        content = f"{summary}\n\n{description}" if description else summary
+
+        # Add metadata
+        metadata = {
+            "key": issue_key,
+            "summary": summary,
+            "type": fields.get("issuetype", {}).get("name", ""),
+            "status": fields.get("status", {}).get("name", ""),
+            "url": self._browse_prefix + issue_key,
+            **extra_metadata,
+        }
+
+        return Document(page_content=content, metadata=metadata)
 
     def get_boards(
         self,
@@ -62,35 +385,30 @@ class BoardManager(JiraClient):
             List of boards matching the criteria
         """
         try:
-            url = f"{self._agile_path}/board"
+            url = _BOARD_URL
             
             # Build query parameters
             params = {
                 "startAt": start_at,
-                "maxResults": max_results
+                "maxResults": max_results,
+                **_optional_params(
+                    ("type", type),
+                    ("name", name),
+                    ("projectKeyOrId", project_key_or_id),
+                    ("accountId", account_id),
+                    ("filterId", filter_id),
+                    ("orderBy", order_by),
+                    ("expand", expand),
+                ),
             }
-            
-            if type:
-                params["type"] = type
-            if name:
-                params["name"] = name
-            if project_key_or_id:
-                params["projectKeyOrId"] = project_key_or_id
-            if account_id:
-                params["accountId"] = account_id
-            if filter_id:
-                params["filterId"] = filter_id
-            if order_by:
-                params["orderBy"] = order_by
-            if expand:
-                params["expand"] = expand
                 
-            response = self.jira.get(url, params=params)
+            response = self._rate_limited_get(url, params=params)
             return response.get("values", [])
         except Exception as e:
-            logger.error(f"Error retrieving boards: {str(e)}")
-            self._handle_error(e, "boards")
+            logger.error("Error retrieving boards: %s", e)
+            self.client._handle_error(e, "boards")
 
+    @_ttl_cached
     def get_board(
         self,
         board_id: int,
@@ -112,17 +430,16 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}"
+            url = f"{_BOARD_URL}/{board_id}"
             
-            params = {}
-            if expand:
-                params["expand"] = expand
+            params = _optional_params(("expand", expand))
                 
-            return self.jira.get(url, params=params)
+            return self._rate_limited_get(url, params=params)
         except Exception as e:
-            logger.error(f"Error retrieving board {board_id}: {str(e)}")
-            self._handle_error(e, "board", str(board_id))
+            logger.error("Error retrieving board %s: %s", board_id, e)
+            self.client._handle_error(e, "board", str(board_id))
 
+    @_ttl_cached
     def get_board_configuration(self, board_id: int) -> Dict[str, Any]:
         """
         Retrieves the configuration of a specific board.
@@ -139,20 +456,23 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}/configuration"
-            return self.jira.get(url)
+            url = f"{_BOARD_URL}/{board_id}/configuration"
+            return self._rate_limited_get(url)
         except Exception as e:
-            logger.error(f"Error retrieving board configuration for board {board_id}: {str(e)}")
-            self._handle_error(e, "board configuration", str(board_id))
+            logger.error("Error retrieving board configuration for board %s: %s", board_id, e)
+            self.client._handle_error(e, "board configuration", str(board_id))
 
+    @_swr_cached
     def get_board_issues(
         self,
         board_id: int,
         start_at: int = 0,
-        max_results: int = 50,
+        max_results: Optional[int] = None,
         jql: Optional[str] = None,
         validate_query: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        *,
+        concurrent: bool = False,
     ) -> List[Document]:
         """
         Retrieves issues from a board.
@@ -160,10 +480,11 @@ class BoardManager(JiraClient):
         Args:
             board_id: ID of the board
             start_at: Index of first item to return (for pagination)
-            max_results: Maximum number of items to return (for pagination)
+            max_results: Maximum number of items to return (for pagination, defaults to JIRA_BOARD_PAGE_SIZE)
             jql: JQL query to filter issues
             validate_query: Validation mode for JQL query (strict, warn, none)
-            fields: List of fields to include in the response
+            fields: List of fields to include in the response (defaults to DEFAULT_ISSUE_FIELDS)
+            concurrent: If true, fetch all pages from start_at concurrently instead of a single page
             
         Returns:
             List of Document objects representing issues
@@ -174,69 +495,116 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}/issue"
+            url = f"{_BOARD_URL}/{board_id}/issue"
             
             params = {
                 "startAt": start_at,
-                "maxResults": max_results
+                "maxResults": self._page_size(max_results),
+                **_optional_params(
+                    ("jql", jql),
+                    ("validateQuery", validate_query),
+                    ("fields", ",".join(fields or self.DEFAULT_ISSUE_FIELDS)),
+                ),
             }
-            
-            if jql:
-                params["jql"] = jql
-            if validate_query:
-                params["validateQuery"] = validate_query
-            if fields:
-                params["fields"] = ",".join(fields)
-                
-            response = self.jira.get(url, params=params)
-            issues = response.get("issues", [])
-            
-            documents = []
-            for issue in issues:
-                issue_key = issue.get("key", "")
-                summary = issue.get("fields", {}).get("summary", "")
-                issue_type = issue.get("fields", {}).get("issuetype", {}).get("name", "")
-                status = issue.get("fields", {}).get("status", {}).get("name", "")
-                
-                # Extract description - handle potential missing fields
-                description = ""
-                if "description" in issue.get("fields", {}):
-                    if issue["fields"]["description"]:
-                        if isinstance(issue["fields"]["description"], str):
-                            description = issue["fields"]["description"]
-                        elif isinstance(issue["fields"]["description"], dict):
-                            # Handle Jira Cloud's Atlassian Document Format
-                            content_items = issue["fields"]["description"].get("content", [])
-                            for item in content_items:
-                                if item.get("type") == "paragraph" and "content" in item:
-                                    for text_item in item["content"]:
-                                        if text_item.get("type") == "text":
-                                            description += text_item.get("text", "")
-                
-                # Construct content
-                content = f"{summary}\n\n{description}" if description else summary
-                
-                # Add metadata
-                metadata = {
-                    "key": issue_key,
-                    "summary": summary,
-                    "type": issue_type,
-                    "status": status,
-                    "url": f"{self.config.url}/browse/{issue_key}"
-                }
                 
-                documents.append(Document(page_content=content, metadata=metadata))
-                
-            return documents
+            if concurrent:
+                issues = self._get_all_pages(url, params)
+            else:
+                response = self._rate_limited_get(url, params=params)
+                issues = response.get("issues", [])
+
+            return [self._issue_to_document(issue) for issue in issues]
         except Exception as e:
-            logger.error(f"Error retrieving issues for board {board_id}: {str(e)}")
-            self._handle_error(e, "board issues", str(board_id))
+            logger.error("Error retrieving issues for board %s: %s", board_id, e)
+            self.client._handle_error(e, "board issues", str(board_id))
+
+    def iter_board_issues(
+        self,
+        board_id: int,
+        start_at: int = 0,
+        page_size: Optional[int] = None,
+        jql: Optional[str] = None,
+        validate_query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[Document]:
+        """
+        Iterates over all issues of a board, one page at a time.
+
+        Unlike get_board_issues, issues are yielded as each page arrives, so
+        the whole board never has to be held in memory.
+
+        Args:
+            board_id: ID of the board
+            start_at: Index of first item to return
+            page_size: Number of issues requested per page (defaults to JIRA_BOARD_PAGE_SIZE)
+            jql: JQL query to filter issues
+            validate_query: Validation mode for JQL query (strict, warn, none)
+            fields: List of fields to include in the response (defaults to DEFAULT_ISSUE_FIELDS)
+
+        Yields:
+            Document objects representing issues
+
+        Raises:
+            JiraResourceNotFoundError: If the board is not found
+            JiraPermissionError: If the user lacks permission
+            JiraAPIError: For other API errors
+        """
+        page_size = self._page_size(page_size)
+        try:
+            url = f"{_BOARD_URL}/{board_id}/issue"
+
+            params = {
+                "maxResults": page_size,
+                **_optional_params(
+                    ("jql", jql),
+                    ("validateQuery", validate_query),
+                    ("fields", ",".join(fields or self.DEFAULT_ISSUE_FIELDS)),
+                ),
+            }
+
+            start = start_at
+            while True:
+                response = self._rate_limited_get(url, params={"startAt": start, **params})
+                issues = response.get("issues", [])
+                for issue in issues:
+                    yield self._issue_to_document(issue)
+
+                start += len(issues)
+                total = response.get("total")
+                if not issues or (start >= total if total is not None else len(issues) < page_size):
+                    return
+        except Exception as e:
+            logger.error("Error retrieving issues for board %s: %s", board_id, e)
+            self.client._handle_error(e, "board issues", str(board_id))
+
+    def get_boards_issues(self, board_ids: List[int], **kwargs: Any) -> Dict[int, List[Document]]:
+        """
+        Retrieves issues from several boards concurrently.
+
+        Args:
+            board_ids: IDs of the boards
+            **kwargs: Arguments passed to get_board_issues for every board
+
+        Returns:
+            Dictionary mapping each board ID to its list of issue Documents
 
+        Raises:
+            JiraResourceNotFoundError: If a board is not found
+            JiraPermissionError: If the user lacks permission
+            JiraAPIError: For other API errors
+        """
+        if not board_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_BOARDS, len(board_ids))) as executor:
+            return dict(executor.map(lambda bid: (bid, self.get_board_issues(bid, **kwargs)), board_ids))
+
+    @_swr_cached
     def get_board_epics(
         self,
         board_id: int,
         start_at: int = 0,
-        max_results: int = 50,
+        max_results: Optional[int] = None,
         done: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
         """
@@ -245,7 +613,7 @@ class BoardManager(JiraClient):
         Args:
             board_id: ID of the board
             start_at: Index of first item to return (for pagination)
-            max_results: Maximum number of items to return (for pagination)
+            max_results: Maximum number of items to return (for pagination, defaults to JIRA_BOARD_PAGE_SIZE)
             done: If true, will return only done epics, if false only not done epics
             
         Returns:
@@ -257,30 +625,31 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}/epic"
+            url = f"{_BOARD_URL}/{board_id}/epic"
             
             params = {
                 "startAt": start_at,
-                "maxResults": max_results
+                "maxResults": self._page_size(max_results),
+                **_optional_params(("done", str(done).lower() if done is not None else None)),
             }
-            
-            if done is not None:
-                params["done"] = str(done).lower()
                 
-            response = self.jira.get(url, params=params)
+            response = self._rate_limited_get(url, params=params)
             return response.get("values", [])
         except Exception as e:
-            logger.error(f"Error retrieving epics for board {board_id}: {str(e)}")
-            self._handle_error(e, "board epics", str(board_id))
+            logger.error("Error retrieving epics for board %s: %s", board_id, e)
+            self.client._handle_error(e, "board epics", str(board_id))
 
+    @_swr_cached
     def get_board_backlog_issues(
         self,
         board_id: int,
         start_at: int = 0,
-        max_results: int = 50,
+        max_results: Optional[int] = None,
         jql: Optional[str] = None,
         validate_query: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        *,
+        concurrent: bool = False,
     ) -> List[Document]:
         """
         Retrieves issues from a board's backlog.
@@ -288,10 +657,11 @@ class BoardManager(JiraClient):
         Args:
             board_id: ID of the board
             start_at: Index of first item to return (for pagination)
-            max_results: Maximum number of items to return (for pagination)
+            max_results: Maximum number of items to return (for pagination, defaults to JIRA_BOARD_PAGE_SIZE)
             jql: JQL query to filter issues
             validate_query: Validation mode for JQL query (strict, warn, none)
-            fields: List of fields to include in the response
+            fields: List of fields to include in the response (defaults to DEFAULT_ISSUE_FIELDS)
+            concurrent: If true, fetch all pages from start_at concurrently instead of a single page
             
         Returns:
             List of Document objects representing issues
@@ -302,70 +672,35 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}/backlog"
+            url = f"{_BOARD_URL}/{board_id}/backlog"
             
             params = {
                 "startAt": start_at,
-                "maxResults": max_results
+                "maxResults": self._page_size(max_results),
+                **_optional_params(
+                    ("jql", jql),
+                    ("validateQuery", validate_query),
+                    ("fields", ",".join(fields or self.DEFAULT_ISSUE_FIELDS)),
+                ),
             }
-            
-            if jql:
-                params["jql"] = jql
-            if validate_query:
-                params["validateQuery"] = validate_query
-            if fields:
-                params["fields"] = ",".join(fields)
                 
-            response = self.jira.get(url, params=params)
-            issues = response.get("issues", [])
-            
-            documents = []
-            for issue in issues:
-                issue_key = issue.get("key", "")
-                summary = issue.get("fields", {}).get("summary", "")
-                issue_type = issue.get("fields", {}).get("issuetype", {}).get("name", "")
-                status = issue.get("fields", {}).get("status", {}).get("name", "")
-                
-                # Extract description - handle potential missing fields
-                description = ""
-                if "description" in issue.get("fields", {}):
-                    if issue["fields"]["description"]:
-                        if isinstance(issue["fields"]["description"], str):
-                            description = issue["fields"]["description"]
-                        elif isinstance(issue["fields"]["description"], dict):
-                            # Handle Jira Cloud's Atlassian Document Format
-                            content_items = issue["fields"]["description"].get("content", [])
-                            for item in content_items:
-                                if item.get("type") == "paragraph" and "content" in item:
-                                    for text_item in item["content"]:
-                                        if text_item.get("type") == "text":
-                                            description += text_item.get("text", "")
-                
-                # Construct content
-                content = f"{summary}\n\n{description}" if description else summary
-                
-                # Add metadata
-                metadata = {
-                    "key": issue_key,
-                    "summary": summary,
-                    "type": issue_type,
-                    "status": status,
-                    "url": f"{self.config.url}/browse/{issue_key}",
-                    "source": "backlog"
-                }
-                
-                documents.append(Document(page_content=content, metadata=metadata))
-                
-            return documents
+            if concurrent:
+                issues = self._get_all_pages(url, params)
+            else:
+                response = self._rate_limited_get(url, params=params)
+                issues = response.get("issues", [])
+
+            return [self._issue_to_document(issue, source="backlog") for issue in issues]
         except Exception as e:
-            logger.error(f"Error retrieving backlog issues for board {board_id}: {str(e)}")
-            self._handle_error(e, "board backlog", str(board_id))
+            logger.error("Error retrieving backlog issues for board %s: %s", board_id, e)
+            self.client._handle_error(e, "board backlog", str(board_id))
 
+    @_swr_cached
     def get_board_sprints(
         self,
         board_id: int,
         start_at: int = 0,
-        max_results: int = 50,
+        max_results: Optional[int] = None,
         state: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
@@ -374,7 +709,7 @@ class BoardManager(JiraClient):
         Args:
             board_id: ID of the board
             start_at: Index of first item to return (for pagination)
-            max_results: Maximum number of items to return (for pagination)
+            max_results: Maximum number of items to return (for pagination, defaults to JIRA_BOARD_PAGE_SIZE)
             state: State of sprints to filter ('future', 'active', 'closed')
             
         Returns:
@@ -386,28 +721,53 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}/sprint"
+            url = f"{_BOARD_URL}/{board_id}/sprint"
             
             params = {
                 "startAt": start_at,
-                "maxResults": max_results
+                "maxResults": self._page_size(max_results),
+                **_optional_params(("state", state)),
             }
-            
-            if state:
-                params["state"] = state
                 
-            response = self.jira.get(url, params=params)
+            response = self._rate_limited_get(url, params=params)
             return response.get("values", [])
         except Exception as e:
-            logger.error(f"Error retrieving sprints for board {board_id}: {str(e)}")
-            self._handle_error(e, "board sprints", str(board_id))
+            logger.error("Error retrieving sprints for board %s: %s", board_id, e)
+            self.client._handle_error(e, "board sprints", str(board_id))
+
+    def get_board_bundle(self, board_id: int) -> Dict[str, Any]:
+        """
+        Retrieves everything needed to open a board with concurrent requests.
+
+        Args:
+            board_id: ID of the board
+
+        Returns:
+            Dictionary with the board details ("board"), its configuration ("config"),
+            its active sprints ("sprints") and its epics that are not done ("epics")
+
+        Raises:
+            JiraResourceNotFoundError: If the board is not found
+            JiraPermissionError: If the user lacks permission
+            JiraAPIError: For other API errors
+        """
+        fetchers = {
+            "board": lambda: self.get_board(board_id),
+            "config": lambda: self.get_board_configuration(board_id),
+            "sprints": lambda: self.get_board_sprints(board_id, state="active"),
+            "epics": lambda: self.get_board_epics(board_id, done=False),
+        }
+
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = {key: executor.submit(fetch) for key, fetch in fetchers.items()}
+            return {key: future.result() for key, future in futures.items()}
 
     def get_board_sprint_issues(
         self,
         board_id: int,
         sprint_id: int,
         start_at: int = 0,
-        max_results: int = 50,
+        max_results: Optional[int] = None,
         jql: Optional[str] = None,
         validate_query: Optional[str] = None,
         fields: Optional[List[str]] = None,
@@ -419,10 +779,10 @@ class BoardManager(JiraClient):
             board_id: ID of the board
             sprint_id: ID of the sprint
             start_at: Index of first item to return (for pagination)
-            max_results: Maximum number of items to return (for pagination)
+            max_results: Maximum number of items to return (for pagination, defaults to JIRA_BOARD_PAGE_SIZE)
             jql: JQL query to filter issues
             validate_query: Validation mode for JQL query (strict, warn, none)
-            fields: List of fields to include in the response
+            fields: List of fields to include in the response (defaults to DEFAULT_ISSUE_FIELDS)
             
         Returns:
             List of Document objects representing issues
@@ -433,65 +793,25 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}/sprint/{sprint_id}/issue"
+            url = f"{_BOARD_URL}/{board_id}/sprint/{sprint_id}/issue"
             
             params = {
                 "startAt": start_at,
-                "maxResults": max_results
+                "maxResults": self._page_size(max_results),
+                **_optional_params(
+                    ("jql", jql),
+                    ("validateQuery", validate_query),
+                    ("fields", ",".join(fields or self.DEFAULT_ISSUE_FIELDS)),
+                ),
             }
-            
-            if jql:
-                params["jql"] = jql
-            if validate_query:
-                params["validateQuery"] = validate_query
-            if fields:
-                params["fields"] = ",".join(fields)
                 
-            response = self.jira.get(url, params=params)
+            response = self._rate_limited_get(url, params=params)
             issues = response.get("issues", [])
-            
-            documents = []
-            for issue in issues:
-                issue_key = issue.get("key", "")
-                summary = issue.get("fields", {}).get("summary", "")
-                issue_type = issue.get("fields", {}).get("issuetype", {}).get("name", "")
-                status = issue.get("fields", {}).get("status", {}).get("name", "")
-                
-                # Extract description - handle potential missing fields
-                description = ""
-                if "description" in issue.get("fields", {}):
-                    if issue["fields"]["description"]:
-                        if isinstance(issue["fields"]["description"], str):
-                            description = issue["fields"]["description"]
-                        elif isinstance(issue["fields"]["description"], dict):
-                            # Handle Jira Cloud's Atlassian Document Format
-                            content_items = issue["fields"]["description"].get("content", [])
-                            for item in content_items:
-                                if item.get("type") == "paragraph" and "content" in item:
-                                    for text_item in item["content"]:
-                                        if text_item.get("type") == "text":
-                                            description += text_item.get("text", "")
-                
-                # Construct content
-                content = f"{summary}\n\n{description}" if description else summary
-                
-                # Add metadata
-                metadata = {
-                    "key": issue_key,
-                    "summary": summary,
-                    "type": issue_type,
-                    "status": status,
-                    "url": f"{self.config.url}/browse/{issue_key}",
-                    "source": "sprint",
-                    "sprint_id": sprint_id
-                }
-                
-                documents.append(Document(page_content=content, metadata=metadata))
-                
-            return documents
+
+            return [self._issue_to_document(issue, source="sprint", sprint_id=sprint_id) for issue in issues]
         except Exception as e:
-            logger.error(f"Error retrieving sprint issues for board {board_id}, sprint {sprint_id}: {str(e)}")
-            self._handle_error(e, "board sprint issues", f"{board_id}/{sprint_id}")
+            logger.error("Error retrieving sprint issues for board %s, sprint %s: %s", board_id, sprint_id, e)
+            self.client._handle_error(e, "board sprint issues", f"{board_id}/{sprint_id}")
             
     def create_board(
         self,
@@ -518,7 +838,7 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board"
+            url = _BOARD_URL
             
             data = {
                 "name": name,
@@ -534,8 +854,8 @@ class BoardManager(JiraClient):
                 
             return self.jira.post(url, json=data)
         except Exception as e:
-            logger.error(f"Error creating board '{name}': {str(e)}")
-            self._handle_error(e, "create board")
+            logger.error("Error creating board '%s': %s", name, e)
+            self.client._handle_error(e, "create board")
             
     def update_board(
         self,
@@ -561,7 +881,7 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}"
+            url = f"{_BOARD_URL}/{board_id}"
             
             data = {}
             if name is not None:
@@ -572,10 +892,12 @@ class BoardManager(JiraClient):
             if not data:  # No changes specified
                 return self.get_board(board_id)
                 
-            return self.jira.put(url, json=data)
+            updated_board = self.jira.put(url, json=data)
+            self.invalidate_board(board_id)
+            return updated_board
         except Exception as e:
-            logger.error(f"Error updating board {board_id}: {str(e)}")
-            self._handle_error(e, "update board", str(board_id))
+            logger.error("Error updating board %s: %s", board_id, e)
+            self.client._handle_error(e, "update board", str(board_id))
             
     def delete_board(
         self,
@@ -596,12 +918,13 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}"
+            url = f"{_BOARD_URL}/{board_id}"
             self.jira.delete(url)
+            self.invalidate_board(board_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting board {board_id}: {str(e)}")
-            self._handle_error(e, "delete board", str(board_id))
+            logger.error("Error deleting board %s: %s", board_id, e)
+            self.client._handle_error(e, "delete board", str(board_id))
             
     def get_board_quick_filters(
         self,
@@ -622,12 +945,12 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}/quickfilter"
-            response = self.jira.get(url)
+            url = f"{_BOARD_URL}/{board_id}/quickfilter"
+            response = self._rate_limited_get(url)
             return response.get("values", [])
         except Exception as e:
-            logger.error(f"Error retrieving quick filters for board {board_id}: {str(e)}")
-            self._handle_error(e, "board quick filters", str(board_id))
+            logger.error("Error retrieving quick filters for board %s: %s", board_id, e)
+            self.client._handle_error(e, "board quick filters", str(board_id))
             
     def get_board_columns(
         self,
@@ -648,9 +971,9 @@ class BoardManager(JiraClient):
             JiraAPIError: For other API errors
         """
         try:
-            url = f"{self._agile_path}/board/{board_id}/configuration"
-            response = self.jira.get(url)
+            url = f"{_BOARD_URL}/{board_id}/configuration"
+            response = self._rate_limited_get(url)
             return response.get("columnConfig", {}).get("columns", [])
         except Exception as e:
-            logger.error(f"Error retrieving columns for board {board_id}: {str(e)}")
-            self._handle_error(e, "board columns", str(board_id))
+            logger.error("Error retrieving columns for board %s: %s", board_id, e)
+            self.client._handle_error(e, "board columns", str(board_id))
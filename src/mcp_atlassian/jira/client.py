@@ -2,23 +2,226 @@
 Base Jira API client implementation.
 """
 
-import os
+import functools
+import hashlib
+import json
 import logging
-from typing import Any, Optional, Dict, List, Union
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
 from atlassian import Jira
+from requests import HTTPError, Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .._env import JIRA_ENV_VARS
 from ..config import JiraConfig
 from .exceptions import (
     JiraAPIError,
     JiraAuthenticationError,
+    JiraConfigurationError,
     JiraPermissionError,
     JiraResourceNotFoundError,
-    JiraConfigurationError,
 )
 
+# orjson is optional (mcp-atlassian[fast-json]), requests decodes JSON without it
+try:
+    from orjson import loads as _fast_json_loads
+except ImportError:
+    _fast_json_loads = None
+
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
+# Connections kept alive per host, enough for the concurrent pagination paths
+HTTP_POOL_SIZE = 64
+
+# Responses Jira sends while briefly unavailable are retried this many times, waiting for
+# Retry-After when given and backing off exponentially otherwise. Only idempotent methods
+# are retried, so a create is never sent twice. Rate-limited (429) responses are left to
+# the callers' rate limiting, which also paces the requests that follow.
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF_SECONDS = 1.0
+HTTP_RETRY_STATUSES = frozenset({502, 503, 504})
+
+# Retries and base backoff for rate-limited (HTTP 429) requests retried outside the session,
+# plus up to this fraction of random extra delay so waiting clients do not retry in lockstep
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+RATE_LIMIT_JITTER = 0.2
+
+
+def _http_retry() -> Retry:
+    """
+    Build the retry policy of the session's transport adapters.
+
+    The last response is passed on when retries run out, so errors are reported
+    as without retries.
+
+    Returns:
+        urllib3 retry policy
+    """
+    return Retry(
+        total=HTTP_RETRIES,
+        connect=0,
+        read=False,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        backoff_factor=HTTP_RETRY_BACKOFF_SECONDS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _header_float(headers: Any, name: str) -> Optional[float]:
+    """Read a numeric response header, returning None if missing or invalid."""
+    value = headers.get(name) if headers is not None else None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limit_interval(headers: Any) -> float:
+    """
+    Compute the delay requested by Jira rate-limit headers.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait before the next request, 0 if no throttling is needed
+    """
+    retry_after = _header_float(headers, "Retry-After") or 0.0
+    remaining = _header_float(headers, "X-RateLimit-Remaining")
+    interval = _header_float(headers, "X-RateLimit-Interval-Seconds")
+    fill_rate = _header_float(headers, "X-RateLimit-FillRate")
+
+    # Only pace requests once the token bucket is (nearly) empty
+    spacing = 0.0
+    if interval and fill_rate and (remaining is None or remaining < 1):
+        spacing = interval / fill_rate
+
+    return max(retry_after, spacing)
+
+
+def _env_int(env: Dict[str, Optional[str]], name: str, default: int) -> int:
+    """Parse an integer setting, keeping the default when it is unset or invalid."""
+    value = env.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r, using %s", name, value, default)
+        return default
+
+
+@functools.lru_cache(maxsize=1)
+def _env_config_settings(env_values: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+    """
+    Parse Jira settings from environment variable values.
+
+    Results are memoised on the values themselves, so changing the environment
+    is picked up on the next call.
+
+    Args:
+        env_values: Values of JIRA_ENV_VARS, in order, None for unset variables
+
+    Returns:
+        Keyword arguments for JiraConfig
+    """
+    env = dict(zip(JIRA_ENV_VARS, env_values, strict=True))
+    return {
+        "url": env["JIRA_URL"],
+        "username": env["JIRA_USERNAME"] or "",
+        "api_token": env["JIRA_API_TOKEN"] or "",
+        "personal_token": env["JIRA_PERSONAL_TOKEN"] or "",
+        "verify_ssl": (env["JIRA_SSL_VERIFY"] or "true").lower() != "false",
+        "http2": (env["JIRA_HTTP2"] or "false").lower() == "true",
+        "board_page_size": _env_int(env, "JIRA_BOARD_PAGE_SIZE", JiraConfig.board_page_size),
+        "field_cache_ttl": _env_int(env, "JIRA_FIELD_CACHE_TTL", JiraConfig.field_cache_ttl),
+        "field_cache_max_reads": _env_int(env, "JIRA_FIELD_CACHE_READS", JiraConfig.field_cache_max_reads),
+        "trust_responses": (env["JIRA_TRUST_RESPONSES"] or "false").lower() in ("true", "1", "yes"),
+    }
+
+
+def invalidate_env_cache() -> None:
+    """Forget Jira settings parsed from the environment."""
+    _env_config_settings.cache_clear()
+
+
+def _fast_json(response: Response, **kwargs: Any) -> Any:
+    """Decode a response body with orjson, deferring to requests for anything unusual."""
+    if not kwargs:
+        try:
+            return _fast_json_loads(response.content)
+        except ValueError:
+            pass
+    return Response.json(response, **kwargs)
+
+
+def _use_fast_json(response: Response, *args: Any, **kwargs: Any) -> None:
+    """Response hook making response.json() decode with orjson."""
+    response.json = functools.partial(_fast_json, response)
+
+
+# Exceptions raised for HTTP status codes
+_STATUS_ERRORS = {
+    401: JiraAuthenticationError,
+    403: JiraPermissionError,
+    404: JiraResourceNotFoundError,
+}
+
+# Exceptions raised for error messages without a known status code, checked in order
+_MESSAGE_ERRORS = (
+    (re.compile(r"authentication|unauthorized", re.IGNORECASE), JiraAuthenticationError),
+    (re.compile(r"permission|access", re.IGNORECASE), JiraPermissionError),
+    (re.compile(r"not found|does not exist", re.IGNORECASE), JiraResourceNotFoundError),
+)
+
+# Message template for each exception raised by _handle_error
+_ERROR_MESSAGES = {
+    JiraAuthenticationError: "Authentication failed for {resource_type}: {error}",
+    JiraPermissionError: "Permission denied for {resource_type} {resource_id}: {error}",
+    JiraResourceNotFoundError: "{resource_title} {resource_id} not found: {error}",
+    JiraAPIError: "Error accessing {resource_type} {resource_id}: {error}",
+}
+
+# Rules identifying well-known fields, checked in order:
+# (key, label, exact lowercase names, lowercase name substrings, schema custom type)
+_FIELD_RULES = (
+    ("epic_link", "Epic Link", frozenset({"epic link"}), ("epic link", "epic-link"),
+     "com.pyxis.greenhopper.jira:gh-epic-link"),
+    ("epic_name", "Epic Name", frozenset({"epic name"}), ("epic name", "epic-name"),
+     "com.pyxis.greenhopper.jira:gh-epic-label"),
+    ("parent", "Parent", frozenset({"parent", "parent link"}), (), ""),
+    ("epic_status", "Epic Status", frozenset({"epic status"}), ("epic status",), ""),
+    ("epic_color", "Epic Color", frozenset({"epic colour", "epic color"}), ("epic colour", "epic color"),
+     "com.pyxis.greenhopper.jira:gh-epic-color"),
+    ("priority", "Priority", frozenset({"priority"}), (), ""),
+    ("sprint", "Sprint", frozenset({"sprint"}), ("sprint",), "com.pyxis.greenhopper.jira:gh-sprint"),
+    ("story_points", "Story Points", frozenset({"story points"}), ("story point", "storypoints"), ""),
+)
+
+# Exact field names resolved with a single lookup
+_FIELD_NAME_INDEX = {name: rule for rule in _FIELD_RULES for name in rule[2]}
+
+# Shared read-only stand-in for fields that have no schema
+_EMPTY_SCHEMA: Mapping[str, Any] = MappingProxyType({})
+
+# Every rule substring in one pattern, so most field names are rejected in a single scan
+_FIELD_SUBSTRING_PATTERN = re.compile("|".join(re.escape(part) for rule in _FIELD_RULES for part in rule[3]))
+
+# Schema custom types resolved with a single lookup when no substring matches
+_FIELD_CUSTOM_INDEX = {rule[4]: rule for rule in reversed(_FIELD_RULES) if rule[4]}
+
 
 class JiraClient:
     """Base class for Jira API client."""
@@ -37,6 +240,16 @@ class JiraClient:
         self.config = config
         self._init_client()
 
+    @property
+    def client(self) -> "JiraClient":
+        """
+        The JiraClient used for API calls.
+
+        Managers that subclass JiraClient are their own client, this lets all
+        managers be wired together through the same ``client`` attribute.
+        """
+        return self
+
     def _create_config_from_env(self) -> JiraConfig:
         """
         Create Jira configuration from environment variables.
@@ -47,22 +260,12 @@ class JiraClient:
         Raises:
             JiraConfigurationError: If required environment variables are missing.
         """
-        url = os.getenv("JIRA_URL")
-        username = os.getenv("JIRA_USERNAME", "")
-        token = os.getenv("JIRA_API_TOKEN", "")
-        personal_token = os.getenv("JIRA_PERSONAL_TOKEN", "")
-        verify_ssl = os.getenv("JIRA_SSL_VERIFY", "true").lower() != "false"
+        settings = _env_config_settings(tuple(os.environ.get(name) for name in JIRA_ENV_VARS))
 
-        if not url:
+        if not settings["url"]:
             raise JiraConfigurationError("Missing required JIRA_URL environment variable")
 
-        return JiraConfig(
-            url=url,
-            username=username,
-            api_token=token,
-            personal_token=personal_token,
-            verify_ssl=verify_ssl,
-        )
+        return JiraConfig(**settings)
 
     def _init_client(self) -> None:
         """
@@ -71,10 +274,8 @@ class JiraClient:
         Raises:
             JiraConfigurationError: If authentication information is missing.
         """
-        is_cloud = "atlassian.net" in self.config.url
-
         try:
-            if is_cloud:
+            if self.config.is_cloud:
                 if not self.config.username or not self.config.api_token:
                     raise JiraConfigurationError(
                         "Cloud authentication requires JIRA_USERNAME and JIRA_API_TOKEN"
@@ -100,13 +301,106 @@ class JiraClient:
                     verify_ssl=self.config.verify_ssl,
                 )
 
+            # Share one larger keep-alive pool between all managers using this client
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=_http_retry(),
+            )
+            self.jira._session.mount("http://", adapter)
+            self.jira._session.mount("https://", adapter)
+            if self.config.http2:
+                self._mount_http2_adapter()
+
+            # atlassian-python-api decodes every body with response.json()
+            if _fast_json_loads is not None:
+                self.jira._session.hooks["response"].append(_use_fast_json)
+
+            # Earliest time (time.monotonic) at which the next request may be sent, shared
+            # by every manager using this client
+            self._next_allowed_ts = 0.0
+            self._rate_limit_lock = threading.Lock()
+            self.jira._session.hooks["response"].append(self._record_rate_limit)
+
             # Initialize field IDs cache
             self._field_ids_cache: Dict[str, str] = {}
+            self._field_ids_expires_at = 0.0
+            self._field_ids_reads_left = 0
+            # Time (time.time) the leased field IDs were queried from Jira, and whether
+            # they were rediscovered for a missing field since
+            self._field_ids_saved_at = 0.0
+            self._field_ids_rediscovered = False
+            self._field_ids_lock = threading.Lock()
+
+            # Account ID of the authenticated user, fetched on first use
+            self._account_id: Optional[str] = None
 
         except Exception as e:
-            logger.error(f"Error initializing Jira client: {str(e)}")
+            logger.error("Error initializing Jira client: %s", e)
             raise JiraConfigurationError(f"Failed to initialize Jira client: {str(e)}")
 
+    def _mount_http2_adapter(self) -> None:
+        """Send HTTPS requests over HTTP/2, keeping the HTTP/1.1 pool if h2 is not installed."""
+        from .transport import HTTP2Adapter
+
+        try:
+            adapter = HTTP2Adapter(
+                verify=self.config.verify_ssl,
+                max_connections=HTTP_POOL_SIZE,
+                max_retries=_http_retry(),
+            )
+        except ImportError as e:
+            logger.warning("HTTP/2 requested but unavailable (install mcp-atlassian[http2]): %s", e)
+            return
+        self.jira._session.mount("https://", adapter)
+
+    def _record_rate_limit(self, response: Any, *args: Any, **kwargs: Any) -> None:
+        """Response hook that defers further requests as requested by rate-limit headers."""
+        self._defer_requests(_rate_limit_interval(response.headers))
+
+    def _defer_requests(self, delay: float) -> None:
+        """Prevent any request from being sent for the next delay seconds."""
+        if delay <= 0:
+            return
+        with self._rate_limit_lock:
+            self._next_allowed_ts = max(self._next_allowed_ts, time.monotonic() + delay)
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until the rate limiter allows the next request."""
+        with self._rate_limit_lock:
+            wait = self._next_allowed_ts - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+    def _retry_rate_limited(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a Jira API method, retrying it while Jira answers with status 429.
+
+        The session only retries idempotent requests. Jira rejects rate-limited
+        requests without processing them, so POSTs such as transitions, comments
+        and worklogs are safe to send again. Retry-After is treated as the minimum
+        wait, including when it is 0.
+
+        Args:
+            func: Method of self.jira to call
+            *args: Positional arguments passed on to func
+            **kwargs: Keyword arguments passed on to func
+
+        Returns:
+            The result of func
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                return func(*args, **kwargs)
+            except HTTPError as e:
+                response = e.response
+                if response is None or response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                delay = max(_rate_limit_interval(response.headers), RATE_LIMIT_BACKOFF_SECONDS * 2**attempt)
+                delay *= 1 + random.uniform(0, RATE_LIMIT_JITTER)
+                logger.warning("Rate limited by Jira, retrying in %.1fs", delay)
+                time.sleep(delay)
+
     def _handle_error(self, e: Exception, resource_type: str, resource_id: str = "") -> None:
         """
         Handle API errors and raise appropriate exceptions.
@@ -126,172 +420,268 @@ class JiraClient:
         status_code = getattr(e, "status_code", None)
         response = getattr(e, "response", None)
 
-        if hasattr(e, "status_code"):
-            if status_code == 401:
-                raise JiraAuthenticationError(
-                    f"Authentication failed for {resource_type}: {error_message}",
-                    status_code=status_code,
-                    response=response,
-                )
-            elif status_code == 403:
-                raise JiraPermissionError(
-                    f"Permission denied for {resource_type} {resource_id}: {error_message}",
-                    status_code=status_code,
-                    response=response,
-                )
-            elif status_code == 404:
-                raise JiraResourceNotFoundError(
-                    f"{resource_type.capitalize()} {resource_id} not found: {error_message}",
-                    status_code=status_code,
-                    response=response,
-                )
-
-        # Default error handling
-        if "authentication" in error_message.lower() or "unauthorized" in error_message.lower():
-            raise JiraAuthenticationError(
-                f"Authentication failed for {resource_type}: {error_message}",
-                status_code=status_code,
-                response=response,
-            )
-        elif "permission" in error_message.lower() or "access" in error_message.lower():
-            raise JiraPermissionError(
-                f"Permission denied for {resource_type} {resource_id}: {error_message}",
-                status_code=status_code,
-                response=response,
-            )
-        elif "not found" in error_message.lower() or "does not exist" in error_message.lower():
-            raise JiraResourceNotFoundError(
-                f"{resource_type.capitalize()} {resource_id} not found: {error_message}",
-                status_code=status_code,
-                response=response,
-            )
-        else:
-            raise JiraAPIError(
-                f"Error accessing {resource_type} {resource_id}: {error_message}",
-                status_code=status_code,
-                response=response,
+        # Prefer the HTTP status, then look for well-known phrases in the message
+        exc_class = _STATUS_ERRORS.get(status_code)
+        if exc_class is None:
+            exc_class = next(
+                (exc_class for pattern, exc_class in _MESSAGE_ERRORS if pattern.search(error_message)),
+                JiraAPIError,
             )
 
+        message = _ERROR_MESSAGES[exc_class].format(
+            resource_type=resource_type,
+            resource_title=resource_type.capitalize(),
+            resource_id=resource_id,
+            error=error_message,
+        )
+        raise exc_class(message, status_code=status_code, response=response) from e
+
+    def _field_cache_path(self) -> Path:
+        """
+        Get the path of the on-disk field ID cache for this Jira instance.
+
+        Returns:
+            Path under XDG_CACHE_HOME (default ~/.cache) named after a hash of the Jira URL
+        """
+        cache_home = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+        url_hash = hashlib.sha1(self.config.url.encode(), usedforsecurity=False).hexdigest()
+        return cache_home / "mcp-atlassian" / f"fields-{url_hash}.json"
+
+    def _load_field_cache(self) -> Optional[Tuple[Dict[str, str], float]]:
+        """
+        Load field IDs saved by a previous process.
+
+        Returns:
+            Field IDs and the time (time.time) they were saved, or None if the cache is
+            disabled, missing, unreadable or expired
+        """
+        if self.config.field_cache_ttl <= 0:
+            return None
+        try:
+            payload = json.loads(self._field_cache_path().read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("ts", 0) <= time.time() - self.config.field_cache_ttl:
+            return None
+        if not payload.get("ids"):
+            return None
+        return payload["ids"], payload["ts"]
+
+    def _lease_field_ids(
+        self, field_ids: Dict[str, str], saved_at: float, *, rediscovered: bool = False
+    ) -> None:
+        """
+        Keep field IDs in memory until their TTL or read budget runs out.
+
+        Args:
+            field_ids: Field IDs to cache
+            saved_at: Time (time.time) the field IDs were discovered
+            rediscovered: Whether the field IDs replace a lease missing a requested field
+        """
+        self._field_ids_cache = field_ids
+        self._field_ids_saved_at = saved_at
+        self._field_ids_rediscovered = rediscovered
+        self._field_ids_expires_at = time.monotonic() + saved_at + self.config.field_cache_ttl - time.time()
+        self._field_ids_reads_left = self.config.field_cache_max_reads
+
+    def _save_field_cache(self, field_ids: Dict[str, str]) -> None:
+        """
+        Save field IDs for later processes, replacing the cache file atomically.
+
+        Args:
+            field_ids: Field IDs to save
+        """
+        if self.config.field_cache_ttl <= 0:
+            return
+        path = self._field_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"ts": time.time(), "url": self.config.url, "ids": field_ids}, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("Could not write Jira field cache %s: %s", path, e)
+
+    def refresh_field_cache(self) -> None:
+        """Forget cached field IDs, so the next get_jira_field_ids call queries Jira."""
+        # Replaced rather than cleared, callers may still hold the old dict
+        self._field_ids_cache = {}
+        self._field_ids_expires_at = 0.0
+        self._field_ids_reads_left = 0
+        try:
+            self._field_cache_path().unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not remove the field ID cache file: %s", e)
+
     def get_jira_field_ids(self) -> Dict[str, str]:
         """
         Discover Jira field IDs dynamically.
 
         This method queries the Jira API to find the correct custom field IDs
         for various fields, which can vary between different Jira instances.
+        It is the only place that fills ``_field_ids_cache``; all managers share
+        the client and therefore the cache.
 
         Returns:
             Dictionary mapping field names to their IDs.
         """
         try:
-            # Check if we've already cached the field IDs
-            if self._field_ids_cache:
-                return self._field_ids_cache
+            field_ids = self._leased_field_ids()
+            if field_ids is not None:
+                return field_ids
 
-            # Fetch all fields from Jira API
-            fields = self.jira.fields()
-            field_ids = {}
-
-            # Log the complete list of fields for debugging
-            all_field_names = [f"{field.get('name', '')} ({field.get('id', '')})" for field in fields]
-            logger.debug(f"All available Jira fields: {all_field_names}")
-
-            # Look for fields - use multiple strategies to identify them
-            for field in fields:
-                field_name = field.get("name", "").lower()
-                original_name = field.get("name", "")
-                field_id = field.get("id", "")
-                field_schema = field.get("schema", {})
-                field_type = field_schema.get("type", "")
-                field_custom = field_schema.get("custom", "")
-
-                # Epic Link field - used to link issues to epics
-                if (
-                    "epic link" in field_name
-                    or "epic-link" in field_name
-                    or original_name == "Epic Link"
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-link"
-                ):
-                    field_ids["epic_link"] = field_id
-                    logger.info(f"Found Epic Link field: {original_name} ({field_id})")
-
-                # Epic Name field - used when creating epics
-                elif (
-                    "epic name" in field_name
-                    or "epic-name" in field_name
-                    or original_name == "Epic Name"
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-label"
-                ):
-                    field_ids["epic_name"] = field_id
-                    logger.info(f"Found Epic Name field: {original_name} ({field_id})")
-
-                # Parent field - sometimes used instead of Epic Link
-                elif field_name == "parent" or field_name == "parent link" or original_name == "Parent Link":
-                    field_ids["parent"] = field_id
-                    logger.info(f"Found Parent field: {original_name} ({field_id})")
-
-                # Epic Status field
-                elif "epic status" in field_name or original_name == "Epic Status":
-                    field_ids["epic_status"] = field_id
-                    logger.info(f"Found Epic Status field: {original_name} ({field_id})")
-
-                # Epic Color field
-                elif (
-                    "epic colour" in field_name
-                    or "epic color" in field_name
-                    or original_name == "Epic Colour"
-                    or original_name == "Epic Color"
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-color"
-                ):
-                    field_ids["epic_color"] = field_id
-                    logger.info(f"Found Epic Color field: {original_name} ({field_id})")
-
-                # Priority field
-                elif field_name == "priority" or original_name == "Priority":
-                    field_ids["priority"] = field_id
-                    logger.info(f"Found Priority field: {original_name} ({field_id})")
-
-                # Sprint field
-                elif "sprint" in field_name or field_custom == "com.pyxis.greenhopper.jira:gh-sprint":
-                    field_ids["sprint"] = field_id
-                    logger.info(f"Found Sprint field: {original_name} ({field_id})")
-
-                # Story Points field
-                elif "story points" in field_name or "storypoints" in field_name or "story point" in field_name:
-                    field_ids["story_points"] = field_id
-                    logger.info(f"Found Story Points field: {original_name} ({field_id})")
-
-                # Try to detect any other fields that might be related to core functionality
-                elif ("epic" in field_name or "epic" in field_custom) and field_id not in field_ids.values():
-                    key = f"epic_{field_name.replace(' ', '_')}"
-                    field_ids[key] = field_id
-                    logger.info(f"Found additional Epic-related field: {original_name} ({field_id})")
-
-            # Cache the results for future use
-            self._field_ids_cache = field_ids
-            return field_ids
+            # Callers sharing the client wait for one discovery instead of each running their own
+            with self._field_ids_lock:
+                field_ids = self._leased_field_ids()
+                if field_ids is not None:
+                    return field_ids
+                return self._discover_field_ids()
 
         except Exception as e:
-            logger.error(f"Error discovering Jira field IDs: {str(e)}")
+            logger.error("Error discovering Jira field IDs: %s", e)
             self._handle_error(e, "fields")
             # Return an empty dict as fallback
             return {}
 
+    def _rediscover_field_ids(self, since: float) -> Dict[str, str]:
+        """
+        Query Jira for field IDs again when a requested field is missing from the lease.
+
+        Unlike refresh_field_cache, the cache file and the current lease stay usable
+        until the new IDs replace them. Each lease is rediscovered at most once, and
+        not at all when it was queried from Jira at or after ``since``.
+
+        Args:
+            since: Time (time.time) the caller's operation started
+
+        Returns:
+            Dictionary mapping field names to their IDs.
+        """
+        try:
+            with self._field_ids_lock:
+                if self._field_ids_rediscovered or self._field_ids_saved_at >= since:
+                    return self._field_ids_cache
+                return self._query_field_ids(rediscovered=True)
+        except Exception as e:
+            logger.error("Error rediscovering Jira field IDs: %s", e)
+            self._handle_error(e, "fields")
+            return {}
+
+    def _leased_field_ids(self) -> Optional[Dict[str, str]]:
+        """
+        Return the cached field IDs while their lease is valid.
+
+        An empty result is leased like any other, so instances without matching
+        fields are not enumerated again on every epic operation.
+
+        Returns:
+            The cached field IDs, or None if they need to be discovered.
+        """
+        if self._field_ids_reads_left > 0 and time.monotonic() < self._field_ids_expires_at:
+            self._field_ids_reads_left -= 1
+            return self._field_ids_cache
+        return None
+
+    def _discover_field_ids(self) -> Dict[str, str]:
+        """
+        Load field IDs from the file cache, or query them from the Jira API.
+
+        Returns:
+            Dictionary mapping field names to their IDs.
+        """
+        # Reuse field IDs discovered by a previous process, unless an expired lease
+        # (which may have come from that file) needs a fresh lookup
+        cached = None if self._field_ids_cache else self._load_field_cache()
+        if cached:
+            self._lease_field_ids(*cached)
+            return self._field_ids_cache
+        return self._query_field_ids()
+
+    def _query_field_ids(self, *, rediscovered: bool = False) -> Dict[str, str]:
+        """
+        Query field IDs from the Jira API and lease them.
+
+        Args:
+            rediscovered: Whether the query replaces a lease missing a requested field
+
+        Returns:
+            Dictionary mapping field names to their IDs.
+        """
+        # Fetch all fields from Jira API
+        fields = self.jira.fields()
+        field_ids = {}
+
+        # Log the complete list of fields for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            all_field_names = [f"{field.get('name', '')} ({field.get('id', '')})" for field in fields]
+            logger.debug("All available Jira fields: %s", all_field_names)
+
+        # Look for fields - use multiple strategies to identify them
+        for field in fields:
+            original_name = field.get("name", "")
+            field_name = original_name.lower()
+            field_id = field.get("id", "")
+            field_custom = (field.get("schema") or _EMPTY_SCHEMA).get("custom") or ""
+
+            rule = _FIELD_NAME_INDEX.get(field_name)
+            if rule is None and _FIELD_SUBSTRING_PATTERN.search(field_name):
+                rule = next(
+                    (
+                        rule
+                        for rule in _FIELD_RULES
+                        if any(part in field_name for part in rule[3]) or (rule[4] and field_custom == rule[4])
+                    ),
+                    None,
+                )
+            elif rule is None:
+                rule = _FIELD_CUSTOM_INDEX.get(field_custom)
+            if rule:
+                field_ids[rule[0]] = field_id
+                logger.info("Found %s field: %s (%s)", rule[1], original_name, field_id)
+
+            # Try to detect any other fields that might be related to core functionality
+            elif ("epic" in field_name or "epic" in field_custom) and field_id not in field_ids.values():
+                key = f"epic_{field_name.replace(' ', '_')}"
+                field_ids[key] = field_id
+                logger.info("Found additional Epic-related field: %s (%s)", original_name, field_id)
+
+        # Cache the results for future use
+        self._lease_field_ids(field_ids, time.time(), rediscovered=rediscovered)
+        if field_ids:
+            self._save_field_cache(field_ids)
+        return field_ids
+
     def get_current_user_account_id(self) -> str:
         """
         Get the account ID of the current user.
 
+        The account ID is fetched once and reused for the lifetime of the client.
+
         Returns:
             The account ID string of the current user
 
         Raises:
             JiraAuthenticationError: If unable to get the current user's account ID
         """
+        if self._account_id:
+            return self._account_id
+
         try:
             myself = self.jira.myself()
             account_id: Optional[str] = myself.get("accountId")
             if not account_id:
                 raise JiraAuthenticationError("Unable to get account ID from user profile")
+            self._account_id = account_id
             return account_id
         except Exception as e:
-            logger.error(f"Error getting current user account ID: {str(e)}")
+            logger.error("Error getting current user account ID: %s", e)
             self._handle_error(e, "user", "current")
+
+    def invalidate_identity(self) -> None:
+        """Forget the cached account ID, so the next lookup queries Jira again."""
+        self._account_id = None
@@ -49,9 +49,32 @@ class JiraWorkflowError(JiraAPIError):
 
 
 class JiraValidationError(JiraAPIError):
-    """Exception for data validation errors."""
-
-    pass
+    """
+    Exception for data validation errors.
+
+    Validation errors passed as errors are only formatted into the message
+    when the exception is converted to a string.
+    """
+
+    def __init__(
+        self,
+        message: str = "Invalid data",
+        status_code: int = None,
+        response: dict = None,
+        errors: list = None,
+    ):
+        self.errors = errors or []
+        super().__init__(message, status_code=status_code, response=response)
+
+    def __str__(self) -> str:
+        message = super().__str__()
+        if not self.errors:
+            return message
+        details = "; ".join(
+            f"{'.'.join(str(part) for part in error.get('loc', ()))}: {error.get('msg', '')}"
+            for error in self.errors
+        )
+        return f"{message}: {details}"
 
 
 class JiraConfigurationError(Exception):
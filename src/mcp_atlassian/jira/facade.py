@@ -3,11 +3,20 @@ Facade class that provides backward compatibility with the old JiraFetcher API.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from ..document_types import Document
 from ..config import JiraConfig
-from .issues import IssueManager
+from ..preprocessing import TextPreprocessor
+from .boards import BoardManager
+from .issues import (
+    DEFAULT_SEARCH_BATCH_SIZE,
+    DEFAULT_SEARCH_FIELDS,
+    MAX_CONCURRENT_EPIC_LINKS,
+    WORKLOG_PAGE_SIZE,
+    IssueManager,
+)
 from .projects import ProjectManager
 
 # Configure logging
@@ -33,17 +42,30 @@ class JiraFetcher:
         """
         # Initialize issue manager, which also handles general Jira client functionality
         self.issues = IssueManager(config=config)
-        
-        # Initialize project manager using the same client as issue manager
-        self.projects = ProjectManager(self.issues.client)
-        
+
         # Make client properties available directly on the facade
         self.jira = self.issues.jira
         self.config = self.issues.config
-        self.preprocessor = self.issues.preprocessor
-        
-        # For compatibility with the original JiraFetcher
-        self._field_ids_cache = self.issues._field_ids_cache
+
+    @cached_property
+    def projects(self) -> ProjectManager:
+        """Project manager sharing the issue manager's client, created on first use."""
+        return ProjectManager(self.issues.client)
+
+    @cached_property
+    def boards(self) -> BoardManager:
+        """Board manager sharing the issue manager's client, created on first use."""
+        return BoardManager(self.issues.client)
+
+    @property
+    def preprocessor(self) -> TextPreprocessor:
+        """Text preprocessor of the issue manager."""
+        return self.issues.preprocessor
+
+    @property
+    def _field_ids_cache(self) -> Dict[str, str]:
+        """Field IDs cache of the shared client, for compatibility with the original JiraFetcher."""
+        return self.issues.client._field_ids_cache
 
     def _clean_text(self, text: str) -> str:
         """Clean text content by processing user mentions and links."""
@@ -61,6 +83,10 @@ class JiraFetcher:
         """Dynamically discover Jira field IDs for this instance."""
         return self.issues.get_jira_field_ids()
 
+    def refresh_field_cache(self) -> None:
+        """Forget cached Jira field IDs, in memory and on disk."""
+        self.issues.refresh_field_cache()
+
     # Issue methods
     def get_issue(
         self,
@@ -91,31 +117,58 @@ class JiraFetcher:
         """Update an existing issue in Jira and return it as a Document."""
         return self.issues.update_issue(issue_key, fields, **kwargs)
 
-    def delete_issue(self, issue_key: str) -> bool:
-        """Delete an existing issue."""
-        return self.issues.delete_issue(issue_key)
+    def delete_issue(self, issue_key: Union[str, List[str]], timeout: float = 300) -> bool:
+        """Delete an existing issue, or several issues (one bulk operation on Cloud)."""
+        if isinstance(issue_key, str):
+            return self.issues.delete_issue(issue_key)
+        return self.issues.delete_issues(issue_key, timeout)
+
+    def bulk_create_issues(self, issues: List[Dict[str, Any]]) -> List[str]:
+        """Create several issues with a single request."""
+        return self.issues.bulk_create_issues(issues)
+
+    def bulk_delete_issues(self, issue_keys: List[str], *, send_notification: bool = True) -> str:
+        """Start deleting several issues with the bulk operations API."""
+        return self.issues.bulk_delete_issues(issue_keys, send_notification=send_notification)
+
+    def bulk_transition_issues(
+        self, issue_keys: List[str], transition_id: str, *, send_notification: bool = True
+    ) -> str:
+        """Start transitioning several issues with the bulk operations API."""
+        return self.issues.bulk_transition_issues(
+            issue_keys, transition_id, send_notification=send_notification
+        )
+
+    def wait_for_bulk_task(self, task_id: str, poll_interval: float = 1.0, timeout: float = 300) -> Dict[str, Any]:
+        """Wait for a bulk operation task to stop running."""
+        return self.issues.wait_for_bulk_task(task_id, poll_interval, timeout)
 
     def search_issues(
         self,
         jql: str,
-        fields: str = "*all",
+        fields: str = DEFAULT_SEARCH_FIELDS,
         start: int = 0,
         limit: int = 50,
         expand: Optional[str] = None,
+        batch_size: int = DEFAULT_SEARCH_BATCH_SIZE,
     ) -> List[Document]:
         """Search for issues using JQL (Jira Query Language)."""
-        return self.issues.search_issues(jql, fields, start, limit, expand)
+        return self.issues.search_issues(jql, fields, start, limit, expand, batch_size)
 
     def get_project_issues(
-        self, project_key: str, start: int = 0, limit: int = 50
+        self, project_key: str, start: int = 0, limit: int = 50, batch_size: int = DEFAULT_SEARCH_BATCH_SIZE
     ) -> List[Document]:
         """Get all issues for a project."""
-        return self.issues.get_project_issues(project_key, start, limit)
+        return self.issues.get_project_issues(project_key, start, limit, batch_size)
 
     def get_current_user_account_id(self) -> str:
         """Get the account ID of the current user."""
         return self.issues.get_current_user_account_id()
 
+    def invalidate_identity(self) -> None:
+        """Forget the cached account ID of the current user."""
+        self.issues.invalidate_identity()
+
     # Comment methods
     def get_issue_comments(self, issue_key: str, limit: int = 50) -> List[Dict]:
         """Get comments for a specific issue."""
@@ -144,6 +197,10 @@ class JiraFetcher:
         """Get worklogs for an issue."""
         return self.issues.get_worklogs(issue_key)
 
+    def iter_worklogs(self, issue_key: str, page_size: int = WORKLOG_PAGE_SIZE) -> Iterator[Dict]:
+        """Iterate over the worklogs of an issue, one page at a time."""
+        return self.issues.iter_worklogs(issue_key, page_size)
+
     # Status transition methods
     def get_available_transitions(self, issue_key: str) -> List[Dict]:
         """Get the available status transitions for an issue."""
@@ -164,9 +221,22 @@ class JiraFetcher:
         """Link an existing issue to an epic."""
         return self.issues.link_issue_to_epic(issue_key, epic_key)
 
-    def get_epic_issues(self, epic_key: str, limit: int = 50) -> List[Document]:
+    def link_issues_to_epic(
+        self, issue_keys: List[str], epic_key: str, max_workers: int = MAX_CONCURRENT_EPIC_LINKS
+    ) -> List[Document]:
+        """Link several existing issues to an epic concurrently."""
+        return self.issues.link_issues_to_epic(issue_keys, epic_key, max_workers)
+
+    def get_epic_issues(
+        self,
+        epic_key: str,
+        limit: int = 50,
+        batch_size: int = DEFAULT_SEARCH_BATCH_SIZE,
+        *,
+        try_fallbacks: bool = False,
+    ) -> List[Document]:
         """Get all issues linked to a specific epic."""
-        return self.issues.get_epic_issues(epic_key, limit)
+        return self.issues.get_epic_issues(epic_key, limit, batch_size, try_fallbacks=try_fallbacks)
     
     # Project methods
     def get_projects(
@@ -195,6 +265,10 @@ class JiraFetcher:
         """Get details of a specific project."""
         return self.projects.get_project(project_key_or_id, expand, properties)
 
+    def get_project_issue_types(self, project_key_or_id: str) -> List[Dict[str, Any]]:
+        """Get the issue types of a project."""
+        return self.projects.get_project_issue_types(project_key_or_id)
+
     def create_project(
         self,
         key: str,
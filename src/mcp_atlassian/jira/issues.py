@@ -4,9 +4,14 @@ Implementation of Jira Issues API operations (Part 1).
 
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+from ..cache import TTLCache
 from ..document_types import Document
 from ..preprocessing import TextPreprocessor
 from .client import JiraClient
@@ -22,6 +27,116 @@ from .models.issue import Issue, IssueCreate, IssueUpdate, Comment, Worklog, Tra
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
+# Issues requested per page when a search needs several pages
+DEFAULT_SEARCH_BATCH_SIZE = 500
+
+# Timezone offset without a colon (e.g., +0900) at the end of a timestamp
+_TZ_OFFSET_PATTERN = re.compile(r"([+-])(\d{2})(\d{2})$")
+
+# Transitions are shared by issues of the same project, type and status for this many seconds
+TRANSITIONS_CACHE_TTL_SECONDS = 300
+TRANSITIONS_CACHE_MAXSIZE = 256
+WORKFLOW_KEYS_CACHE_MAXSIZE = 1024
+
+# Shape of an account ID (letters, digits and hyphens), used as is without a lookup
+_ACCOUNT_ID_PATTERN = re.compile(r"[A-Za-z0-9-]+")
+
+# Account IDs resolved from an email or name are reused for this many seconds
+ACCOUNT_ID_CACHE_TTL_SECONDS = 600
+ACCOUNT_ID_CACHE_MAXSIZE = 1024
+
+# Issue types of epics checked by the epic operations are reused for this many seconds
+ISSUE_TYPE_CACHE_TTL_SECONDS = 300
+ISSUE_TYPE_CACHE_MAXSIZE = 256
+
+# Common custom field names for Epic links, used when discovery finds none
+DEFAULT_EPIC_LINK_FIELDS = ("customfield_10014", "customfield_10000", "epic_link")
+
+# Links on which every Epic link field failed, in a row, after which the common fallback
+# fields are skipped for a while
+EPIC_LINK_BREAKER_THRESHOLD = 3
+EPIC_LINK_BREAKER_SECONDS = 300
+
+# Components of a Jira time string (e.g., '1h 30m') and the seconds in each unit
+_TIME_SPENT_PATTERN = re.compile(r"(\d+)([wdhm])")
+_TIME_UNIT_SECONDS = {
+    "w": 7 * 24 * 60 * 60,  # weeks
+    "d": 24 * 60 * 60,  # days
+    "h": 60 * 60,  # hours
+    "m": 60,  # minutes
+}
+
+# Worklogs requested per page by iter_worklogs
+WORKLOG_PAGE_SIZE = 1000
+
+# Maximum number of issues linked at once by link_issues_to_epic
+MAX_CONCURRENT_EPIC_LINKS = 8
+
+# Maximum number of candidate JQL queries run at once by get_epic_issues
+MAX_CONCURRENT_EPIC_QUERIES = 3
+
+# Phrases in Jira error messages for missing resources and refused transitions
+_NOT_FOUND_PATTERN = re.compile(r"does not exist|not found", re.IGNORECASE)
+_WORKFLOW_ERROR_PATTERN = re.compile(r"workflow|transition", re.IGNORECASE)
+
+# Custom field named in Jira's error when a required Epic field is missing
+_MISSING_EPIC_FIELD_PATTERN = re.compile(r"(?:Field '(customfield_\d+)'|'(customfield_\d+)' cannot be set)")
+
+# Characters every Markdown construct converted by markdown_to_jira contains, apart
+# from indented "1. " lists which are checked separately
+_MARKDOWN_MARKERS = frozenset("*_[`#<~|-=")
+
+# Fields of a processed comment shown in issue content, in display order
+_COMMENT_FIELDS = itemgetter("created", "author", "body")
+
+# Epic-specific create_issue arguments and the discovered field each one sets
+EPIC_FIELD_ARGUMENTS = {"epic_name": "epic_name", "epic_color": "epic_color", "epic_colour": "epic_color"}
+
+# Fields search results are built from, requested unless the caller asks for others
+DEFAULT_SEARCH_FIELDS = "summary,issuetype,status,description,created,priority"
+
+# States in which a bulk operation task has stopped running
+BULK_TASK_FINAL_STATES = frozenset({"COMPLETE", "FAILED", "CANCELLED", "DEAD"})
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_string(date_str: str) -> str:
+    """
+    Format an ISO 8601 date string as YYYY-MM-DD, caching repeated timestamps.
+
+    Args:
+        date_str: Non-empty date string in ISO format.
+
+    Returns:
+        Formatted date string (YYYY-MM-DD), or the input if it cannot be parsed.
+    """
+    # Jira timestamps already start with the date, so no parsing is needed
+    if (
+        len(date_str) >= 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:10].isdigit()
+    ):
+        return date_str[:10]
+
+    # Other ISO timestamps often parse directly (Python 3.11+ accepts +HHMM offsets and Z)
+    try:
+        return datetime.fromisoformat(date_str).strftime("%Y-%m-%d")
+    except ValueError:
+        pass
+
+    # Handle timezone formats like Z, +0000, +0900, -0500, etc.
+    date_str = _TZ_OFFSET_PATTERN.sub(r"\1\2:\3", date_str.replace("Z", "+00:00"))
+
+    try:
+        date = datetime.fromisoformat(date_str)
+        return date.strftime("%Y-%m-%d")
+    except Exception as e:
+        logger.warning("Error parsing date %s: %s", date_str, e)
+        return date_str
+
 
 class IssueManager(JiraClient):
     """
@@ -32,10 +147,92 @@ class IssueManager(JiraClient):
     and transitioning issues.
     """
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the IssueManager."""
-        super().__init__(*args, **kwargs)
-        self.preprocessor = TextPreprocessor(self.config.url)
+    # Field that last linked an issue to an epic, tried first on the next link
+    _epic_link_field: Optional[str] = None
+
+    # Consecutive links on which every Epic link field failed, and when the fallback
+    # fields may be tried again (time.monotonic) once too many have
+    _epic_link_fallback_failures = 0
+    _epic_link_fallbacks_open_until = 0.0
+
+    @cached_property
+    def preprocessor(self) -> TextPreprocessor:
+        """Text preprocessor for issue content, created on first use."""
+        return TextPreprocessor(self.config.url)
+
+    @cached_property
+    def _browse_prefix(self) -> str:
+        """Start of the browser link to an issue, up to the issue key."""
+        return f"{self.config.url.rstrip('/')}/browse/"
+
+    @cached_property
+    def _account_id_cache(self) -> TTLCache:
+        """Account IDs resolved from emails and names, created on first use."""
+        return TTLCache(maxsize=ACCOUNT_ID_CACHE_MAXSIZE, ttl=ACCOUNT_ID_CACHE_TTL_SECONDS)
+
+    @cached_property
+    def _workflow_keys(self) -> TTLCache:
+        """(project, issue type, status) of recently fetched issues, created on first use."""
+        return TTLCache(maxsize=WORKFLOW_KEYS_CACHE_MAXSIZE, ttl=TRANSITIONS_CACHE_TTL_SECONDS)
+
+    @cached_property
+    def _transitions_cache(self) -> TTLCache:
+        """Available transitions per (project, issue type, status), created on first use."""
+        return TTLCache(maxsize=TRANSITIONS_CACHE_MAXSIZE, ttl=TRANSITIONS_CACHE_TTL_SECONDS)
+
+    @cached_property
+    def _issue_type_cache(self) -> TTLCache:
+        """Issue type names of recently checked epics, created on first use."""
+        return TTLCache(maxsize=ISSUE_TYPE_CACHE_MAXSIZE, ttl=ISSUE_TYPE_CACHE_TTL_SECONDS)
+
+    def _get_issue_type(self, issue_key: str) -> str:
+        """
+        Get the name of an issue's type, reusing recent lookups.
+
+        Args:
+            issue_key: The issue key (e.g., 'PROJ-123')
+
+        Returns:
+            Name of the issue type
+        """
+        issue_type = self._issue_type_cache.get(issue_key)
+        if issue_type is None:
+            issue = self.jira.issue(issue_key, fields="issuetype")
+            issue_type = issue["fields"]["issuetype"]["name"]
+            self._issue_type_cache.set(issue_key, issue_type)
+        return issue_type
+
+    def _remember_workflow(self, issue_key: str, issue_type: str, status: str) -> None:
+        """
+        Record which workflow state an issue was in when it was fetched.
+
+        Args:
+            issue_key: The issue key (e.g., 'PROJ-123')
+            issue_type: Name of the issue type
+            status: Name of the issue status
+        """
+        self._workflow_keys.set(issue_key, (issue_key.rsplit("-", 1)[0], issue_type, status))
+
+    @property
+    def _epic_link_fields(self) -> Tuple[str, ...]:
+        """
+        Fields that may hold an issue's Epic link.
+
+        Uses the Epic Link field from field IDs the client has already discovered,
+        without querying Jira, and the default fields otherwise.
+        """
+        epic_link = self._field_ids_cache.get("epic_link")
+        if epic_link:
+            return (epic_link,)
+        logger.debug("Epic Link field not discovered yet, reading %s", ", ".join(DEFAULT_EPIC_LINK_FIELDS))
+        return DEFAULT_EPIC_LINK_FIELDS
+
+    def refresh_field_cache(self) -> None:
+        """Forget cached field IDs, including the resolved Epic Link field."""
+        super().refresh_field_cache()
+        self._epic_link_field = None
+        self._epic_link_fallback_failures = 0
+        self._epic_link_fallbacks_open_until = 0.0
 
     def _clean_text(self, text: str) -> str:
         """
@@ -65,6 +262,12 @@ class IssueManager(JiraClient):
         if not markdown_text:
             return ""
 
+        # Nothing to convert in whitespace-only text or prose without Markdown markers
+        if markdown_text.isspace() or (
+            _MARKDOWN_MARKERS.isdisjoint(markdown_text) and "1. " not in markdown_text
+        ):
+            return markdown_text
+
         return self.preprocessor.markdown_to_jira(markdown_text)
 
     def _parse_date(self, date_str: str) -> str:
@@ -79,23 +282,7 @@ class IssueManager(JiraClient):
         """
         if not date_str:
             return ""
-
-        # Handle various timezone formats
-        if "+0000" in date_str:
-            date_str = date_str.replace("+0000", "+00:00")
-        elif "-0000" in date_str:
-            date_str = date_str.replace("-0000", "+00:00")
-        # Handle other timezone formats like +0900, -0500, etc.
-        elif len(date_str) >= 5 and date_str[-5] in "+-" and date_str[-4:].isdigit():
-            # Insert colon between hours and minutes of timezone
-            date_str = date_str[:-2] + ":" + date_str[-2:]
-
-        try:
-            date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            return date.strftime("%Y-%m-%d")
-        except Exception as e:
-            logger.warning(f"Error parsing date {date_str}: {e}")
-            return date_str
+        return _parse_date_string(date_str)
 
     def _get_account_id(self, assignee: str) -> str:
         """
@@ -111,53 +298,90 @@ class IssueManager(JiraClient):
             ValueError: If user cannot be found.
         """
         # If it looks like an account ID (alphanumeric with hyphens), return as is
-        if assignee and assignee.replace("-", "").isalnum():
-            logger.info(f"Using '{assignee}' as account ID")
+        if assignee and _ACCOUNT_ID_PATTERN.fullmatch(assignee):
+            logger.info("Using '%s' as account ID", assignee)
             return assignee
 
+        account_id = self._account_id_cache.get(assignee)
+        if account_id is None:
+            account_id = self._lookup_account_id(assignee)
+            self._account_id_cache.set(assignee, account_id)
+        return account_id
+
+    def _remember_account_id(self, user: Dict[str, Any], account_id: str) -> None:
+        """
+        Cache an account ID under the display name and email address of its user.
+
+        Args:
+            user: User returned by a Jira user search
+            account_id: Account ID of the user
+        """
+        for alias in (user.get("displayName"), user.get("emailAddress")):
+            if alias:
+                self._account_id_cache.set(alias, account_id)
+
+    def _lookup_account_id(self, assignee: str) -> str:
+        """
+        Look up the account ID for an email or full name in Jira.
+
+        Args:
+            assignee: Email or full name of the user.
+
+        Returns:
+            Account ID of the user.
+
+        Raises:
+            ValueError: If user cannot be found.
+        """
         try:
             # First try direct user lookup
             try:
                 users = self.jira.user_find_by_user_string(query=assignee)
                 if users:
                     if len(users) > 1:
-                        # Log all found users for debugging
-                        user_details = [f"{u.get('displayName')} ({u.get('emailAddress')})" for u in users]
-                        logger.warning(
-                            f"Multiple users found for '{assignee}', using first match. "
-                            f"Found users: {', '.join(user_details)}"
-                        )
+                        # Log all found users for debugging, only building the list when it is emitted
+                        if logger.isEnabledFor(logging.WARNING):
+                            user_details = [f"{u.get('displayName')} ({u.get('emailAddress')})" for u in users]
+                            logger.warning(
+                                "Multiple users found for '%s', using first match. Found users: %s",
+                                assignee,
+                                ", ".join(user_details),
+                            )
 
                     user = users[0]
                     account_id = user.get("accountId")
                     if account_id and isinstance(account_id, str):
                         logger.info(
-                            f"Found account ID via direct lookup: {account_id} "
-                            f"({user.get('displayName')} - {user.get('emailAddress')})"
+                            "Found account ID via direct lookup: %s (%s - %s)",
+                            account_id,
+                            user.get("displayName"),
+                            user.get("emailAddress"),
                         )
+                        self._remember_account_id(user, account_id)
                         return str(account_id)  # Explicit str conversion
-                    logger.warning(f"Direct user lookup failed for '{assignee}': user found but no account ID present")
+                    logger.warning("Direct user lookup failed for '%s': user found but no account ID present", assignee)
                 else:
-                    logger.warning(f"Direct user lookup failed for '{assignee}': no users found")
+                    logger.warning("Direct user lookup failed for '%s': no users found", assignee)
             except Exception as e:
-                logger.warning(f"Direct user lookup failed for '{assignee}': {str(e)}")
+                logger.warning("Direct user lookup failed for '%s': %s", assignee, e)
 
             # Fall back to project permission based search
             users = self.jira.get_users_with_browse_permission_to_a_project(username=assignee)
             if not users:
-                logger.warning(f"No user found matching '{assignee}'")
+                logger.warning("No user found matching '%s'", assignee)
                 raise ValueError(f"No user found matching '{assignee}'")
 
             # Return the first matching user's account ID
             account_id = users[0].get("accountId")
             if not account_id or not isinstance(account_id, str):
-                logger.warning(f"Found user '{assignee}' but no account ID was returned")
+                logger.warning("Found user '%s' but no account ID was returned", assignee)
                 raise ValueError(f"Found user '{assignee}' but no account ID was returned")
 
-            logger.info(f"Found account ID via browse permission lookup: {account_id}")
+            logger.info("Found account ID via browse permission lookup: %s", account_id)
+            self._remember_account_id(users[0], account_id)
             return str(account_id)  # Explicit str conversion
         except Exception as e:
-            logger.error(f"Error finding user '{assignee}': {str(e)}")
+            logger.error("Error finding user '%s': %s", assignee, e)
             raise ValueError(f"Could not resolve account ID for '{assignee}'") from e
 
     def get_issue(
@@ -179,97 +403,115 @@ class IssueManager(JiraClient):
             JiraAPIError: For other API errors.
         """
         try:
-            issue = self.jira.issue(issue_key, expand=expand)
-
-            # Process description and comments
-            description = self._clean_text(issue["fields"].get("description", ""))
-
             # Convert comment_limit to int if it's a string
             if comment_limit is not None and isinstance(comment_limit, str):
                 try:
                     comment_limit = int(comment_limit)
                 except ValueError:
-                    logger.warning(f"Invalid comment_limit value: {comment_limit}. Using default of 10.")
+                    logger.warning("Invalid comment_limit value: %s. Using default of 10.", comment_limit)
                     comment_limit = 10
 
-            # Get comments if limit is specified
+            # Get comments if limit is specified, fetching them alongside the issue
             comments = []
             if comment_limit is not None and comment_limit > 0:
-                comments = self.get_issue_comments(issue_key, limit=comment_limit)
-
-            # Format created date using parser
-            created_date = self._parse_date(issue["fields"]["created"])
-
-            # Check for Epic information
-            epic_key = None
-            epic_name = None
-
-            # Most Jira instances use the "parent" field for Epic relationships
-            if "parent" in issue["fields"] and issue["fields"]["parent"]:
-                epic_key = issue["fields"]["parent"]["key"]
-                epic_name = issue["fields"]["parent"]["fields"]["summary"]
-
-            # Some Jira instances use custom fields for Epic links
-            # Common custom field names for Epic links
-            epic_field_names = ["customfield_10014", "customfield_10000", "epic_link"]
-            for field_name in epic_field_names:
-                if field_name in issue["fields"] and issue["fields"][field_name]:
-                    # If it's a string, assume it's the epic key
-                    if isinstance(issue["fields"][field_name], str):
-                        epic_key = issue["fields"][field_name]
-                    # If it's an object, extract the key
-                    elif isinstance(issue["fields"][field_name], dict) and "key" in issue["fields"][field_name]:
-                        epic_key = issue["fields"][field_name]["key"]
-
-            # Combine content in a more structured way
-            content = f"""Issue: {issue_key}
-Title: {issue['fields'].get('summary', '')}
-Type: {issue['fields']['issuetype']['name']}
-Status: {issue['fields']['status']['name']}
-Created: {created_date}
-"""
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    comments_future = executor.submit(self.get_issue_comments, issue_key, limit=comment_limit)
+                    issue = self.jira.issue(issue_key, expand=expand)
+                    comments = comments_future.result()
+            else:
+                issue = self.jira.issue(issue_key, expand=expand)
 
-            # Add Epic information if available
-            if epic_key:
-                content += f"Epic: {epic_key}"
-                if epic_name:
-                    content += f" - {epic_name}"
-                content += "\n"
+            return self._issue_to_document(issue_key, issue, comments)
 
-            content += f"""
-Description:
-{description}
-"""
-            if comments:
-                content += "\nComments:\n" + "\n".join(
-                    [f"{c['created']} - {c['author']}: {c['body']}" for c in comments]
-                )
+        except Exception as e:
+            logger.error("Error fetching issue %s: %s", issue_key, e)
+            self._handle_error(e, "issue", issue_key)
 
-            # Streamlined metadata with only essential information
-            metadata = {
-                "key": issue_key,
-                "title": issue["fields"].get("summary", ""),
-                "type": issue["fields"]["issuetype"]["name"],
-                "status": issue["fields"]["status"]["name"],
-                "created_date": created_date,
-                "priority": issue["fields"].get("priority", {}).get("name", "None"),
-                "link": f"{self.config.url.rstrip('/')}/browse/{issue_key}",
-            }
+    def _issue_to_document(
+        self, issue_key: str, issue: Dict[str, Any], comments: Optional[List[Dict]] = None
+    ) -> Document:
+        """
+        Convert an issue returned by Jira into a Document.
 
-            # Add Epic information to metadata
-            if epic_key:
-                metadata["epic_key"] = epic_key
-                if epic_name:
-                    metadata["epic_name"] = epic_name
+        Args:
+            issue_key: The issue key (e.g., 'PROJ-123')
+            issue: Issue as returned by the Jira API, with its fields
+            comments: Processed comments to include, if any
 
-            if comments:
-                metadata["comments"] = comments
+        Returns:
+            Document containing issue content and metadata
+        """
+        # Process description
+        description = self._clean_text(issue["fields"].get("description", ""))
+
+        # Format created date using parser
+        created_date = self._parse_date(issue["fields"]["created"])
+
+        # Check for Epic information
+        epic_key = None
+        epic_name = None
+
+        # Most Jira instances use the "parent" field for Epic relationships
+        if "parent" in issue["fields"] and issue["fields"]["parent"]:
+            epic_key = issue["fields"]["parent"]["key"]
+            epic_name = issue["fields"]["parent"]["fields"]["summary"]
+
+        # Some Jira instances use custom fields for Epic links
+        for field_name in self._epic_link_fields:
+            if field_name in issue["fields"] and issue["fields"][field_name]:
+                # If it's a string, assume it's the epic key
+                if isinstance(issue["fields"][field_name], str):
+                    epic_key = issue["fields"][field_name]
+                # If it's an object, extract the key
+                elif isinstance(issue["fields"][field_name], dict) and "key" in issue["fields"][field_name]:
+                    epic_key = issue["fields"][field_name]["key"]
+
+        # Combine content in a more structured way
+        parts = [
+            f"Issue: {issue_key}\n",
+            f"Title: {issue['fields'].get('summary', '')}\n",
+            f"Type: {issue['fields']['issuetype']['name']}\n",
+            f"Status: {issue['fields']['status']['name']}\n",
+            f"Created: {created_date}\n",
+        ]
+
+        # Add Epic information if available
+        if epic_key:
+            parts.append(f"Epic: {epic_key} - {epic_name}\n" if epic_name else f"Epic: {epic_key}\n")
+
+        parts.append(f"\nDescription:\n{description}\n")
+        if comments:
+            parts.append("\nComments:\n")
+            parts.append(
+                "\n".join([f"{created} - {author}: {body}" for created, author, body in map(_COMMENT_FIELDS, comments)])
+            )
+        content = "".join(parts)
+
+        self._remember_workflow(
+            issue_key, issue["fields"]["issuetype"]["name"], issue["fields"]["status"]["name"]
+        )
+
+        # Streamlined metadata with only essential information
+        metadata = {
+            "key": issue_key,
+            "title": issue["fields"].get("summary", ""),
+            "type": issue["fields"]["issuetype"]["name"],
+            "status": issue["fields"]["status"]["name"],
+            "created_date": created_date,
+            "priority": issue["fields"].get("priority", {}).get("name", "None"),
+            "link": self._browse_prefix + issue_key,
+        }
 
-            return Document(page_content=content, metadata=metadata)
+        # Add Epic information to metadata
+        if epic_key:
+            metadata["epic_key"] = epic_key
+            if epic_name:
+                metadata["epic_name"] = epic_name
 
-        except Exception as e:
-            logger.error(f"Error fetching issue {issue_key}: {str(e)}")
-            self._handle_error(e, "issue", issue_key)
+        if comments:
+            metadata["comments"] = comments
+
+        return Document(page_content=content, metadata=metadata)
 
     def create_issue(
         self,
@@ -278,6 +520,8 @@ Description:
         issue_type: str,
         description: str = "",
         assignee: Optional[str] = None,
+        *,
+        expand_response: bool = True,
         **kwargs: Any,
     ) -> Document:
         """
@@ -289,6 +533,8 @@ Description:
             issue_type: Issue type (e.g., 'Task', 'Bug', 'Story')
             description: Issue description
             assignee: Email, full name, or account ID of the user to assign the issue to
+            expand_response: Whether to fetch the created issue back from Jira; if False,
+                a lightweight Document with the key, summary and type is returned instead
             **kwargs: Any other custom Jira fields
 
         Returns:
@@ -307,30 +553,41 @@ Description:
 
         # If we're creating an Epic, handle Epic-specific fields dynamically
         if issue_type.lower() == "epic":
+            started = time.time()
             try:
                 # Get the dynamic field IDs
                 field_ids = self.get_jira_field_ids()
-                logger.info(f"Discovered Jira field IDs for Epic creation: {field_ids}")
+
+                # A requested Epic field missing from the cached IDs may have been added
+                # since discovery, so rediscover instead of waiting for the lease to expire
+                missing = [name for name, key in EPIC_FIELD_ARGUMENTS.items() if name in kwargs and key not in field_ids]
+                if missing:
+                    logger.info("Epic fields %s not among known field IDs, rediscovering fields", missing)
+                    field_ids = self._rediscover_field_ids(started)
+
+                logger.info("Discovered Jira field IDs for Epic creation: %s", field_ids)
 
                 # Handle Epic Name - might be required in some instances, not in others
                 # If Epic Name field was found during discovery, use it
                 if "epic_name" in field_ids:
                     epic_name = kwargs.pop("epic_name", summary)  # Use summary as default if not provided
                     fields[field_ids["epic_name"]] = epic_name
-                    logger.info(f"Setting Epic Name field {field_ids['epic_name']} to: {epic_name}")
+                    logger.info("Setting Epic Name field %s to: %s", field_ids["epic_name"], epic_name)
 
                 # Handle Epic Color if the field was discovered
                 if "epic_color" in field_ids:
-                    epic_color = kwargs.pop("epic_color", None) or kwargs.pop("epic_colour", None) or "green"
+                    epic_color = kwargs.pop("epic_color", None)
+                    epic_colour = kwargs.pop("epic_colour", None)
+                    epic_color = epic_color or epic_colour or "green"
                     fields[field_ids["epic_color"]] = epic_color
-                    logger.info(f"Setting Epic Color field {field_ids['epic_color']} to: {epic_color}")
+                    logger.info("Setting Epic Color field %s to: %s", field_ids["epic_color"], epic_color)
 
                 # Pass through any explicitly provided custom fields that might be instance-specific
                 # This allows callers who know their instance to directly specify field IDs
                 for field_key, field_value in kwargs.items():
                     if field_key.startswith("customfield_"):
                         fields[field_key] = field_value
-                        logger.info(f"Using explicitly provided custom field {field_key}: {field_value}")
+                        logger.info("Using explicitly provided custom field %s: %s", field_key, field_value)
 
                 # If epic_name field is required but wasn't discovered, warn the user
                 # Some Jira instances require it, others don't
@@ -340,9 +597,14 @@ Description:
                         "If your Jira instance requires it, please provide the customfield_* ID directly."
                     )
             except Exception as e:
-                logger.error(f"Error preparing Epic-specific fields: {str(e)}")
+                logger.error("Error preparing Epic-specific fields: %s", e)
                 # Continue with creation anyway, as some instances might not require special fields
 
+            # Epic arguments left over had no matching field and would reach Jira as field names
+            unresolved = [name for name in EPIC_FIELD_ARGUMENTS if kwargs.pop(name, None) is not None]
+            if unresolved:
+                logger.warning("Ignoring %s, no matching Epic fields found in Jira", unresolved)
+
         # Add assignee if provided
         if assignee:
             account_id = self._get_account_id(assignee)
@@ -355,17 +617,27 @@ Description:
             )
             kwargs.pop("assignee")
 
-        for key, value in kwargs.items():
-            fields[key] = value
+        fields.update(kwargs)
 
-        # Convert description to Jira format if present
-        if "description" in fields and fields["description"]:
-            fields["description"] = self._markdown_to_jira(fields["description"])
+        # The description argument is already converted, only one passed in kwargs still needs it
+        if kwargs.get("description"):
+            fields["description"] = self._markdown_to_jira(kwargs["description"])
 
         try:
             response = self.jira.create_issue(fields=fields)
             issue_key = response["key"]
-            logger.info(f"Created issue {issue_key}")
+            logger.info("Created issue %s", issue_key)
+            if not expand_response:
+                # Describe the new issue from what was sent instead of fetching it back
+                return Document(
+                    page_content=f"Issue: {issue_key}\nTitle: {summary}\nType: {issue_type}\n",
+                    metadata={
+                        "key": issue_key,
+                        "title": summary,
+                        "type": issue_type,
+                        "link": self._browse_prefix + issue_key,
+                    },
+                )
             return self.get_issue(issue_key)
         except Exception as e:
             error_msg = str(e)
@@ -373,35 +645,45 @@ Description:
             # Provide more helpful error messages for common issues
             if issue_type.lower() == "epic" and "customfield_" in error_msg:
                 # Handle the case where a specific Epic field is required but missing
-                missing_field_match = re.search(
-                    r"(?:Field '(customfield_\d+)'|'(customfield_\d+)' cannot be set)", error_msg
-                )
+                missing_field_match = _MISSING_EPIC_FIELD_PATTERN.search(error_msg)
                 if missing_field_match:
                     field_id = missing_field_match.group(1) or missing_field_match.group(2)
                     logger.error(
-                        f"Failed to create Epic: Your Jira instance requires field '{field_id}'. "
-                        f"This is typically the Epic Name field. Try setting this field explicitly "
-                        f"using '{field_id}': 'Epic Name Value' in the additional_fields parameter."
+                        "Failed to create Epic: Your Jira instance requires field '%s'. "
+                        "This is typically the Epic Name field. Try setting this field explicitly "
+                        "using '%s': 'Epic Name Value' in the additional_fields parameter.",
+                        field_id,
+                        field_id,
                     )
                     raise JiraFieldError(f"Missing required Epic field: {field_id}")
                 else:
                     logger.error(
-                        f"Failed to create Epic: Your Jira instance has custom field requirements. "
-                        f"You may need to provide specific custom fields for Epics in your instance. "
-                        f"Original error: {error_msg}"
+                        "Failed to create Epic: Your Jira instance has custom field requirements. "
+                        "You may need to provide specific custom fields for Epics in your instance. "
+                        "Original error: %s",
+                        error_msg,
                     )
                     raise JiraFieldError(f"Epic creation failed: {error_msg}")
             else:
-                logger.error(f"Error creating issue: {error_msg}")
+                logger.error("Error creating issue: %s", error_msg)
                 self._handle_error(e, "issue", "creation")
                 
-    def update_issue(self, issue_key: str, fields: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Document:
+    def update_issue(
+        self,
+        issue_key: str,
+        fields: Optional[Dict[str, Any]] = None,
+        *,
+        expand_response: bool = True,
+        **kwargs: Any,
+    ) -> Document:
         """
         Update an existing issue in Jira and return it as a Document.
 
         Args:
             issue_key: The key of the issue to update (e.g., 'PROJ-123')
             fields: Fields to update
+            expand_response: Whether to return the issue with its comments; if False, the
+                comments are left out and on Cloud the issue comes from the update response
             **kwargs: Any other custom Jira fields
 
         Returns:
@@ -416,8 +698,7 @@ Description:
             fields = {}
 
         # Handle all kwargs
-        for key, value in kwargs.items():
-            fields[key] = value
+        fields.update(kwargs)
 
         # Convert description to Jira format if present
         if "description" in fields and fields["description"]:
@@ -427,41 +708,57 @@ Description:
         if "status" in fields:
             requested_status = fields.pop("status")
             if not isinstance(requested_status, str):
-                logger.warning(f"Status must be a string, got {type(requested_status)}: {requested_status}")
+                logger.warning("Status must be a string, got %s: %s", type(requested_status), requested_status)
                 # Try to convert to string if possible
                 requested_status = str(requested_status)
 
-            logger.info(f"Status update requested to: {requested_status}")
+            logger.info("Status update requested to: %s", requested_status)
 
             # Get available transitions
             transitions = self.get_available_transitions(issue_key)
 
-            # Find matching transition
-            transition_id = None
-            for transition in transitions:
-                to_status = transition.get("to_status", "")
-                if isinstance(to_status, str) and to_status.lower() == requested_status.lower():
-                    transition_id = transition["id"]
-                    break
+            # Find matching transition, the first one listed wins if several lead to the status
+            transition_ids = {
+                transition["to_status"].lower(): transition["id"]
+                for transition in reversed(transitions)
+                if isinstance(transition.get("to_status"), str)
+            }
+            transition_id = transition_ids.get(requested_status.lower())
 
             if transition_id:
                 # Use transition_issue method if we found a matching transition
-                logger.info(f"Found transition ID {transition_id} for status {requested_status}")
+                logger.info("Found transition ID %s for status %s", transition_id, requested_status)
                 return self.transition_issue(issue_key, transition_id, fields)
             else:
                 available_statuses = [t.get("to_status", "") for t in transitions]
                 logger.warning(
-                    f"No transition found for status '{requested_status}'. Available transitions: {transitions}"
+                    "No transition found for status '%s'. Available transitions: %s",
+                    requested_status,
+                    transitions,
                 )
                 raise JiraWorkflowError(
                     f"Cannot transition issue to status '{requested_status}'. Available status transitions: {available_statuses}"
                 )
 
         try:
-            self.jira.issue_update(issue_key, fields=fields)
-            return self.get_issue(issue_key)
+            if expand_response:
+                self.jira.issue_update(issue_key, fields=fields)
+                return self.get_issue(issue_key)
+            if not self.config.is_cloud:
+                self.jira.issue_update(issue_key, fields=fields)
+                return self.get_issue(issue_key, comment_limit=None)
+
+            # Jira Cloud can return the updated issue, saving the request to fetch it
+            issue = self.jira.put(
+                f"{self.jira.resource_url('issue')}/{issue_key}",
+                data={"fields": fields},
+                params={"returnIssue": "true"},
+            )
+            if not isinstance(issue, dict) or "fields" not in issue:
+                return self.get_issue(issue_key, comment_limit=None)
+            return self._issue_to_document(issue_key, issue)
         except Exception as e:
-            logger.error(f"Error updating issue {issue_key}: {str(e)}")
+            logger.error("Error updating issue %s: %s", issue_key, e)
             self._handle_error(e, "issue", issue_key)
 
     def delete_issue(self, issue_key: str) -> bool:
@@ -483,26 +780,191 @@ Description:
             self.jira.delete_issue(issue_key)
             return True
         except Exception as e:
-            logger.error(f"Error deleting issue {issue_key}: {str(e)}")
+            logger.error("Error deleting issue %s: %s", issue_key, e)
             self._handle_error(e, "issue", issue_key)
 
+    def delete_issues(self, issue_keys: List[str], timeout: float = 300) -> bool:
+        """
+        Delete several issues.
+
+        On Jira Cloud the issues are deleted with one bulk operation, waited for
+        up to timeout seconds. The bulk operations API does not exist on
+        Server/Data Center, where the issues are deleted one at a time.
+
+        Args:
+            issue_keys: Keys of the issues to delete
+            timeout: Maximum number of seconds to wait for the bulk operation
+
+        Returns:
+            True if every issue was deleted, otherwise raise an exception
+
+        Raises:
+            JiraResourceNotFoundError: If an issue is not found (Server/Data Center)
+            JiraPermissionError: If the user lacks permissions to delete the issues
+            JiraAPIError: If the bulk operation did not delete every issue, or for other API errors
+        """
+        if len(issue_keys) <= 1 or not self.config.is_cloud:
+            for issue_key in issue_keys:
+                self.delete_issue(issue_key)
+            return True
+
+        task_id = self.bulk_delete_issues(issue_keys)
+        progress = self.wait_for_bulk_task(task_id, timeout=timeout)
+        failed = sorted(progress.get("failedAccessibleIssues") or {})
+        inaccessible = progress.get("invalidOrInaccessibleIssueCount") or 0
+        if progress.get("status") != "COMPLETE" or failed or inaccessible:
+            raise JiraAPIError(
+                f"Bulk delete {task_id} ended {progress.get('status')}: "
+                f"failed issues {', '.join(failed) or 'none'}, {inaccessible} invalid or inaccessible"
+            )
+        return True
+
+    def bulk_create_issues(self, issues: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several issues with a single request.
+
+        Args:
+            issues: Issues to create, each with project_key, summary and issue_type keys,
+                optional description and assignee, and any other Jira fields
+
+        Returns:
+            Keys of the created issues, in request order
+
+        Raises:
+            JiraAPIError: For API errors
+        """
+        issue_updates = []
+        for issue in issues:
+            issue = dict(issue)
+            fields = {
+                "project": {"key": issue.pop("project_key")},
+                "summary": issue.pop("summary"),
+                "issuetype": {"name": issue.pop("issue_type")},
+                "description": self._markdown_to_jira(issue.pop("description", "")),
+            }
+            assignee = issue.pop("assignee", None)
+            if assignee:
+                fields["assignee"] = {"accountId": self._get_account_id(assignee)}
+            fields.update(issue)
+            issue_updates.append({"fields": fields})
+
+        try:
+            response = self.jira.create_issues(issue_updates)
+            for error in response.get("errors", []):
+                logger.warning("Failed to create issue %s in bulk: %s", error.get("failedElementNumber"), error)
+            return [created["key"] for created in response.get("issues", [])]
+        except Exception as e:
+            logger.error("Error creating %s issues in bulk: %s", len(issues), e)
+            self._handle_error(e, "issues", "bulk create")
+
+    def bulk_delete_issues(self, issue_keys: List[str], *, send_notification: bool = True) -> str:
+        """
+        Start deleting several issues with the bulk operations API (Jira Cloud).
+
+        Args:
+            issue_keys: Keys or IDs of the issues to delete
+            send_notification: Whether to send a bulk change notification
+
+        Returns:
+            ID of the bulk task, see wait_for_bulk_task
+
+        Raises:
+            JiraPermissionError: If the user lacks permissions to delete the issues
+            JiraAPIError: For other API errors
+        """
+        try:
+            response = self.jira.post(
+                "rest/api/3/bulk/issues/delete",
+                data={"selectedIssueIdsOrKeys": issue_keys, "sendBulkNotification": send_notification},
+            )
+            return response["taskId"]
+        except Exception as e:
+            logger.error("Error deleting issues %s in bulk: %s", issue_keys, e)
+            self._handle_error(e, "issues", "bulk delete")
+
+    def bulk_transition_issues(
+        self, issue_keys: List[str], transition_id: str, *, send_notification: bool = True
+    ) -> str:
+        """
+        Start transitioning several issues with the bulk operations API (Jira Cloud).
+
+        Args:
+            issue_keys: Keys or IDs of the issues to transition
+            transition_id: The ID of the transition to perform on every issue
+            send_notification: Whether to send a bulk change notification
+
+        Returns:
+            ID of the bulk task, see wait_for_bulk_task
+
+        Raises:
+            JiraWorkflowError: If the transition cannot be performed
+            JiraAPIError: For other API errors
+        """
+        try:
+            response = self.jira.post(
+                "rest/api/3/bulk/issues/transition",
+                data={
+                    "bulkTransitionInputs": [
+                        {"selectedIssueIdsOrKeys": issue_keys, "transitionId": str(transition_id)}
+                    ],
+                    "sendBulkNotification": send_notification,
+                },
+            )
+            return response["taskId"]
+        except Exception as e:
+            logger.error("Error transitioning issues %s in bulk: %s", issue_keys, e)
+            self._handle_error(e, "issues", "bulk transition")
+
+    def wait_for_bulk_task(self, task_id: str, poll_interval: float = 1.0, timeout: float = 300) -> Dict[str, Any]:
+        """
+        Wait for a bulk operation task to stop running.
+
+        Args:
+            task_id: ID returned when the bulk operation was started
+            poll_interval: Seconds between progress checks
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            Final task progress, including its status and any failed issues
+
+        Raises:
+            JiraAPIError: If the task is still running after timeout seconds, or for API errors
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                progress = self.jira.get(f"rest/api/3/bulk/queue/{task_id}")
+                if progress.get("status") in BULK_TASK_FINAL_STATES:
+                    return progress
+                if time.monotonic() >= deadline:
+                    raise JiraAPIError(f"Bulk task {task_id} still {progress.get('status')} after {timeout}s")
+                time.sleep(poll_interval)
+        except JiraAPIError:
+            raise
+        except Exception as e:
+            logger.error("Error checking bulk task %s: %s", task_id, e)
+            self._handle_error(e, "bulk task", task_id)
+
     def search_issues(
         self,
         jql: str,
-        fields: str = "*all",
+        fields: str = DEFAULT_SEARCH_FIELDS,
         start: int = 0,
         limit: int = 50,
         expand: Optional[str] = None,
+        batch_size: int = DEFAULT_SEARCH_BATCH_SIZE,
     ) -> List[Document]:
         """
         Search for issues using JQL (Jira Query Language).
 
         Args:
             jql: JQL query string
-            fields: Fields to return (comma-separated string or "*all")
+            fields: Fields to return (comma-separated string or "*all"), by default
+                only the fields the returned documents are built from
             start: Starting index
             limit: Maximum issues to return
             expand: Optional items to expand (comma-separated)
+            batch_size: Maximum issues requested per page while fetching up to limit
 
         Returns:
             List of Documents representing the search results
@@ -511,10 +973,9 @@ Description:
             JiraAPIError: For API errors including invalid JQL
         """
         try:
-            issues = self.jira.jql(jql, fields=fields, start=start, limit=limit, expand=expand)
             documents = []
 
-            for issue in issues.get("issues", []):
+            for issue in self._search_pages(jql, fields, start, limit, expand, batch_size):
                 issue_key = issue["key"]
                 summary = issue["fields"].get("summary", "")
                 issue_type = issue["fields"]["issuetype"]["name"]
@@ -522,6 +983,7 @@ Description:
                 desc = self._clean_text(issue["fields"].get("description", ""))
                 created_date = self._parse_date(issue["fields"]["created"])
                 priority = issue["fields"].get("priority", {}).get("name", "None")
+                self._remember_workflow(issue_key, issue_type, status)
 
                 # Add basic metadata
                 metadata = {
@@ -531,7 +993,7 @@ Description:
                     "status": status,
                     "created_date": created_date,
                     "priority": priority,
-                    "link": f"{self.config.url.rstrip('/')}/browse/{issue_key}",
+                    "link": self._browse_prefix + issue_key,
                 }
 
                 # Prepare content
@@ -541,9 +1003,56 @@ Description:
 
             return documents
         except Exception as e:
-            logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
+            logger.error("Error searching issues with JQL '%s': %s", jql, e)
             self._handle_error(e, "issues", f"search '{jql}'")
 
+    def _search_pages(
+        self,
+        jql: str,
+        fields: str,
+        start: int,
+        limit: int,
+        expand: Optional[str],
+        batch_size: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch up to limit issues matching a JQL query, batch_size issues per request.
+
+        Jira may return fewer issues per page than requested (e.g., Cloud caps pages
+        at 100), in which case the server's page size is used for the remaining pages.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return
+            start: Starting index
+            limit: Maximum issues to return
+            expand: Optional items to expand
+            batch_size: Maximum issues requested per page
+
+        Returns:
+            List of raw issues
+        """
+        issues: List[Dict[str, Any]] = []
+        offset = start
+        page_size = max(1, min(batch_size, limit))
+        while len(issues) < limit:
+            requested = min(page_size, limit - len(issues))
+            response = self.jira.jql(jql, fields=fields, start=offset, limit=requested, expand=expand)
+            page = response.get("issues", [])
+            issues.extend(page)
+            offset += len(page)
+
+            total = response.get("total")
+            if not page or (total is not None and offset >= total):
+                break
+            if len(page) < requested:
+                logger.warning(
+                    "Jira returned %s of %s requested issues for '%s', using page size %s",
+                    len(page), requested, jql, len(page),
+                )
+                page_size = len(page)
+        return issues
+
     def get_issue_comments(self, issue_key: str, limit: int = 50) -> List[Dict]:
         """
         Get comments for a specific issue.
@@ -560,24 +1069,33 @@ Description:
             JiraAPIError: For other API errors
         """
         try:
-            comments = self.jira.issue_get_comments(issue_key)
-            processed_comments = []
-
-            for comment in comments.get("comments", [])[:limit]:
-                processed_comment = {
-                    "id": comment.get("id"),
-                    "body": self._clean_text(comment.get("body", "")),
-                    "created": self._parse_date(comment.get("created")),
-                    "updated": self._parse_date(comment.get("updated")),
-                    "author": comment.get("author", {}).get("displayName", "Unknown"),
-                }
-                processed_comments.append(processed_comment)
-
-            return processed_comments
+            # Let Jira return only the comments that are used
+            comments = self.jira.get(
+                f"{self.jira.resource_url('issue')}/{issue_key}/comment", params={"maxResults": limit}
+            )
+            return [self._process_comment(comment) for comment in comments.get("comments", [])[:limit]]
         except Exception as e:
-            logger.error(f"Error getting comments for issue {issue_key}: {str(e)}")
+            logger.error("Error getting comments for issue %s: %s", issue_key, e)
             self._handle_error(e, "comments", issue_key)
 
+    def _process_comment(self, comment: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a comment returned by Jira into the form used in documents.
+
+        Args:
+            comment: Comment as returned by the Jira API
+
+        Returns:
+            Comment with id, cleaned body, creation and update dates, and author name
+        """
+        return {
+            "id": comment.get("id"),
+            "body": self._clean_text(comment.get("body", "")),
+            "created": self._parse_date(comment.get("created")),
+            "updated": self._parse_date(comment.get("updated")),
+            "author": comment.get("author", {}).get("displayName", "Unknown"),
+        }
+
     def add_comment(self, issue_key: str, comment: str) -> Dict:
         """
         Add a comment to an issue.
@@ -597,7 +1115,7 @@ Description:
             # Convert Markdown to Jira's markup format
             jira_formatted_comment = self._markdown_to_jira(comment)
 
-            result = self.jira.issue_add_comment(issue_key, jira_formatted_comment)
+            result = self._retry_rate_limited(self.jira.issue_add_comment, issue_key, jira_formatted_comment)
             return {
                 "id": result.get("id"),
                 "body": self._clean_text(result.get("body", "")),
@@ -605,7 +1123,7 @@ Description:
                 "author": result.get("author", {}).get("displayName", "Unknown"),
             }
         except Exception as e:
-            logger.error(f"Error adding comment to issue {issue_key}: {str(e)}")
+            logger.error("Error adding comment to issue %s: %s", issue_key, e)
             self._handle_error(e, "comment", issue_key)
 
     def get_available_transitions(self, issue_key: str) -> List[Dict]:
@@ -622,6 +1140,13 @@ Description:
             JiraResourceNotFoundError: If the issue is not found
             JiraAPIError: For other API errors
         """
+        # Issues fetched recently in the same workflow state share their transitions
+        workflow_key = self._workflow_keys.get(issue_key)
+        if workflow_key is not None:
+            cached = self._transitions_cache.get(workflow_key)
+            if cached is not None:
+                return list(cached)
+
         try:
             transitions_data = self.jira.get_issue_transitions(issue_key)
             result = []
@@ -635,7 +1160,7 @@ Description:
                 # Handle the case where the response is a list of transitions directly
                 transitions = transitions_data
             else:
-                logger.warning(f"Unexpected format for transitions data: {type(transitions_data)}")
+                logger.warning("Unexpected format for transitions data: %s", type(transitions_data))
                 return []
 
             for transition in transitions:
@@ -661,9 +1186,11 @@ Description:
 
                 result.append({"id": transition_id, "name": transition_name, "to_status": to_status})
 
-            return result
+            if workflow_key is not None:
+                self._transitions_cache.set(workflow_key, result)
+            return list(result)
         except Exception as e:
-            logger.error(f"Error getting transitions for issue {issue_key}: {str(e)}")
+            logger.error("Error getting transitions for issue %s: %s", issue_key, e)
             self._handle_error(e, "transitions", issue_key)
 
     def transition_issue(
@@ -690,7 +1217,9 @@ Description:
             # Ensure transition_id is a string
             if not isinstance(transition_id, str):
                 logger.warning(
-                    f"transition_id must be a string, converting from {type(transition_id)}: {transition_id}"
+                    "transition_id must be a string, converting from %s: %s",
+                    type(transition_id),
+                    transition_id,
                 )
                 transition_id = str(transition_id)
 
@@ -724,27 +1253,29 @@ Description:
             # Add comment if provided
             if comment:
                 if not isinstance(comment, str):
-                    logger.warning(f"Comment must be a string, converting from {type(comment)}: {comment}")
+                    logger.warning("Comment must be a string, converting from %s: %s", type(comment), comment)
                     comment = str(comment)
 
                 jira_formatted_comment = self._markdown_to_jira(comment)
                 transition_data["update"] = {"comment": [{"add": {"body": jira_formatted_comment}}]}
 
             # Log the transition request for debugging
-            logger.info(f"Transitioning issue {issue_key} with transition ID {transition_id}")
-            logger.debug(f"Transition data: {transition_data}")
+            logger.info("Transitioning issue %s with transition ID %s", issue_key, transition_id)
+            logger.debug("Transition data: %s", transition_data)
 
-            # Perform the transition
-            self.jira.issue_transition(issue_key, transition_data)
+            # Perform the transition, after which the issue is in a different workflow state
+            self._retry_rate_limited(self.jira.issue_transition, issue_key, transition_data)
+            self._workflow_keys.discard(issue_key)
 
             # Return the updated issue
             return self.get_issue(issue_key)
         except Exception as e:
-            error_msg = f"Error transitioning issue {issue_key} with transition ID {transition_id}: {str(e)}"
+            message = str(e)
+            error_msg = f"Error transitioning issue {issue_key} with transition ID {transition_id}: {message}"
             logger.error(error_msg)
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
+            if _NOT_FOUND_PATTERN.search(message):
                 raise JiraResourceNotFoundError(error_msg)
-            if "workflow" in str(e).lower() or "transition" in str(e).lower():
+            if _WORKFLOW_ERROR_PATTERN.search(message):
                 raise JiraWorkflowError(error_msg)
             raise JiraAPIError(error_msg)
 
@@ -766,68 +1297,109 @@ Description:
         """
         try:
             # First, check if the epic exists and is an Epic type
-            epic = self.jira.issue(epic_key)
-            if epic["fields"]["issuetype"]["name"] != "Epic":
-                raise JiraIssueTypeError(
-                    f"Issue {epic_key} is not an Epic, it is a {epic['fields']['issuetype']['name']}"
-                )
+            issue_type = self._get_issue_type(epic_key)
+            if issue_type != "Epic":
+                raise JiraIssueTypeError(f"Issue {epic_key} is not an Epic, it is a {issue_type}")
 
-            # Get the dynamic field IDs for this Jira instance
+            # Candidate fields in order: the native parent field, the discovered Epic Link
+            # field, then custom fields common in Jira Cloud and Server
             field_ids = self.get_jira_field_ids()
-
-            # Try the parent field first (if discovered or natively supported)
-            if "parent" in field_ids or "parent" not in field_ids:
-                try:
-                    fields = {"parent": {"key": epic_key}}
-                    self.jira.issue_update(issue_key, fields=fields)
-                    return self.get_issue(issue_key)
-                except Exception as e:
-                    logger.info(f"Couldn't link using parent field: {str(e)}. Trying discovered fields...")
-
-            # Try using the discovered Epic Link field
-            if "epic_link" in field_ids:
-                try:
-                    epic_link_fields: Dict[str, str] = {field_ids["epic_link"]: epic_key}
-                    self.jira.issue_update(issue_key, fields=epic_link_fields)
-                    return self.get_issue(issue_key)
-                except Exception as e:
-                    logger.info(f"Couldn't link using discovered epic_link field: {str(e)}. Trying fallback methods...")
-
-            # Fallback to common custom fields if dynamic discovery didn't work
-            custom_field_attempts: List[Dict[str, str]] = [
-                {"customfield_10014": epic_key},  # Common in Jira Cloud
-                {"customfield_10000": epic_key},  # Common in Jira Server
-                {"epic_link": epic_key},  # Sometimes used
-            ]
-
-            for fields in custom_field_attempts:
+            candidates = ["parent", field_ids.get("epic_link")]
+            # The common custom fields are skipped while they keep failing on this instance
+            try_fallbacks = time.monotonic() >= self._epic_link_fallbacks_open_until
+            if try_fallbacks:
+                candidates.extend(DEFAULT_EPIC_LINK_FIELDS)
+            # Start with the field that last worked on this instance
+            if self._epic_link_field:
+                candidates.insert(0, self._epic_link_field)
+
+            for field in dict.fromkeys(candidate for candidate in candidates if candidate):
+                value = {"key": epic_key} if field == "parent" else epic_key
                 try:
-                    self.jira.issue_update(issue_key, fields=fields)
-                    return self.get_issue(issue_key)
+                    self.jira.issue_update(issue_key, fields={field: value})
                 except Exception as e:
-                    logger.info(f"Couldn't link using fields {fields}: {str(e)}")
+                    logger.info("Couldn't link using field %s: %s", field, e)
                     continue
-
-            # If we get here, none of our attempts worked
+                self._epic_link_field = field
+                self._epic_link_fallback_failures = 0
+                return self.get_issue(issue_key)
+
+            # If we get here, none of our attempts worked. After too many such links in a row,
+            # stop trying the fallbacks for a while; one more failure afterwards stops them again.
+            if try_fallbacks:
+                self._epic_link_fallback_failures += 1
+                if self._epic_link_fallback_failures >= EPIC_LINK_BREAKER_THRESHOLD:
+                    logger.warning(
+                        "Epic link fallback fields failed for %s links in a row, skipping them for %ss",
+                        self._epic_link_fallback_failures,
+                        EPIC_LINK_BREAKER_SECONDS,
+                    )
+                    self._epic_link_fallbacks_open_until = time.monotonic() + EPIC_LINK_BREAKER_SECONDS
             raise JiraAPIError(
                 f"Could not link issue {issue_key} to epic {epic_key}. Your Jira instance might use a different field for epic links."
             )
 
         except Exception as e:
-            logger.error(f"Error linking issue {issue_key} to epic {epic_key}: {str(e)}")
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
-                raise JiraResourceNotFoundError(str(e))
+            logger.error("Error linking issue %s to epic %s: %s", issue_key, epic_key, e)
+            message = str(e)
+            if _NOT_FOUND_PATTERN.search(message):
+                raise JiraResourceNotFoundError(message)
             if isinstance(e, JiraIssueTypeError):
                 raise
             self._handle_error(e, "issue", f"linking {issue_key} to {epic_key}")
 
-    def get_epic_issues(self, epic_key: str, limit: int = 50) -> List[Document]:
+    def link_issues_to_epic(
+        self, issue_keys: List[str], epic_key: str, max_workers: int = MAX_CONCURRENT_EPIC_LINKS
+    ) -> List[Document]:
+        """
+        Link several existing issues to an epic concurrently.
+
+        The first issue is linked on its own, which checks the epic and finds the
+        field that works on this instance; the other issues then reuse both.
+
+        Args:
+            issue_keys: Keys of the issues to link (e.g., ['PROJ-123', 'PROJ-124'])
+            epic_key: The key of the epic to link to (e.g., 'PROJ-456')
+            max_workers: Maximum number of issues linked at the same time
+
+        Returns:
+            Documents representing the updated issues, in the order of issue_keys
+
+        Raises:
+            JiraResourceNotFoundError: If an issue or the epic is not found
+            JiraIssueTypeError: If the epic_key does not refer to an Epic
+            JiraAPIError: For other API errors
+        """
+        if not issue_keys:
+            return []
+
+        documents = [self.link_issue_to_epic(issue_keys[0], epic_key)]
+        if len(issue_keys) > 1:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(issue_keys) - 1))) as executor:
+                documents.extend(executor.map(lambda key: self.link_issue_to_epic(key, epic_key), issue_keys[1:]))
+        return documents
+
+    def get_epic_issues(
+        self,
+        epic_key: str,
+        limit: int = 50,
+        batch_size: int = DEFAULT_SEARCH_BATCH_SIZE,
+        *,
+        try_fallbacks: bool = False,
+    ) -> List[Document]:
         """
         Get all issues linked to a specific epic.
 
+        Queries on the discovered parent or Epic Link field are trusted: if one of
+        them succeeds, its result is returned even when empty. The common fallback
+        queries only run if no field was discovered or those queries failed.
+
         Args:
             epic_key: The key of the epic (e.g., 'PROJ-123')
             limit: Maximum number of issues to return
+            batch_size: Maximum issues requested per page while fetching up to limit
+            try_fallbacks: Also try the fallback queries when the discovered fields
+                find no issues
 
         Returns:
             List of Documents representing the issues linked to the epic
@@ -839,63 +1411,85 @@ Description:
         """
         try:
             # First, check if the issue is an Epic
-            epic = self.jira.issue(epic_key)
-            if epic["fields"]["issuetype"]["name"] != "Epic":
-                raise JiraIssueTypeError(f"Issue {epic_key} is not an Epic, it is a {epic['fields']['issuetype']['name']}")
+            issue_type = self._get_issue_type(epic_key)
+            if issue_type != "Epic":
+                raise JiraIssueTypeError(f"Issue {epic_key} is not an Epic, it is a {issue_type}")
 
             # Get the dynamic field IDs for this Jira instance
             field_ids = self.get_jira_field_ids()
 
             # Build JQL queries based on discovered field IDs
-            jql_queries = []
+            discovered_queries = []
 
             # Add queries based on discovered fields
             if "parent" in field_ids:
-                jql_queries.append(f"parent = {epic_key}")
+                discovered_queries.append(f"parent = {epic_key}")
 
             if "epic_link" in field_ids:
                 field_name = field_ids["epic_link"]
-                jql_queries.append(f'"{field_name}" = {epic_key}')
-                jql_queries.append(f'"{field_name}" ~ {epic_key}')
+                discovered_queries.append(f'"{field_name}" = {epic_key}')
+                discovered_queries.append(f'"{field_name}" ~ {epic_key}')
+
+            # A query on a discovered field that runs is trusted, even when the epic has no issues
+            authoritative_queries = set() if try_fallbacks else set(discovered_queries)
 
             # Add standard fallback queries
-            jql_queries.extend(
-                [
-                    f"parent = {epic_key}",  # Common in most instances
-                    f"'Epic Link' = {epic_key}",  # Some instances
-                    f"'Epic' = {epic_key}",  # Some instances
-                    f"issue in childIssuesOf('{epic_key}')",  # Some instances
-                ]
-            )
+            jql_queries = [
+                *discovered_queries,
+                f"parent = {epic_key}",  # Common in most instances
+                f"'Epic Link' = {epic_key}",  # Some instances
+                f"'Epic' = {epic_key}",  # Some instances
+                f"issue in childIssuesOf('{epic_key}')",  # Some instances
+            ]
+
+            # Run the queries a few at a time, but keep their order when picking the result.
+            # A discovered field is almost always the right one, so then run them one by one.
+            jql_queries = list(dict.fromkeys(jql_queries))
+            should_parallelize = not discovered_queries
+
+            def search(jql: str) -> List[Document]:
+                logger.info("Trying to get epic issues with JQL: %s", jql)
+                return self.search_issues(jql, limit=limit, batch_size=batch_size)
 
-            # Try each query until we get results or run out of options
             documents = []
-            for jql in jql_queries:
-                try:
-                    logger.info(f"Trying to get epic issues with JQL: {jql}")
-                    documents = self.search_issues(jql, limit=limit)
-                    if documents:
+            executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_EPIC_QUERIES if should_parallelize else 1)
+            try:
+                futures = [executor.submit(search, jql) for jql in jql_queries]
+                for jql, future in zip(jql_queries, futures, strict=True):
+                    try:
+                        documents = future.result()
+                    except Exception as e:
+                        logger.info("Failed to get epic issues with JQL '%s': %s", jql, e)
+                        continue
+                    if documents or jql in authoritative_queries:
                         return documents
-                except Exception as e:
-                    logger.info(f"Failed to get epic issues with JQL '{jql}': {str(e)}")
-                    continue
+            finally:
+                # Queries still waiting to run are not needed once one has returned issues
+                executor.shutdown(wait=False, cancel_futures=True)
 
             # If we've tried all queries and got no results, return an empty list
             # but also log a warning that we might be missing the right field
             if not documents:
                 logger.warning(
-                    f"Couldn't find issues linked to epic {epic_key}. Your Jira instance might use a different field for epic links."
+                    "Couldn't find issues linked to epic %s. Your Jira instance might use a different field for epic links.",
+                    epic_key,
                 )
 
             return documents
 
         except Exception as e:
-            logger.error(f"Error getting issues for epic {epic_key}: {str(e)}")
+            logger.error("Error getting issues for epic %s: %s", epic_key, e)
             if isinstance(e, JiraIssueTypeError):
                 raise
             self._handle_error(e, "epic", epic_key)
 
-    def get_project_issues(self, project_key: str, start: int = 0, limit: int = 50) -> List[Document]:
+    def get_project_issues(
+        self,
+        project_key: str,
+        start: int = 0,
+        limit: int = 50,
+        batch_size: int = DEFAULT_SEARCH_BATCH_SIZE,
+    ) -> List[Document]:
         """
         Get all issues for a project.
 
@@ -903,6 +1497,7 @@ Description:
             project_key: The project key
             start: Starting index
             limit: Maximum results to return
+            batch_size: Maximum issues requested per page while fetching up to limit
 
         Returns:
             List of Documents containing project issues
@@ -912,7 +1507,7 @@ Description:
             JiraAPIError: For other API errors
         """
         jql = f"project = {project_key} ORDER BY created DESC"
-        return self.search_issues(jql, start=start, limit=limit)
+        return self.search_issues(jql, start=start, limit=limit, batch_size=batch_size)
 
     def _parse_time_spent(self, time_spent: str) -> int:
         """
@@ -930,28 +1525,14 @@ Description:
         if not time_spent:
             raise ValueError("Time spent string cannot be empty")
 
-        # Define time unit conversions to seconds
-        units = {
-            "w": 7 * 24 * 60 * 60,  # weeks
-            "d": 24 * 60 * 60,  # days
-            "h": 60 * 60,  # hours
-            "m": 60,  # minutes
-        }
-
         # Extract all time components (e.g., '1h', '30m')
-        pattern = r"(\d+)([wdhm])"
-        matches = re.findall(pattern, time_spent.lower())
+        matches = _TIME_SPENT_PATTERN.findall(time_spent.lower())
 
         if not matches:
             raise ValueError(f"Invalid time format: {time_spent}. Expected format like '1h 30m', '1d', etc.")
 
         # Calculate total seconds
-        total_seconds = 0
-        for value, unit in matches:
-            if unit in units:
-                total_seconds += int(value) * units[unit]
-
-        return total_seconds
+        return sum(int(value) * _TIME_UNIT_SECONDS[unit] for value, unit in matches)
 
     def add_worklog(
         self,
@@ -998,9 +1579,9 @@ Description:
                     fields = {"timetracking": {"originalEstimate": original_estimate}}
                     self.jira.edit_issue(issue_id_or_key=issue_key, fields=fields)
                     original_estimate_updated = True
-                    logger.info(f"Updated original estimate for issue {issue_key}")
+                    logger.info("Updated original estimate for issue %s", issue_key)
                 except Exception as e:
-                    logger.error(f"Failed to update original estimate for issue {issue_key}: {str(e)}")
+                    logger.error("Failed to update original estimate for issue %s: %s", issue_key, e)
                     # Continue with worklog creation even if estimate update fails
 
             # Step 2: Prepare worklog data
@@ -1021,25 +1602,44 @@ Description:
             # Step 4: Add the worklog with remaining estimate adjustment
             base_url = self.jira.resource_url("issue")
             url = f"{base_url}/{issue_key}/worklog"
-            result = self.jira.post(url, data=worklog_data, params=params)
+            result = self._retry_rate_limited(self.jira.post, url, data=worklog_data, params=params)
 
             # Format and return the result
             return {
-                "id": result.get("id"),
-                "comment": self._clean_text(result.get("comment", "")),
-                "created": self._parse_date(result.get("created", "")),
-                "updated": self._parse_date(result.get("updated", "")),
-                "started": self._parse_date(result.get("started", "")),
-                "timeSpent": result.get("timeSpent", ""),
-                "timeSpentSeconds": result.get("timeSpentSeconds", 0),
-                "author": result.get("author", {}).get("displayName", "Unknown"),
+                **self._format_worklog(result),
                 "original_estimate_updated": original_estimate_updated,
                 "remaining_estimate_updated": remaining_estimate_updated,
             }
         except Exception as e:
-            logger.error(f"Error adding worklog to issue {issue_key}: {str(e)}")
+            logger.error("Error adding worklog to issue %s: %s", issue_key, e)
             self._handle_error(e, "worklog", issue_key)
 
+    def _format_worklog(self, worklog: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format a worklog returned by Jira.
+
+        Missing timestamps are left empty without calling the date parser.
+
+        Args:
+            worklog: Worklog data from the Jira API
+
+        Returns:
+            The worklog's comment, times and author
+        """
+        created = worklog.get("created")
+        updated = worklog.get("updated")
+        started = worklog.get("started")
+        return {
+            "id": worklog.get("id"),
+            "comment": self._clean_text(worklog.get("comment", "")),
+            "created": _parse_date_string(created) if created else "",
+            "updated": _parse_date_string(updated) if updated else "",
+            "started": _parse_date_string(started) if started else "",
+            "timeSpent": worklog.get("timeSpent", ""),
+            "timeSpentSeconds": worklog.get("timeSpentSeconds", 0),
+            "author": worklog.get("author", {}).get("displayName", "Unknown"),
+        }
+
     def get_worklogs(self, issue_key: str) -> List[Dict]:
         """
         Get worklogs for an issue.
@@ -1054,26 +1654,40 @@ Description:
             JiraResourceNotFoundError: If the issue is not found
             JiraAPIError: For other API errors
         """
-        try:
-            result = self.jira.issue_get_worklog(issue_key)
-
-            # Process the worklogs
-            worklogs = []
-            for worklog in result.get("worklogs", []):
-                worklogs.append(
-                    {
-                        "id": worklog.get("id"),
-                        "comment": self._clean_text(worklog.get("comment", "")),
-                        "created": self._parse_date(worklog.get("created", "")),
-                        "updated": self._parse_date(worklog.get("updated", "")),
-                        "started": self._parse_date(worklog.get("started", "")),
-                        "timeSpent": worklog.get("timeSpent", ""),
-                        "timeSpentSeconds": worklog.get("timeSpentSeconds", 0),
-                        "author": worklog.get("author", {}).get("displayName", "Unknown"),
-                    }
-                )
+        return list(self.iter_worklogs(issue_key))
+
+    def iter_worklogs(self, issue_key: str, page_size: int = WORKLOG_PAGE_SIZE) -> Iterator[Dict]:
+        """
+        Iterate over the worklogs of an issue, one page at a time.
+
+        Unlike get_worklogs, worklogs are yielded as each page arrives, so issues
+        with thousands of worklogs never have to be held in memory at once.
+
+        Args:
+            issue_key: The issue key (e.g., 'PROJ-123')
+            page_size: Number of worklogs requested per page
 
-            return worklogs
+        Yields:
+            Worklog entries
+
+        Raises:
+            JiraResourceNotFoundError: If the issue is not found
+            JiraAPIError: For other API errors
+        """
+        try:
+            url = f"{self.jira.resource_url('issue')}/{issue_key}/worklog"
+
+            start = 0
+            while True:
+                result = self.jira.get(url, params={"startAt": start, "maxResults": page_size})
+                worklogs = result.get("worklogs", [])
+                for worklog in worklogs:
+                    yield self._format_worklog(worklog)
+
+                start += len(worklogs)
+                total = result.get("total")
+                if not worklogs or (start >= total if total is not None else len(worklogs) < page_size):
+                    return
         except Exception as e:
-            logger.error(f"Error getting worklogs for issue {issue_key}: {str(e)}")
+            logger.error("Error getting worklogs for issue %s: %s", issue_key, e)
             self._handle_error(e, "worklogs", issue_key)
@@ -21,6 +21,8 @@ class BoardColumnStatus(BaseModel):
     id: str = Field(..., description="ID statusu")
     name: str = Field(..., description="Nazwa statusu")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class BoardColumn(BaseModel):
     """Kolumna tablicy."""
@@ -4,7 +4,7 @@ Pydantic models for Jira issues and related objects.
 
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class User(BaseModel):
@@ -15,6 +15,8 @@ class User(BaseModel):
     email: Optional[str] = None
     active: Optional[bool] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class IssueType(BaseModel):
     """Represents a Jira issue type."""
@@ -22,9 +24,11 @@ class IssueType(BaseModel):
     id: Optional[str] = None
     name: str
     description: Optional[str] = None
-    icon_url: Optional[HttpUrl] = None
+    icon_url: Optional[str] = None
     subtask: Optional[bool] = False
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Status(BaseModel):
     """Represents a Jira issue status."""
@@ -35,6 +39,8 @@ class Status(BaseModel):
     category_id: Optional[str] = None
     category_name: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Priority(BaseModel):
     """Represents a Jira issue priority."""
@@ -42,7 +48,9 @@ class Priority(BaseModel):
     id: Optional[str] = None
     name: str
     description: Optional[str] = None
-    icon_url: Optional[HttpUrl] = None
+    icon_url: Optional[str] = None
+
+    model_config = ConfigDict(frozen=True)
 
 
 class Project(BaseModel):
@@ -52,7 +60,7 @@ class Project(BaseModel):
     key: str
     name: Optional[str] = None
     description: Optional[str] = None
-    url: Optional[HttpUrl] = None
+    url: Optional[str] = None
     lead: Optional[User] = None
 
 
@@ -146,9 +154,6 @@ class Issue(IssueBase):
     sub_tasks: Optional[List[Dict[str, Any]]] = None
     transitions: Optional[List[Transition]] = None
     custom_fields: Optional[Dict[str, Any]] = Field(default_factory=dict)
-    url: Optional[HttpUrl] = None
-
-    class Config:
-        """Configuration for the Issue model."""
+    url: Optional[str] = None
 
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -2,9 +2,8 @@
 Pydantic models for Jira projects and related objects.
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProjectTypeReference(BaseModel):
@@ -13,6 +12,8 @@ class ProjectTypeReference(BaseModel):
     key: str = Field(..., description="Project type key")
     name: str = Field(..., description="Project type name")
     description: Optional[str] = Field(None, description="Project type description")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class ProjectCategoryReference(BaseModel):
@@ -21,6 +22,8 @@ class ProjectCategoryReference(BaseModel):
     id: str = Field(..., description="Project category ID")
     name: str = Field(..., description="Project category name")
     description: Optional[str] = Field(None, description="Project category description")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class ProjectLeadReference(BaseModel):
@@ -31,8 +34,7 @@ class ProjectLeadReference(BaseModel):
     email_address: Optional[str] = Field(None, description="Project lead email address", alias="emailAddress")
     active: Optional[bool] = Field(None, description="Whether the project lead is active")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(frozen=True, defer_build=True, populate_by_name=True)
 
 
 class ProjectComponentReference(BaseModel):
@@ -44,8 +46,7 @@ class ProjectComponentReference(BaseModel):
     lead: Optional[ProjectLeadReference] = Field(None, description="Component lead")
     assignee_type: Optional[str] = Field(None, description="Component assignee type", alias="assigneeType")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(frozen=True, defer_build=True, populate_by_name=True)
 
 
 class ProjectVersionReference(BaseModel):
@@ -59,8 +60,7 @@ class ProjectVersionReference(BaseModel):
     release_date: Optional[str] = Field(None, description="Version release date", alias="releaseDate")
     start_date: Optional[str] = Field(None, description="Version start date", alias="startDate")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(frozen=True, defer_build=True, populate_by_name=True)
 
 
 class ProjectRoleReference(BaseModel):
@@ -69,6 +69,8 @@ class ProjectRoleReference(BaseModel):
     id: str = Field(..., description="Role ID")
     name: str = Field(..., description="Role name")
     description: Optional[str] = Field(None, description="Role description")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class ProjectComponentCreate(BaseModel):
@@ -80,8 +82,7 @@ class ProjectComponentCreate(BaseModel):
     assignee_type: Optional[str] = Field(None, description="Assignee type", alias="assigneeType")
     project: str = Field(..., description="Project key or ID")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
 
 
 class ProjectComponentUpdate(BaseModel):
@@ -92,8 +93,7 @@ class ProjectComponentUpdate(BaseModel):
     lead_account_id: Optional[str] = Field(None, description="New lead account ID", alias="leadAccountId")
     assignee_type: Optional[str] = Field(None, description="New assignee type", alias="assigneeType")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
 
 
 class ProjectVersionCreate(BaseModel):
@@ -107,8 +107,7 @@ class ProjectVersionCreate(BaseModel):
     released: bool = Field(False, description="Whether the version is released")
     archived: bool = Field(False, description="Whether the version is archived")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
 
 
 class ProjectVersionUpdate(BaseModel):
@@ -121,8 +120,7 @@ class ProjectVersionUpdate(BaseModel):
     released: Optional[bool] = Field(None, description="Whether the version is released")
     archived: Optional[bool] = Field(None, description="Whether the version is archived")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
 
 
 class ProjectCreate(BaseModel):
@@ -141,8 +139,7 @@ class ProjectCreate(BaseModel):
     notification_scheme: Optional[int] = Field(None, description="Notification scheme ID", alias="notificationScheme")
     workflow_scheme: Optional[int] = Field(None, description="Workflow scheme ID", alias="workflowScheme")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
 
 
 class ProjectUpdate(BaseModel):
@@ -156,8 +153,7 @@ class ProjectUpdate(BaseModel):
     avatar_id: Optional[int] = Field(None, description="Avatar ID", alias="avatarId")
     category_id: Optional[int] = Field(None, description="Category ID", alias="categoryId")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
 
 
 class ProjectCategoryCreate(BaseModel):
@@ -165,6 +161,8 @@ class ProjectCategoryCreate(BaseModel):
     
     name: str = Field(..., description="Category name")
     description: Optional[str] = Field(None, description="Category description")
+    
+    model_config = ConfigDict(defer_build=True)
 
 
 class ProjectCategoryUpdate(BaseModel):
@@ -172,6 +170,8 @@ class ProjectCategoryUpdate(BaseModel):
     
     name: Optional[str] = Field(None, description="New category name")
     description: Optional[str] = Field(None, description="New category description")
+    
+    model_config = ConfigDict(defer_build=True)
 
 
 class Project(BaseModel):
@@ -192,6 +192,6 @@ class Project(BaseModel):
     versions: List[ProjectVersionReference] = Field([], description="Project versions")
     category: Optional[ProjectCategoryReference] = Field(None, description="Project category")
     properties: Optional[Dict[str, Any]] = Field(None, description="Project properties")
+    issue_types: List[Dict[str, Any]] = Field([], description="Project issue types", alias="issueTypes")
     
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
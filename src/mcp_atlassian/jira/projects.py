@@ -6,13 +6,20 @@ including retrieving, creating, updating and deleting projects, as well as manag
 components, versions, roles, and properties.
 """
 
-from typing import Dict, List, Optional, Any, Union
-from pydantic import ValidationError
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Any, Union
+from pydantic import TypeAdapter, ValidationError
 
+from ..cache import TTLCache
 from .client import JiraClient
 from .exceptions import JiraAPIError, JiraValidationError
 from .models.project import (
     Project,
+    ProjectCategoryReference,
+    ProjectComponentReference,
+    ProjectLeadReference,
+    ProjectTypeReference,
+    ProjectVersionReference,
     ProjectCreate,
     ProjectUpdate,
     ProjectComponentCreate,
@@ -23,6 +30,76 @@ from .models.project import (
     ProjectCategoryUpdate,
 )
 
+# Expanded when listing projects for their issue types, so they aren't fetched one project at a time
+PROJECT_ISSUE_TYPES_EXPAND = "issueTypes"
+
+# Page size of the project search endpoint
+PROJECT_SEARCH_PAGE_SIZE = 50
+
+# Lifetime of cached project listings
+PROJECTS_CACHE_TTL_SECONDS = 300
+
+# Lifetime of cached project types and categories, which rarely change
+PROJECT_METADATA_CACHE_TTL_SECONDS = 3600
+
+
+def _lead_from_api(data: Optional[Dict[str, Any]]) -> Optional[ProjectLeadReference]:
+    """Build an unvalidated project lead reference from Jira response data."""
+    return ProjectLeadReference.model_construct(**data) if data is not None else None
+
+
+def _project_from_api(data: Dict[str, Any], *, trusted: bool = False) -> Project:
+    """
+    Build a Project from Jira response data.
+
+    Args:
+        data: Raw project data returned by Jira
+        trusted: Construct the model, including its nested references, without
+            validation (JIRA_TRUST_RESPONSES)
+
+    Returns:
+        Project object
+    """
+    if not trusted:
+        return Project.model_validate(data)
+
+    values = dict(data)
+    values["lead"] = _lead_from_api(values.get("lead"))
+    if values.get("projectType") is not None:
+        values["projectType"] = ProjectTypeReference.model_construct(**values["projectType"])
+    if values.get("category") is not None:
+        values["category"] = ProjectCategoryReference.model_construct(**values["category"])
+    values["components"] = [
+        ProjectComponentReference.model_construct(**{**component, "lead": _lead_from_api(component.get("lead"))})
+        for component in values.get("components") or []
+    ]
+    values["versions"] = [
+        ProjectVersionReference.model_construct(**version) for version in values.get("versions") or []
+    ]
+    return Project.model_construct(**values)
+
+
+@lru_cache(maxsize=1)
+def _projects_adapter() -> TypeAdapter:
+    """Return the adapter validating a whole project listing in one call, built on first use."""
+    return TypeAdapter(List[Project])
+
+
+def _projects_from_api(data: List[Dict[str, Any]], *, trusted: bool = False) -> List[Project]:
+    """
+    Build Projects from a Jira project listing.
+
+    Args:
+        data: Raw project data returned by Jira
+        trusted: Construct the models without validation (JIRA_TRUST_RESPONSES)
+
+    Returns:
+        List of Project objects
+    """
+    if trusted:
+        return [_project_from_api(project, trusted=True) for project in data]
+    return _projects_adapter().validate_python(data)
+
 
 class ProjectManager:
     """
@@ -33,14 +110,38 @@ class ProjectManager:
     project components, versions, roles, and other related resources.
     """
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: JiraClient, *, cache_metadata: bool = True):
         """
         Initialize a new ProjectManager.
         
         Args:
             client: JiraClient instance for interacting with the Jira API
+            cache_metadata: Whether to cache project types and categories
         """
         self.client = client
+        self._projects_cache = TTLCache(maxsize=32, ttl=PROJECTS_CACHE_TTL_SECONDS)
+        self._metadata_cache = (
+            TTLCache(maxsize=64, ttl=PROJECT_METADATA_CACHE_TTL_SECONDS) if cache_metadata else None
+        )
+
+    def _get_metadata(self, cache_key: tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Return cached project metadata, fetching and caching it on a miss.
+
+        Args:
+            cache_key: Cache key
+            fetch: Function fetching the metadata from Jira
+
+        Returns:
+            The metadata
+        """
+        if self._metadata_cache is None:
+            return fetch()
+        cached = self._metadata_cache.get(cache_key)
+        if cached is None:
+            cached = fetch()
+            self._metadata_cache.set(cache_key, cached)
+        return cached
 
     def get_projects(
         self,
@@ -56,9 +157,12 @@ class ProjectManager:
     ) -> List[Project]:
         """
         Retrieve a list of projects from Jira.
+
+        On Jira Cloud all pages of the project search endpoint are fetched. Results
+        are cached for a few minutes.
         
         Args:
-            recent: Limit results to specified number of recently viewed projects
+            recent: Limit results to specified number of recently viewed projects (Server/Data Center)
             expand: Additional fields to expand (e.g., 'description,lead')
             order_by: Field to sort results by (e.g., 'key', 'name')
             query: Search string to filter projects by name or key
@@ -91,13 +195,68 @@ class ProjectManager:
             params["action"] = action
         if properties:
             params["properties"] = ",".join(properties)
+
+        cache_key = tuple(sorted(params.items()))
+        cached = self._projects_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
         
         try:
-            projects_data = self.client.jira.projects(**params)
-            return [Project.model_validate(p) for p in projects_data]
+            projects = _projects_from_api(
+                self._fetch_projects(params), trusted=self.client.config.trust_responses
+            )
+            self._projects_cache.set(cache_key, projects)
+            return list(projects)
         except Exception as e:
             self.client._handle_error(e, "projects", "")
 
+    def _fetch_projects(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Fetch raw project data, following the search endpoint's pages on Jira Cloud.
+
+        Args:
+            params: Query parameters
+
+        Returns:
+            List of raw project data
+        """
+        if not self.client.jira.cloud:
+            return self.client.jira.get("rest/api/2/project", params=params)
+
+        projects_data: List[Dict[str, Any]] = []
+        start_at = 0
+        while True:
+            page = self.client.jira.get(
+                "rest/api/2/project/search",
+                params={**params, "startAt": start_at, "maxResults": PROJECT_SEARCH_PAGE_SIZE},
+            )
+            values = page.get("values", [])
+            projects_data.extend(values)
+            if page.get("isLast", True) or not values:
+                return projects_data
+            start_at += len(values)
+
+    def get_project_issue_types(self, project_key_or_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve the issue types of a project.
+
+        Issue types are read from a cached project listing with issue types expanded,
+        when the project is in it.
+
+        Args:
+            project_key_or_id: Project key or ID
+
+        Returns:
+            List of issue types
+
+        Raises:
+            JiraResourceNotFoundError: If the project doesn't exist
+        """
+        for project in self.get_projects(expand=PROJECT_ISSUE_TYPES_EXPAND):
+            if project_key_or_id in (project.key, project.id):
+                return project.issue_types
+        return self.get_project(project_key_or_id, expand="issueTypes").issue_types
+
     def get_project(
         self,
         project_key_or_id: str,
@@ -128,7 +287,7 @@ class ProjectManager:
         
         try:
             project_data = self.client.jira.project(project_key_or_id, **params)
-            return Project.model_validate(project_data)
+            return _project_from_api(project_data, trusted=self.client.config.trust_responses)
         except Exception as e:
             self.client._handle_error(e, "project", project_key_or_id)
 
@@ -293,18 +452,22 @@ class ProjectManager:
     def get_project_types(self) -> List[Dict[str, Any]]:
         """
         Retrieve available project types.
+
+        Results are cached for an hour unless metadata caching is disabled.
         
         Returns:
             List of project types
         """
         try:
-            return self.client.jira.get_all_project_types()
+            return self._get_metadata(("types",), self.client.jira.get_all_project_types)
         except Exception as e:
             self.client._handle_error(e, "project types", "")
 
     def get_project_type(self, type_key: str) -> Dict[str, Any]:
         """
         Retrieve details of a specific project type.
+
+        Results are cached for an hour unless metadata caching is disabled.
         
         Args:
             type_key: Project type key (e.g., 'software', 'business')
@@ -316,25 +479,31 @@ class ProjectManager:
             JiraResourceNotFoundError: If the project type doesn't exist
         """
         try:
-            return self.client.jira.get_project_type_by_key(type_key)
+            return self._get_metadata(
+                ("type", type_key), lambda: self.client.jira.get_project_type_by_key(type_key)
+            )
         except Exception as e:
             self.client._handle_error(e, "project type", type_key)
 
     def get_project_categories(self) -> List[Dict[str, Any]]:
         """
         Retrieve project categories.
+
+        Results are cached for an hour unless metadata caching is disabled.
         
         Returns:
             List of project categories
         """
         try:
-            return self.client.jira.get_all_project_categories()
+            return self._get_metadata(("categories",), self.client.jira.get_all_project_categories)
         except Exception as e:
             self.client._handle_error(e, "project categories", "")
 
     def get_project_category(self, category_id: str) -> Dict[str, Any]:
         """
         Retrieve details of a specific project category.
+
+        Results are cached for an hour unless metadata caching is disabled.
         
         Args:
             category_id: Category ID
@@ -346,7 +515,9 @@ class ProjectManager:
             JiraResourceNotFoundError: If the category doesn't exist
         """
         try:
-            return self.client.jira.get_project_category(category_id)
+            return self._get_metadata(
+                ("category", category_id), lambda: self.client.jira.get_project_category(category_id)
+            )
         except Exception as e:
             self.client._handle_error(e, "project category", category_id)
 
@@ -408,13 +579,15 @@ class ProjectManager:
                 workflow_scheme=workflow_scheme,
                 **kwargs
             ).model_dump(by_alias=True, exclude_none=True)  # Updated from dict() to model_dump()
-            
+        except ValidationError as e:
+            raise JiraValidationError("Invalid project data", errors=e.errors()) from e
+
+        try:
             # Create project through API
             created_project = self.client.jira.create_project(**project_data)
+            self._projects_cache.clear()
             
-            return Project.model_validate(created_project)
-        except ValidationError as e:
-            raise JiraValidationError(f"Invalid project data: {str(e)}")
+            return _project_from_api(created_project, trusted=self.client.config.trust_responses)
         except Exception as e:
             self.client._handle_error(e, "project creation", key)
 
@@ -464,17 +637,19 @@ class ProjectManager:
                 category_id=category_id,
                 **kwargs
             ).model_dump(by_alias=True, exclude_none=True)
-            
-            # Don't send the request if there are no changes
-            if not project_data:
-                return self.get_project(project_key_or_id)
-            
+        except ValidationError as e:
+            raise JiraValidationError("Invalid project data", errors=e.errors()) from e
+
+        # Don't send the request if there are no changes
+        if not project_data:
+            return self.get_project(project_key_or_id)
+
+        try:
             # Update project through API
             updated_project = self.client.jira.update_project(project_key_or_id, **project_data)
+            self._projects_cache.clear()
             
-            return Project.model_validate(updated_project)
-        except ValidationError as e:
-            raise JiraValidationError(f"Invalid project data: {str(e)}")
+            return _project_from_api(updated_project, trusted=self.client.config.trust_responses)
         except Exception as e:
             self.client._handle_error(e, "project update", project_key_or_id)
 
@@ -503,6 +678,7 @@ class ProjectManager:
                 params["enableUndo"] = "true"
                 
             self.client.jira.delete_project(project_key_or_id, **params)
+            self._projects_cache.clear()
             return True
         except Exception as e:
             self.client._handle_error(e, "project deletion", project_key_or_id)
@@ -523,6 +699,7 @@ class ProjectManager:
         """
         try:
             self.client.jira.archive_project(project_key_or_id)
+            self._projects_cache.clear()
             return True
         except Exception as e:
             self.client._handle_error(e, "project archival", project_key_or_id)
@@ -543,6 +720,7 @@ class ProjectManager:
         """
         try:
             self.client.jira.restore_project(project_key_or_id)
+            self._projects_cache.clear()
             return True
         except Exception as e:
             self.client._handle_error(e, "project restoration", project_key_or_id)
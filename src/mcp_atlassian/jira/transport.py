@@ -0,0 +1,140 @@
+"""
+HTTP/2 transport for the requests session used by atlassian-python-api.
+"""
+
+import time
+from typing import Any, Optional, Tuple, Union
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.exceptions import InvalidHeader, MaxRetryError
+from urllib3.util.retry import Retry
+
+
+def _httpx_timeout(timeout: Union[None, float, Tuple[Optional[float], Optional[float]]]) -> httpx.Timeout:
+    """Convert a requests timeout (seconds or a (connect, read) tuple) to an httpx timeout."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _retry_delay(retries: Retry, response: httpx.Response) -> float:
+    """Seconds to wait before retrying, from Retry-After if honoured and valid, else the backoff."""
+    if retries.respect_retry_after_header:
+        try:
+            retry_after = retries.get_retry_after(response)
+        except InvalidHeader:
+            retry_after = None
+        if retry_after is not None:
+            return retry_after
+    return retries.get_backoff_time()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    Transport adapter sending requests through an HTTP/2 capable httpx client.
+
+    Mounted on a requests.Session, it keeps the session's authentication, headers
+    and response hooks while concurrent requests to the same host are multiplexed
+    over a single connection. Responses are retried with the same urllib3 retry
+    policy the HTTP/1.1 adapter uses.
+    """
+
+    def __init__(self, *, verify: bool = True, max_connections: int = 10, max_retries: Optional[Retry] = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            verify: Whether to verify SSL certificates
+            max_connections: Maximum number of connections kept per adapter
+            max_retries: Retry policy for responses with a retryable status, None to never retry
+
+        Raises:
+            ImportError: If the h2 package needed for HTTP/2 is not installed
+        """
+        super().__init__()
+        self.max_retries = max_retries
+        self._client = httpx.Client(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        """
+        Send a prepared request.
+
+        Args:
+            request: Request prepared by the session
+            stream: Ignored, responses are always read fully and iter_content serves the read body
+            timeout: Seconds, or a (connect, read) tuple
+            verify: Ignored, SSL verification is set when the adapter is created
+            cert: Ignored
+            proxies: Ignored
+
+        Returns:
+            The response, as a requests.Response
+
+        Raises:
+            requests.ConnectTimeout: If connecting times out
+            requests.ReadTimeout: If reading the response times out
+            requests.ConnectionError: For other transport errors
+        """
+        retries = self.max_retries
+        while True:
+            try:
+                response = self._client.request(
+                    request.method,
+                    request.url,
+                    headers=dict(request.headers),
+                    content=request.body,
+                    timeout=_httpx_timeout(timeout),
+                )
+            except httpx.ConnectTimeout as e:
+                raise requests.ConnectTimeout(e, request=request)
+            except httpx.TimeoutException as e:
+                raise requests.ReadTimeout(e, request=request)
+            except httpx.TransportError as e:
+                raise requests.ConnectionError(e, request=request)
+
+            has_retry_after = "Retry-After" in response.headers
+            if retries is None or not retries.is_retry(request.method, response.status_code, has_retry_after):
+                break
+            try:
+                retries = retries.increment(request.method, request.url)
+            except MaxRetryError:
+                # Out of retries, the last response is passed on
+                break
+            time.sleep(_retry_delay(retries, response))
+
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        # httpx already decoded any content encoding
+        result.headers = CaseInsensitiveDict(
+            (name, value) for name, value in response.headers.items() if name.lower() != "content-encoding"
+        )
+        result._content = response.content
+        # The body is already read, iter_content serves it from _content
+        result._content_consumed = True
+        result.encoding = get_encoding_from_headers(result.headers)
+        result.url = request.url
+        result.request = request
+        result.connection = self
+        return result
+
+    def close(self) -> None:
+        """Close the underlying httpx client and its connections."""
+        self._client.close()
@@ -2,6 +2,7 @@ import logging
 import re
 import tempfile
 import warnings
+from functools import lru_cache
 from pathlib import Path
 
 from bs4 import BeautifulSoup
@@ -16,6 +17,139 @@ from md2conf.converter import (
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Jira markup patterns converted by TextPreprocessor.jira_to_markdown, in the order they are applied
+_JIRA_BLOCK_QUOTE = re.compile(r"^bq\.(.*?)$", re.MULTILINE)
+_JIRA_EMPHASIS = re.compile(r"([*_])(.*?)\1")
+_JIRA_LIST = re.compile(r"^((?:#|-|\+|\*)+) (.*)$", re.MULTILINE)
+_JIRA_HEADER = re.compile(r"^h([0-6])\.(.*)$", re.MULTILINE)
+_JIRA_INLINE_CODE = re.compile(r"\{\{([^}]+)\}\}")
+_JIRA_CITATION = re.compile(r"\?\?((?:.[^?]|[^?].)+)\?\?")
+_JIRA_INSERTED = re.compile(r"\+([^+]*)\+")
+_JIRA_SUPERSCRIPT = re.compile(r"\^([^^]*)\^")
+_JIRA_SUBSCRIPT = re.compile(r"~([^~]*)~")
+_JIRA_STRIKETHROUGH = re.compile(r"-([^-]*)-")
+_JIRA_CODE_BLOCK = re.compile(r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}", re.MULTILINE)
+_JIRA_NOFORMAT = re.compile(r"\{noformat\}([\s\S]*?)\{noformat\}")
+_JIRA_QUOTE = re.compile(r"\{quote\}([\s\S]*)\{quote\}", re.MULTILINE)
+_JIRA_IMAGE_ALT = re.compile(r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!")
+_JIRA_IMAGE_PARAMS = re.compile(r"!([^|\n\s]+)\|([^\n!]*)!")
+_JIRA_IMAGE = re.compile(r"!([^\n\s!]+)!")
+_JIRA_LINK = re.compile(r"\[([^|]+)\|(.+?)\]")
+_JIRA_BRACKETED = re.compile(r"\[(.+?)\]([^\(]+)")
+_JIRA_COLOR = re.compile(r"\{color:([^}]+)\}([\s\S]*?)\{color\}", re.MULTILINE)
+
+
+# Markdown patterns converted by TextPreprocessor.markdown_to_jira, in the order they are applied
+_MARKDOWN_CODE_BLOCK = re.compile(r"```(\w*)\n([\s\S]+?)```")
+_MARKDOWN_INLINE_CODE = re.compile(r"`([^`]+)`")
+_MARKDOWN_UNDERLINED_HEADER = re.compile(r"^(.*?)\n([=-])+$", re.MULTILINE)
+_MARKDOWN_HEADER = re.compile(r"^([#]+)(.*?)$", re.MULTILINE)
+_MARKDOWN_EMPHASIS = re.compile(r"([*_]+)(.*?)\1")
+_MARKDOWN_BULLET_LIST = re.compile(r"^(\s*)- (.*)$", re.MULTILINE)
+_MARKDOWN_NUMBERED_LIST = re.compile(r"^(\s+)1\. (.*)$", re.MULTILINE)
+_MARKDOWN_HTML_TAGS = tuple(
+    (re.compile(rf"<{tag}>(.*?)<\/{tag}>"), rf"{replacement}\1{replacement}")
+    for tag, replacement in {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}.items()
+)
+_MARKDOWN_COLOR = re.compile(r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>", re.MULTILINE)
+_MARKDOWN_STRIKETHROUGH = re.compile(r"~~(.*?)~~")
+_MARKDOWN_IMAGE = re.compile(r"!\[\]\(([^)\n\s]+)\)")
+_MARKDOWN_IMAGE_ALT = re.compile(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_MARKDOWN_AUTOLINK = re.compile(r"<([^>]+)>")
+_MARKDOWN_TABLE_SEPARATOR = re.compile(r"\|[-\s|]+\|")
+
+
+def _code_block_markup(match: re.Match) -> str:
+    """Convert a fenced Markdown code block to a Jira code block."""
+    syntax = match.group(1) or ""
+    code = "{code"
+    if syntax:
+        code += ":" + syntax
+    return code + "}" + match.group(2) + "{code}"
+
+
+@lru_cache(maxsize=512)
+def _markdown_to_jira_markup(input_text: str) -> str:
+    """
+    Convert Markdown to Jira markup.
+
+    Results are cached, as the same descriptions and comments are often
+    converted repeatedly, e.g. when importing worklogs in bulk.
+
+    Args:
+        input_text: Text in Markdown format
+
+    Returns:
+        Text in Jira markup format
+    """
+    # Convert code sections first
+    output = _MARKDOWN_CODE_BLOCK.sub(_code_block_markup, input_text)
+    output = _MARKDOWN_INLINE_CODE.sub(lambda match: "{{" + match.group(1) + "}}", output)
+
+    # Headers with = or - underlines
+    output = _MARKDOWN_UNDERLINED_HEADER.sub(
+        lambda match: f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}", output
+    )
+
+    # Headers with # prefix
+    output = _MARKDOWN_HEADER.sub(lambda match: f"h{len(match.group(1))}." + match.group(2), output)
+
+    # Bold and italic
+    output = _MARKDOWN_EMPHASIS.sub(
+        lambda match: ("_" if len(match.group(1)) == 1 else "*")
+        + match.group(2)
+        + ("_" if len(match.group(1)) == 1 else "*"),
+        output,
+    )
+
+    # Multi-level bulleted list
+    output = _MARKDOWN_BULLET_LIST.sub(
+        lambda match: "* " + match.group(2)
+        if not match.group(1)
+        else "  " * (len(match.group(1)) // 2) + "* " + match.group(2),
+        output,
+    )
+
+    # Multi-level numbered list
+    output = _MARKDOWN_NUMBERED_LIST.sub(
+        lambda match: "#" * (int(len(match.group(1)) / 4) + 2) + " " + match.group(2), output
+    )
+
+    # HTML formatting tags to Jira markup
+    for pattern, replacement in _MARKDOWN_HTML_TAGS:
+        output = pattern.sub(replacement, output)
+
+    # Colored text
+    output = _MARKDOWN_COLOR.sub(r"{color:\1}\2{color}", output)
+
+    # Strikethrough
+    output = _MARKDOWN_STRIKETHROUGH.sub(r"-\1-", output)
+
+    # Images without alt text
+    output = _MARKDOWN_IMAGE.sub(r"!\1!", output)
+
+    # Images with alt text
+    output = _MARKDOWN_IMAGE_ALT.sub(r"!\2|alt=\1!", output)
+
+    # Links
+    output = _MARKDOWN_LINK.sub(r"[\1|\2]", output)
+    output = _MARKDOWN_AUTOLINK.sub(r"[\1]", output)
+
+    # Convert markdown tables to Jira table format
+    lines = output.split("\n")
+    i = 0
+    while i < len(lines):
+        if i < len(lines) - 1 and _MARKDOWN_TABLE_SEPARATOR.match(lines[i + 1]):
+            # Convert header row to Jira format
+            lines[i] = lines[i].replace("|", "||")
+            # Remove the separator line
+            lines.pop(i + 1)
+        i += 1
+
+    # Rejoin the lines
+    return "\n".join(lines)
+
 
 class TextPreprocessor:
     """Handles text preprocessing for Confluence and Jira content."""
@@ -70,17 +204,20 @@ class TextPreprocessor:
             return ""
 
         # Process user mentions
-        mention_pattern = r"\[~accountid:(.*?)\]"
-        text = self._process_mentions(text, mention_pattern)
+        if "[~accountid:" in text:
+            mention_pattern = r"\[~accountid:(.*?)\]"
+            text = self._process_mentions(text, mention_pattern)
 
         # Process Jira smart links
-        text = self._process_smart_links(text)
+        if "|smart-link]" in text:
+            text = self._process_smart_links(text)
 
         # First convert any Jira markup to Markdown
         text = self.jira_to_markdown(text)
 
         # Then convert any remaining HTML to markdown
-        text = self._convert_html_to_markdown(text)
+        if "<" in text:
+            text = self._convert_html_to_markdown(text)
 
         return text.strip()
 
@@ -153,80 +290,88 @@ class TextPreprocessor:
         if not input_text:
             return ""
 
+        # Each pass below only runs if the text contains the marker it needs,
+        # so plain prose skips most of them
+
         # Block quotes
-        output = re.sub(r"^bq\.(.*?)$", r"> \1\n", input_text, flags=re.MULTILINE)
+        output = input_text
+        if "bq." in output:
+            output = _JIRA_BLOCK_QUOTE.sub(r"> \1\n", output)
 
         # Text formatting (bold, italic)
-        output = re.sub(
-            r"([*_])(.*?)\1",
-            lambda match: ("**" if match.group(1) == "*" else "*")
-            + match.group(2)
-            + ("**" if match.group(1) == "*" else "*"),
-            output,
-        )
+        if "*" in output or "_" in output:
+            output = _JIRA_EMPHASIS.sub(
+                lambda match: ("**" if match.group(1) == "*" else "*")
+                + match.group(2)
+                + ("**" if match.group(1) == "*" else "*"),
+                output,
+            )
 
         # Multi-level numbered list
-        output = re.sub(
-            r"^((?:#|-|\+|\*)+) (.*)$",
-            lambda match: self._convert_jira_list_to_markdown(match),
-            output,
-            flags=re.MULTILINE,
-        )
+        output = _JIRA_LIST.sub(lambda match: self._convert_jira_list_to_markdown(match), output)
 
         # Headers
-        output = re.sub(
-            r"^h([0-6])\.(.*)$", lambda match: "#" * int(match.group(1)) + match.group(2), output, flags=re.MULTILINE
-        )
+        output = _JIRA_HEADER.sub(lambda match: "#" * int(match.group(1)) + match.group(2), output)
 
         # Inline code
-        output = re.sub(r"\{\{([^}]+)\}\}", r"`\1`", output)
+        if "{{" in output:
+            output = _JIRA_INLINE_CODE.sub(r"`\1`", output)
 
         # Citation
-        output = re.sub(r"\?\?((?:.[^?]|[^?].)+)\?\?", r"<cite>\1</cite>", output)
+        if "??" in output:
+            output = _JIRA_CITATION.sub(r"<cite>\1</cite>", output)
 
         # Inserted text
-        output = re.sub(r"\+([^+]*)\+", r"<ins>\1</ins>", output)
+        if "+" in output:
+            output = _JIRA_INSERTED.sub(r"<ins>\1</ins>", output)
 
         # Superscript
-        output = re.sub(r"\^([^^]*)\^", r"<sup>\1</sup>", output)
+        if "^" in output:
+            output = _JIRA_SUPERSCRIPT.sub(r"<sup>\1</sup>", output)
 
         # Subscript
-        output = re.sub(r"~([^~]*)~", r"<sub>\1</sub>", output)
+        if "~" in output:
+            output = _JIRA_SUBSCRIPT.sub(r"<sub>\1</sub>", output)
 
         # Strikethrough
-        output = re.sub(r"-([^-]*)-", r"-\1-", output)
+        if "-" in output:
+            output = _JIRA_STRIKETHROUGH.sub(r"-\1-", output)
 
-        # Code blocks with optional language specification
-        output = re.sub(r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}", r"```\1\n\2\n```", output, flags=re.MULTILINE)
+        if "{" in output:
+            # Code blocks with optional language specification
+            output = _JIRA_CODE_BLOCK.sub(r"```\1\n\2\n```", output)
 
-        # No format
-        output = re.sub(r"\{noformat\}([\s\S]*?)\{noformat\}", r"```\n\1\n```", output)
+            # No format
+            output = _JIRA_NOFORMAT.sub(r"```\n\1\n```", output)
 
-        # Quote blocks
-        output = re.sub(
-            r"\{quote\}([\s\S]*)\{quote\}",
-            lambda match: "\n".join([f"> {line}" for line in match.group(1).split("\n")]),
-            output,
-            flags=re.MULTILINE,
-        )
+            # Quote blocks
+            output = _JIRA_QUOTE.sub(
+                lambda match: "\n".join([f"> {line}" for line in match.group(1).split("\n")]),
+                output,
+            )
 
-        # Images with alt text
-        output = re.sub(r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!", r"![\3](\1)", output)
+        if "!" in output:
+            # Images with alt text
+            output = _JIRA_IMAGE_ALT.sub(r"![\3](\1)", output)
 
-        # Images with other parameters (ignore them)
-        output = re.sub(r"!([^|\n\s]+)\|([^\n!]*)!", r"![](\1)", output)
+            # Images with other parameters (ignore them)
+            output = _JIRA_IMAGE_PARAMS.sub(r"![](\1)", output)
 
-        # Images without parameters
-        output = re.sub(r"!([^\n\s!]+)!", r"![](\1)", output)
+            # Images without parameters
+            output = _JIRA_IMAGE.sub(r"![](\1)", output)
 
         # Links
-        output = re.sub(r"\[([^|]+)\|(.+?)\]", r"[\1](\2)", output)
-        output = re.sub(r"\[(.+?)\]([^\(]+)", r"<\1>\2", output)
+        if "[" in output:
+            output = _JIRA_LINK.sub(r"[\1](\2)", output)
+            output = _JIRA_BRACKETED.sub(r"<\1>\2", output)
 
         # Colored text
-        output = re.sub(
-            r"\{color:([^}]+)\}([\s\S]*?)\{color\}", r"<span style=\"color:\1\">\2</span>", output, flags=re.MULTILINE
-        )
+        if "{color:" in output:
+            output = _JIRA_COLOR.sub(r"<span style=\"color:\1\">\2</span>", output)
+
+        # Nothing else to convert without table headers
+        if "||" not in output:
+            return output
 
         # Convert Jira table headers (||) to markdown table format
         lines = output.split("\n")
@@ -265,111 +410,7 @@ class TextPreprocessor:
         if not input_text:
             return ""
 
-        # Save code blocks to prevent recursive processing
-        code_blocks = []
-        inline_codes = []
-
-        # Extract code blocks
-        def save_code_block(match):
-            syntax = match.group(1) or ""
-            content = match.group(2)
-            code = "{code"
-            if syntax:
-                code += ":" + syntax
-            code += "}" + content + "{code}"
-            code_blocks.append(code)
-            return code  # Return the actual code block instead of a placeholder
-
-        # Extract inline code
-        def save_inline_code(match):
-            content = match.group(1)
-            code = "{{" + content + "}}"
-            inline_codes.append(code)
-            return code  # Return the actual inline code instead of a placeholder
-
-        # Save code sections temporarily
-        output = re.sub(r"```(\w*)\n([\s\S]+?)```", save_code_block, input_text)
-        output = re.sub(r"`([^`]+)`", save_inline_code, output)
-
-        # Headers with = or - underlines
-        output = re.sub(
-            r"^(.*?)\n([=-])+$",
-            lambda match: f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}",
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Headers with # prefix
-        output = re.sub(
-            r"^([#]+)(.*?)$", lambda match: f"h{len(match.group(1))}." + match.group(2), output, flags=re.MULTILINE
-        )
-
-        # Bold and italic
-        output = re.sub(
-            r"([*_]+)(.*?)\1",
-            lambda match: ("_" if len(match.group(1)) == 1 else "*")
-            + match.group(2)
-            + ("_" if len(match.group(1)) == 1 else "*"),
-            output,
-        )
-
-        # Multi-level bulleted list
-        output = re.sub(
-            r"^(\s*)- (.*)$",
-            lambda match: "* " + match.group(2)
-            if not match.group(1)
-            else "  " * (len(match.group(1)) // 2) + "* " + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Multi-level numbered list
-        output = re.sub(
-            r"^(\s+)1\. (.*)$",
-            lambda match: "#" * (int(len(match.group(1)) / 4) + 2) + " " + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # HTML formatting tags to Jira markup
-        tag_map = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
-
-        for tag, replacement in tag_map.items():
-            output = re.sub(rf"<{tag}>(.*?)<\/{tag}>", rf"{replacement}\1{replacement}", output)
-
-        # Colored text
-        output = re.sub(
-            r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>", r"{color:\1}\2{color}", output, flags=re.MULTILINE
-        )
-
-        # Strikethrough
-        output = re.sub(r"~~(.*?)~~", r"-\1-", output)
-
-        # Images without alt text
-        output = re.sub(r"!\[\]\(([^)\n\s]+)\)", r"!\1!", output)
-
-        # Images with alt text
-        output = re.sub(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)", r"!\2|alt=\1!", output)
-
-        # Links
-        output = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"[\1|\2]", output)
-        output = re.sub(r"<([^>]+)>", r"[\1]", output)
-
-        # Convert markdown tables to Jira table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            if i < len(lines) - 1 and re.match(r"\|[-\s|]+\|", lines[i + 1]):
-                # Convert header row to Jira format
-                lines[i] = lines[i].replace("|", "||")
-                # Remove the separator line
-                lines.pop(i + 1)
-            i += 1
-
-        # Rejoin the lines
-        output = "\n".join(lines)
-
-        return output
+        return _markdown_to_jira_markup(input_text)
 
     def _convert_jira_list_to_markdown(self, match) -> str:
         """Helper method to convert Jira lists to Markdown format."""
@@ -10,6 +10,7 @@ from pydantic import AnyUrl
 
 from .confluence import ConfluenceFetcher
 from .jira import JiraFetcher
+from .jira.issues import DEFAULT_SEARCH_FIELDS
 from .preprocessing import markdown_to_confluence_storage
 
 # Configure logging
@@ -385,7 +386,7 @@ async def list_tools() -> list[Tool]:
                             "fields": {
                                 "type": "string",
                                 "description": "Comma-separated fields to return",
-                                "default": "*all",
+                                "default": DEFAULT_SEARCH_FIELDS,
                             },
                             "limit": {
                                 "type": "number",
@@ -800,9 +801,8 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
 
         elif name == "jira_search":
             limit = min(int(arguments.get("limit", 10)), 50)
-            documents = jira_fetcher.search_issues(
-                arguments["jql"], fields=arguments.get("fields", "*all"), limit=limit
-            )
+            search_kwargs = {"fields": arguments["fields"]} if "fields" in arguments else {}
+            documents = jira_fetcher.search_issues(arguments["jql"], limit=limit, **search_kwargs)
             search_results = [format_issue(doc) for doc in documents]
             return [TextContent(type="text", text=json.dumps(search_results, indent=2, ensure_ascii=False))]
 
@@ -105,10 +105,9 @@ class TestJiraClient(unittest.TestCase):
             api_token=JIRA_API_TOKEN
         ))
         
-        # Create a mock error with status_code attribute
-        error = MagicMock()
+        # Create an error with a status_code attribute
+        error = Exception("Unauthorized")
         error.status_code = 401
-        error.__str__ = lambda x: "Unauthorized"
         
         with self.assertRaises(JiraAuthenticationError):
             client._handle_error(error, "issue", TEST_ISSUE_KEY)
@@ -121,10 +120,9 @@ class TestJiraClient(unittest.TestCase):
             api_token=JIRA_API_TOKEN
         ))
         
-        # Create a mock error with status_code attribute
-        error = MagicMock()
+        # Create an error with a status_code attribute
+        error = Exception("Not Found")
         error.status_code = 404
-        error.__str__ = lambda x: "Not Found"
         
         with self.assertRaises(JiraResourceNotFoundError):
             client._handle_error(error, "issue", f"{TEST_PROJECT_KEY}-999")
@@ -4,6 +4,8 @@ Unit tests for the BoardManager class that don't require actual API calls.
 import unittest
 from unittest.mock import patch, MagicMock, call
 
+from requests import HTTPError
+
 from mcp_atlassian.jira.boards import BoardManager
 from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.jira.exceptions import (
@@ -34,7 +36,7 @@ class TestBoardManagerUnit(unittest.TestCase):
         self.mock_jira = self.mock_jira_class.return_value
         
         # Create the board manager with mocked dependencies
-        self.board_manager = BoardManager(self.config)
+        self.board_manager = BoardManager(JiraClient(self.config))
         self.board_manager.jira = self.mock_jira
         
         # Sample board data for testing
@@ -134,6 +136,20 @@ class TestBoardManagerUnit(unittest.TestCase):
         """Tear down test fixtures."""
         self.patcher.stop()
     
+    def test_from_config(self):
+        """Test creating a board manager with its own client."""
+        board_manager = BoardManager.from_config(self.config)
+
+        self.assertIsInstance(board_manager.client, JiraClient)
+        self.assertIs(board_manager.jira, board_manager.client.jira)
+        self.assertEqual(board_manager.config, self.config)
+
+    def test_shared_client(self):
+        """Test that several managers can share one client."""
+        client = JiraClient(self.config)
+
+        self.assertIs(BoardManager(client).jira, BoardManager(client).jira)
+
     def test_get_boards(self):
         """Test retrieving boards."""
         # Configure mock
@@ -183,6 +199,95 @@ class TestBoardManagerUnit(unittest.TestCase):
             params={}
         )
     
+    def test_get_board_cached(self):
+        """Test that board details are cached until the board is invalidated."""
+        # Configure mock
+        self.mock_jira.get.return_value = self.sample_board_data
+
+        # Repeated calls hit the API once
+        self.board_manager.get_board(1)
+        self.board_manager.get_board(board_id=1)
+        self.assertEqual(self.mock_jira.get.call_count, 1)
+
+        # Updating the board evicts the cached details
+        self.board_manager.update_board(1, name="Renamed")
+        self.board_manager.get_board(1)
+        self.assertEqual(self.mock_jira.get.call_count, 2)
+
+    def test_cached_results_are_copies(self):
+        """Test that callers mutating a cached result don't change the cache."""
+        self.mock_jira.get.return_value = {"values": [self.sample_sprint]}
+
+        self.board_manager.get_board_sprints(1).clear()
+        self.assertEqual(len(self.board_manager.get_board_sprints(1)), 1)
+
+        self.mock_jira.get.return_value = self.sample_board_data
+        self.board_manager.get_board(1)["name"] = "Changed"
+        self.assertEqual(self.board_manager.get_board(1)["name"], "Test Board")
+
+    def test_get_board_sprints_stale_while_revalidate(self):
+        """Test that stale listings are served while being refreshed in the background."""
+        # Configure mock
+        self.mock_jira.get.return_value = {"values": [self.sample_sprint]}
+
+        # Run background refreshes synchronously
+        def run_now(target, args, daemon):
+            return MagicMock(start=lambda: target(*args))
+
+        with patch("mcp_atlassian.cache.time.monotonic") as mock_monotonic, \
+                patch("mcp_atlassian.cache.threading.Thread", side_effect=run_now):
+            mock_monotonic.return_value = 1000.0
+            self.board_manager.get_board_sprints(1)
+
+            # Fresh listings are served from the cache
+            mock_monotonic.return_value = 1010.0
+            self.board_manager.get_board_sprints(1)
+            self.assertEqual(self.mock_jira.get.call_count, 1)
+
+            # Stale listings are returned as is and reloaded
+            self.mock_jira.get.return_value = {"values": []}
+            mock_monotonic.return_value = 1060.0
+            self.assertEqual(len(self.board_manager.get_board_sprints(1)), 1)
+            self.assertEqual(self.mock_jira.get.call_count, 2)
+            self.assertEqual(self.board_manager.get_board_sprints(1), [])
+
+            # Expired listings are reloaded before returning
+            mock_monotonic.return_value = 2000.0
+            self.board_manager.get_board_sprints(1)
+            self.assertEqual(self.mock_jira.get.call_count, 3)
+
+    def test_rate_limited_get_retries_after_429(self):
+        """Test that 429 responses are retried after the Retry-After delay."""
+        # Configure mock to be rate limited once
+        response = MagicMock(status_code=429, headers={"Retry-After": "2"})
+        self.mock_jira.get.side_effect = [HTTPError("Too Many Requests", response=response), self.sample_board_data]
+
+        # Call the method
+        with patch("mcp_atlassian.jira.client.time.sleep") as mock_sleep:
+            result = self.board_manager.get_board(1)
+
+        # Assert result and that the request was retried after waiting
+        self.assertEqual(result["id"], 1)
+        self.assertEqual(self.mock_jira.get.call_count, 2)
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 2, delta=0.1)
+
+    def test_managers_share_client_rate_limit(self):
+        """Test that managers on one client share its single rate-limit hook."""
+        self.mock_jira._session.hooks = {"response": []}
+        client = JiraClient(self.config)
+        managers = [BoardManager(client) for _ in range(5)]
+
+        rate_limit_hooks = [hook for hook in self.mock_jira._session.hooks["response"]
+                            if getattr(hook, "__self__", None) is client]
+        self.assertEqual(len(rate_limit_hooks), 1)
+
+        # A throttled response seen by the hook defers requests of every manager
+        rate_limit_hooks[0](MagicMock(headers={"Retry-After": "3"}))
+        self.mock_jira.get.return_value = self.sample_board_data
+        with patch("mcp_atlassian.jira.client.time.sleep") as mock_sleep:
+            managers[-1].get_board(1)
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 3, delta=0.1)
+
     def test_get_board_configuration(self):
         """Test retrieving a board configuration."""
         # Configure mock
@@ -217,9 +322,156 @@ class TestBoardManagerUnit(unittest.TestCase):
         # Assert mock was called correctly
         self.mock_jira.get.assert_called_once_with(
             "/rest/agile/1.0/board/1/issue",
-            params={"startAt": 0, "maxResults": 50}
+            params={"startAt": 0, "maxResults": 100, "fields": "summary,issuetype,status,description"}
         )
-    
+
+    def test_get_board_issues_configured_page_size(self):
+        """Test that the configured page size is used when none is requested."""
+        self.mock_jira.get.return_value = {"issues": []}
+        self.board_manager.config = JiraConfig(url=self.config.url, board_page_size=25)
+
+        self.board_manager.get_board_issues(1)
+        self.board_manager.get_board_issues(2, max_results=5)
+
+        first, second = self.mock_jira.get.call_args_list
+        self.assertEqual(first.kwargs["params"]["maxResults"], 25)
+        self.assertEqual(second.kwargs["params"]["maxResults"], 5)
+
+    def test_get_board_issues_explicit_fields(self):
+        """Test that explicitly requested fields replace the default projection."""
+        # Configure mock
+        self.mock_jira.get.return_value = {"issues": [self.sample_issue]}
+
+        # Call the method
+        self.board_manager.get_board_issues(1, fields=["summary", "assignee"])
+
+        # Assert only the requested fields were sent
+        params = self.mock_jira.get.call_args.kwargs["params"]
+        self.assertEqual(params["fields"], "summary,assignee")
+
+    def test_get_board_issues_adf_description(self):
+        """Test extracting text from an Atlassian Document Format description."""
+        adf_issue = dict(self.sample_issue)
+        adf_issue["fields"] = dict(self.sample_issue["fields"], description={
+            "type": "doc",
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": "First "}]},
+                {"type": "bulletList", "content": [
+                    {"type": "listItem", "content": [
+                        {"type": "paragraph", "content": [{"type": "text", "text": "nested "}]}
+                    ]}
+                ]},
+                {"type": "paragraph", "content": [{"type": "text", "text": "last"}]},
+            ],
+        })
+
+        # Configure mock
+        self.mock_jira.get.return_value = {"issues": [adf_issue]}
+
+        # Call the method
+        result = self.board_manager.get_board_issues(1)
+
+        # Assert text is extracted in document order
+        self.assertEqual(result[0].page_content, "Test issue\n\nFirst nested last")
+
+    def test_get_board_issues_adf_paragraphs(self):
+        """Test extracting text from a description made only of paragraphs."""
+        adf_issue = dict(self.sample_issue)
+        adf_issue["fields"] = dict(self.sample_issue["fields"], description={
+            "type": "doc",
+            "content": [
+                {"type": "paragraph", "content": [
+                    {"type": "text", "text": "Bold", "marks": [{"type": "strong"}]},
+                    {"type": "text", "text": " text "},
+                ]},
+                {"type": "paragraph", "content": [{"type": "hardBreak"}, {"type": "text", "text": "after"}]},
+            ],
+        })
+
+        # Configure mock
+        self.mock_jira.get.return_value = {"issues": [adf_issue]}
+
+        # Call the method
+        result = self.board_manager.get_board_issues(1)
+
+        # Assert inline nodes other than text are skipped
+        self.assertEqual(result[0].page_content, "Test issue\n\nBold text after")
+
+    def test_get_board_issues_concurrent(self):
+        """Test retrieving all pages of board issues concurrently."""
+        def page(url, params):
+            start = params["startAt"]
+            issues = []
+            for i in range(start, min(start + params["maxResults"], 5)):
+                issue = dict(self.sample_issue, key=f"TEST-{i + 1}")
+                issues.append(issue)
+            return {"startAt": start, "total": 5, "issues": issues}
+
+        # Configure mock
+        self.mock_jira.get.side_effect = page
+
+        # Call the method
+        result = self.board_manager.get_board_issues(1, max_results=2, concurrent=True)
+
+        # Assert result keeps page order
+        self.assertEqual([d.metadata["key"] for d in result], ["TEST-1", "TEST-2", "TEST-3", "TEST-4", "TEST-5"])
+        self.assertEqual(self.mock_jira.get.call_count, 3)
+
+    def test_get_board_issues_concurrent_capped_page_size(self):
+        """Test that concurrent pagination follows a server-capped page size."""
+        def page(url, params):
+            start = params["startAt"]
+            issues = [dict(self.sample_issue, key=f"TEST-{i + 1}") for i in range(start, min(start + 2, 5))]
+            return {"startAt": start, "total": 5, "issues": issues}
+
+        # Configure mock to return at most 2 issues per page
+        self.mock_jira.get.side_effect = page
+
+        # Call the method and check the truncation is reported
+        with self.assertLogs("mcp-jira", level="WARNING"):
+            result = self.board_manager.get_board_issues(1, max_results=10, concurrent=True)
+
+        # Assert no issues were skipped
+        self.assertEqual(len(result), 5)
+        self.assertEqual(self.mock_jira.get.call_args.kwargs["params"]["maxResults"], 2)
+
+    def test_iter_board_issues(self):
+        """Test streaming all board issues page by page."""
+        def page(url, params):
+            start = params["startAt"]
+            issues = [dict(self.sample_issue, key=f"TEST-{i + 1}") for i in range(start, min(start + params["maxResults"], 3))]
+            return {"startAt": start, "total": 3, "issues": issues}
+
+        # Configure mock
+        self.mock_jira.get.side_effect = page
+
+        # Consume the first page only
+        iterator = self.board_manager.iter_board_issues(1, page_size=2)
+        self.assertEqual(next(iterator).metadata["key"], "TEST-1")
+        self.assertEqual(self.mock_jira.get.call_count, 1)
+
+        # Consume the rest
+        self.assertEqual([d.metadata["key"] for d in iterator], ["TEST-2", "TEST-3"])
+        self.assertEqual(self.mock_jira.get.call_count, 2)
+
+    def test_get_boards_issues(self):
+        """Test retrieving issues from several boards at once."""
+        def board_issues(url, params):
+            board_id = url.split("/")[-2]
+            return {"issues": [dict(self.sample_issue, key=f"B{board_id}-1")]}
+
+        # Configure mock
+        self.mock_jira.get.side_effect = board_issues
+
+        # Call the method
+        result = self.board_manager.get_boards_issues([1, 2], max_results=10)
+
+        # Assert result
+        self.assertEqual(list(result), [1, 2])
+        self.assertEqual(result[1][0].metadata["key"], "B1-1")
+        self.assertEqual(result[2][0].metadata["key"], "B2-1")
+        self.assertEqual(self.board_manager.get_boards_issues([]), {})
+
     def test_get_board_epics(self):
         """Test retrieving epics from a board."""
         # Sample epics response
@@ -245,7 +497,7 @@ class TestBoardManagerUnit(unittest.TestCase):
         # Assert mock was called correctly
         self.mock_jira.get.assert_called_once_with(
             "/rest/agile/1.0/board/1/epic",
-            params={"startAt": 0, "maxResults": 50, "done": "false"}
+            params={"startAt": 0, "maxResults": 100, "done": "false"}
         )
     
     def test_get_board_backlog_issues(self):
@@ -264,7 +516,7 @@ class TestBoardManagerUnit(unittest.TestCase):
         # Assert mock was called correctly
         self.mock_jira.get.assert_called_once_with(
             "/rest/agile/1.0/board/1/backlog",
-            params={"startAt": 0, "maxResults": 50}
+            params={"startAt": 0, "maxResults": 100, "fields": "summary,issuetype,status,description"}
         )
     
     def test_get_board_sprints(self):
@@ -293,9 +545,31 @@ class TestBoardManagerUnit(unittest.TestCase):
         # Assert mock was called correctly
         self.mock_jira.get.assert_called_once_with(
             "/rest/agile/1.0/board/1/sprint",
-            params={"startAt": 0, "maxResults": 50, "state": "active"}
+            params={"startAt": 0, "maxResults": 100, "state": "active"}
         )
-    
+
+    def test_get_board_bundle(self):
+        """Test retrieving a board with its configuration, sprints and epics."""
+        responses = {
+            "/rest/agile/1.0/board/1": self.sample_board_data,
+            "/rest/agile/1.0/board/1/configuration": self.sample_configuration,
+            "/rest/agile/1.0/board/1/sprint": {"values": [self.sample_sprint]},
+            "/rest/agile/1.0/board/1/epic": {"values": []},
+        }
+
+        # Configure mock
+        self.mock_jira.get.side_effect = lambda url, **kwargs: responses[url]
+
+        # Call the method
+        result = self.board_manager.get_board_bundle(1)
+
+        # Assert result
+        self.assertEqual(result["board"]["id"], 1)
+        self.assertEqual(result["config"], self.sample_configuration)
+        self.assertEqual(result["sprints"][0]["id"], 123)
+        self.assertEqual(result["epics"], [])
+        self.assertEqual(self.mock_jira.get.call_count, 4)
+
     def test_get_board_sprint_issues(self):
         """Test retrieving sprint issues from a board."""
         # Configure mock
@@ -313,7 +587,7 @@ class TestBoardManagerUnit(unittest.TestCase):
         # Assert mock was called correctly
         self.mock_jira.get.assert_called_once_with(
             "/rest/agile/1.0/board/1/sprint/123/issue",
-            params={"startAt": 0, "maxResults": 50}
+            params={"startAt": 0, "maxResults": 100, "fields": "summary,issuetype,status,description"}
         )
         
     def test_create_board(self):
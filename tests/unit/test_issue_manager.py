@@ -125,6 +125,24 @@ class TestIssueManagerUnit(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.issue_manager._get_account_id("nonexistent@example.com")
 
+    def test_get_account_id_cached(self):
+        """Test that resolved account IDs are reused, also under the user's other names."""
+        mock_jira = MagicMock()
+        mock_jira.user_find_by_user_string.return_value = [{
+            "accountId": "test-account-id",
+            "displayName": "Test User",
+            "emailAddress": "test@example.com"
+        }]
+        self.issue_manager.jira = mock_jira
+
+        # Resolve the same user by email twice, then by display name
+        self.assertEqual(self.issue_manager._get_account_id("test@example.com"), "test-account-id")
+        self.assertEqual(self.issue_manager._get_account_id("test@example.com"), "test-account-id")
+        self.assertEqual(self.issue_manager._get_account_id("Test User"), "test-account-id")
+
+        # Verify only the first call reached Jira
+        mock_jira.user_find_by_user_string.assert_called_once_with(query="test@example.com")
+
     def test_parse_time_spent(self):
         """Test _parse_time_spent method."""
         # Test various time formats
@@ -183,6 +201,42 @@ class TestIssueManagerUnit(unittest.TestCase):
         # Verify mock call
         self.issue_manager.jira.get_issue_transitions.assert_called_once_with("TEST-1")
         
+    def test_get_available_transitions_shared_by_workflow_state(self):
+        """Test that issues found in the same project, type and status share cached transitions."""
+        def issue(key):
+            return {
+                "key": key,
+                "fields": {
+                    "summary": "Test",
+                    "issuetype": {"name": "Task"},
+                    "status": {"name": "Open"},
+                    "created": "2024-01-01T10:00:00.000+0000",
+                },
+            }
+
+        self.issue_manager.jira.jql = MagicMock(return_value={
+            "startAt": 0, "total": 2, "issues": [issue("TEST-1"), issue("TEST-2")],
+        })
+        self.issue_manager.jira.get_issue_transitions = MagicMock(return_value={
+            "transitions": [{"id": "10", "name": "Start Progress", "to": {"name": "In Progress"}}]
+        })
+
+        # Find the issues, then ask for the transitions of both
+        self.issue_manager.search_issues("project = TEST")
+        first = self.issue_manager.get_available_transitions("TEST-1")
+        second = self.issue_manager.get_available_transitions("TEST-2")
+
+        # Verify a single transitions request served both issues
+        self.assertEqual(first, second)
+        self.issue_manager.jira.get_issue_transitions.assert_called_once_with("TEST-1")
+
+        # Transitioning an issue forgets its workflow state
+        self.issue_manager.jira.issue_transition = MagicMock()
+        self.issue_manager.get_issue = MagicMock()
+        self.issue_manager.transition_issue("TEST-2", "10")
+        self.issue_manager.get_available_transitions("TEST-2")
+        self.assertEqual(self.issue_manager.jira.get_issue_transitions.call_count, 2)
+
     def test_get_available_transitions_with_string_to(self):
         """Test get_available_transitions with 'to' as a string."""
         # Setup mock - simulating API returning 'to' as direct string
@@ -316,5 +370,428 @@ class TestIssueManagerUnit(unittest.TestCase):
         self.assertEqual(transition_data["transition"]["id"], "10.0")
 
 
+    def test_get_issue_with_comments(self):
+        """Test that get_issue fetches the issue and its comments."""
+        self.issue_manager.jira.issue = MagicMock(return_value={
+            "key": "TEST-1",
+            "fields": {
+                "summary": "Test",
+                "description": "Details",
+                "issuetype": {"name": "Task"},
+                "status": {"name": "Open"},
+                "created": "2024-01-01T10:00:00.000+0000",
+            },
+        })
+        self.issue_manager.jira.resource_url = MagicMock(return_value="rest/api/2/issue")
+        self.issue_manager.jira.get = MagicMock(return_value={
+            "comments": [
+                {"id": "1", "body": "First", "created": "2024-01-02T10:00:00.000+0000",
+                 "author": {"displayName": "Alice"}},
+                {"id": "2", "body": "Second", "created": "2024-01-03T10:00:00.000+0000",
+                 "author": {"displayName": "Bob"}},
+            ]
+        })
+
+        self.issue_manager.get_jira_field_ids = MagicMock(return_value={})
+
+        # Call the method
+        result = self.issue_manager.get_issue("TEST-1", comment_limit="1")
+
+        # Verify both requests were made and the comment limit applied
+        self.issue_manager.jira.issue.assert_called_once_with("TEST-1", expand=None)
+        self.issue_manager.jira.get.assert_called_once_with(
+            "rest/api/2/issue/TEST-1/comment", params={"maxResults": 1}
+        )
+        self.assertEqual([c["id"] for c in result.metadata["comments"]], ["1"])
+        self.assertIn("Alice: Cleaned text", result.page_content)
+
+    def test_get_issue_uses_discovered_epic_link_field(self):
+        """Test that get_issue reads the Epic link from an already discovered field only."""
+        self.issue_manager._field_ids_cache = {"epic_link": "customfield_10100"}
+        self.issue_manager.get_jira_field_ids = MagicMock()
+        self.issue_manager.jira.issue = MagicMock(return_value={
+            "key": "TEST-2",
+            "fields": {
+                "summary": "Test",
+                "issuetype": {"name": "Story"},
+                "status": {"name": "Open"},
+                "created": "2024-01-01T10:00:00.000+0000",
+                "customfield_10014": "OTHER-1",
+                "customfield_10100": "EPIC-1",
+            },
+        })
+
+        # Call the method
+        result = self.issue_manager.get_issue("TEST-2", comment_limit=None)
+
+        # Verify the cached field was used without discovering fields
+        self.assertEqual(result.metadata["epic_key"], "EPIC-1")
+        self.issue_manager.get_jira_field_ids.assert_not_called()
+
+        # Without discovered fields the defaults are read, still without discovery
+        self.issue_manager._field_ids_cache = {}
+        result = self.issue_manager.get_issue("TEST-2", comment_limit=None)
+        self.assertEqual(result.metadata["epic_key"], "OTHER-1")
+        self.issue_manager.get_jira_field_ids.assert_not_called()
+
+    def test_create_issue_converts_description_once(self):
+        """Test that create_issue converts the description to Jira markup exactly once."""
+        self.issue_manager.jira.create_issue = MagicMock(return_value={"key": "TEST-1"})
+        self.issue_manager.get_issue = MagicMock(return_value="issue")
+
+        # Call the method
+        self.issue_manager.create_issue("TEST", "Summary", "Task", description="# Heading")
+
+        # Verify the description was converted a single time
+        self.issue_manager.preprocessor.markdown_to_jira.assert_called_once_with("# Heading")
+        fields = self.issue_manager.jira.create_issue.call_args.kwargs["fields"]
+        self.assertEqual(fields["description"], "Jira markup text")
+
+    def test_create_issue_without_expanded_response(self):
+        """Test that create_issue can skip fetching the created issue back."""
+        self.issue_manager.jira.create_issue = MagicMock(return_value={"id": "1", "key": "TEST-1"})
+        self.issue_manager.get_issue = MagicMock()
+
+        # Call the method
+        result = self.issue_manager.create_issue("TEST", "Summary", "Task", expand_response=False)
+
+        # Verify the document was built without another request
+        self.issue_manager.get_issue.assert_not_called()
+        self.assertEqual(result.metadata["key"], "TEST-1")
+        self.assertEqual(result.metadata["title"], "Summary")
+        self.assertEqual(result.metadata["link"], "https://example.atlassian.net/browse/TEST-1")
+        self.assertNotIn("expand_response", self.issue_manager.jira.create_issue.call_args.kwargs["fields"])
+
+    def test_update_issue_without_expanded_response(self):
+        """Test that update_issue on Cloud builds the result from the update response."""
+        self.issue_manager.jira.resource_url = MagicMock(return_value="rest/api/2/issue")
+        self.issue_manager.jira.put = MagicMock(return_value={
+            "key": "TEST-1",
+            "fields": {
+                "summary": "Updated",
+                "issuetype": {"name": "Task"},
+                "status": {"name": "Open"},
+                "created": "2024-01-01T10:00:00.000+0000",
+            },
+        })
+        self.issue_manager.get_issue = MagicMock()
+
+        # Call the method
+        result = self.issue_manager.update_issue("TEST-1", {"summary": "Updated"}, expand_response=False)
+
+        # Verify a single request was made
+        self.issue_manager.jira.put.assert_called_once_with(
+            "rest/api/2/issue/TEST-1", data={"fields": {"summary": "Updated"}}, params={"returnIssue": "true"}
+        )
+        self.issue_manager.get_issue.assert_not_called()
+        self.assertEqual(result.metadata["title"], "Updated")
+
+    def test_create_epic_rediscovers_unknown_epic_field(self):
+        """Test that creating an Epic with an undiscovered Epic field rediscovers fields once."""
+        self.issue_manager.get_jira_field_ids = MagicMock(return_value={})
+        self.issue_manager._rediscover_field_ids = MagicMock(return_value={"epic_name": "customfield_10011"})
+        self.issue_manager.refresh_field_cache = MagicMock()
+        self.issue_manager.jira.create_issue = MagicMock(return_value={"key": "TEST-1"})
+        self.issue_manager.get_issue = MagicMock(return_value="issue")
+
+        # Call the method
+        result = self.issue_manager.create_issue("TEST", "New epic", "Epic", epic_name="Roadmap")
+
+        # Verify the fields were rediscovered without dropping the caches, and the new field used
+        self.assertEqual(result, "issue")
+        self.issue_manager._rediscover_field_ids.assert_called_once()
+        self.issue_manager.refresh_field_cache.assert_not_called()
+        fields = self.issue_manager.jira.create_issue.call_args.kwargs["fields"]
+        self.assertEqual(fields["customfield_10011"], "Roadmap")
+        self.assertNotIn("epic_name", fields)
+
+    def test_create_epic_drops_unresolved_epic_arguments(self):
+        """Test that Epic arguments without a matching field are not sent to Jira."""
+        self.issue_manager.get_jira_field_ids = MagicMock(return_value={"epic_link": "customfield_10014"})
+        self.issue_manager._rediscover_field_ids = MagicMock(return_value={"epic_link": "customfield_10014"})
+        self.issue_manager.jira.create_issue = MagicMock(return_value={"key": "TEST-1"})
+
+        self.issue_manager.create_issue(
+            "TEST", "New epic", "Epic", expand_response=False, epic_name="Roadmap", epic_colour="blue"
+        )
+
+        fields = self.issue_manager.jira.create_issue.call_args.kwargs["fields"]
+        self.assertFalse(any(key.startswith("epic_") for key in fields))
+
+    def test_link_issue_to_epic_remembers_working_field(self):
+        """Test that the field that linked an issue is tried first on the next link."""
+        self.issue_manager.jira.issue = MagicMock(return_value={"fields": {"issuetype": {"name": "Epic"}}})
+        self.issue_manager.get_jira_field_ids = MagicMock(return_value={"epic_link": "customfield_10100"})
+        self.issue_manager.get_issue = MagicMock(return_value="issue")
+
+        def issue_update(issue_key, fields):
+            if "customfield_10100" not in fields:
+                raise Exception("Field cannot be set")
+
+        self.issue_manager.jira.issue_update = MagicMock(side_effect=issue_update)
+
+        # The first link falls back from the parent field to the Epic Link field
+        self.assertEqual(self.issue_manager.link_issue_to_epic("TEST-1", "TEST-100"), "issue")
+        self.assertEqual(self.issue_manager.jira.issue_update.call_count, 2)
+
+        # The next link goes straight to the Epic Link field
+        self.issue_manager.jira.issue_update.reset_mock()
+        self.assertEqual(self.issue_manager.link_issue_to_epic("TEST-2", "TEST-100"), "issue")
+        self.issue_manager.jira.issue_update.assert_called_once_with(
+            "TEST-2", fields={"customfield_10100": "TEST-100"}
+        )
+
+    def test_link_issue_to_epic_skips_failing_fallbacks(self):
+        """Test that the fallback fields are skipped after repeatedly failing."""
+        self.issue_manager.jira.issue = MagicMock(return_value={"fields": {"issuetype": {"name": "Epic"}}})
+        self.issue_manager.get_jira_field_ids = MagicMock(return_value={})
+        self.issue_manager.jira.issue_update = MagicMock(side_effect=Exception("Field cannot be set"))
+
+        # parent and the three fallback fields are tried on each of the first links
+        for _ in range(3):
+            with self.assertRaises(JiraAPIError):
+                self.issue_manager.link_issue_to_epic("TEST-1", "TEST-100")
+        self.assertEqual(self.issue_manager.jira.issue_update.call_count, 12)
+
+        # Then only the parent field is tried
+        self.issue_manager.jira.issue_update.reset_mock()
+        with self.assertRaises(JiraAPIError):
+            self.issue_manager.link_issue_to_epic("TEST-2", "TEST-100")
+        self.issue_manager.jira.issue_update.assert_called_once_with("TEST-2", fields={"parent": {"key": "TEST-100"}})
+
+    def test_epic_type_checked_once(self):
+        """Test that the epic's issue type is fetched once for repeated epic operations."""
+        self.issue_manager.jira.issue = MagicMock(return_value={"fields": {"issuetype": {"name": "Epic"}}})
+        self.issue_manager.get_jira_field_ids = MagicMock(return_value={"parent": "parent"})
+        self.issue_manager.jira.issue_update = MagicMock()
+        self.issue_manager.get_issue = MagicMock(return_value="issue")
+        self.issue_manager.search_issues = MagicMock(return_value=[])
+
+        self.issue_manager.link_issue_to_epic("TEST-1", "TEST-100")
+        self.issue_manager.link_issue_to_epic("TEST-2", "TEST-100")
+        self.issue_manager.get_epic_issues("TEST-100")
+
+        self.issue_manager.jira.issue.assert_called_once_with("TEST-100", fields="issuetype")
+
+    def test_epic_operations_reject_other_issue_types(self):
+        """Test that epic operations fail for issues that are not epics."""
+        self.issue_manager.jira.issue = MagicMock(return_value={"fields": {"issuetype": {"name": "Task"}}})
+
+        with self.assertRaises(JiraIssueTypeError):
+            self.issue_manager.get_epic_issues("TEST-100")
+
+    def test_link_issues_to_epic(self):
+        """Test that several issues are linked reusing one epic check and the working field."""
+        self.issue_manager.jira.issue = MagicMock(return_value={"fields": {"issuetype": {"name": "Epic"}}})
+        self.issue_manager.get_jira_field_ids = MagicMock(return_value={"epic_link": "customfield_10100"})
+        self.issue_manager.get_issue = MagicMock(side_effect=lambda key: f"issue {key}")
+
+        def issue_update(issue_key, fields):
+            if "customfield_10100" not in fields:
+                raise Exception("Field cannot be set")
+
+        self.issue_manager.jira.issue_update = MagicMock(side_effect=issue_update)
+
+        keys = [f"TEST-{i}" for i in range(1, 6)]
+        documents = self.issue_manager.link_issues_to_epic(keys, "TEST-100", max_workers=3)
+
+        self.assertEqual(documents, [f"issue {key}" for key in keys])
+        self.issue_manager.jira.issue.assert_called_once()
+        # Only the first issue probes the parent field before the Epic Link field
+        self.assertEqual(self.issue_manager.jira.issue_update.call_count, len(keys) + 1)
+        self.assertEqual(self.issue_manager.link_issues_to_epic([], "TEST-100"), [])
+
+    def test_get_epic_issues_tries_queries_in_order(self):
+        """Test that the first query returning issues wins, whichever finishes first."""
+        self.issue_manager.jira.issue = MagicMock(return_value={"fields": {"issuetype": {"name": "Epic"}}})
+        self.issue_manager.get_jira_field_ids = MagicMock(return_value={})
+        results = {
+            "parent = EPIC-1": Exception("Field 'parent' does not support searching"),
+            "'Epic Link' = EPIC-1": ["linked"],
+            "'Epic' = EPIC-1": ["epic"],
+        }
+
+        def search_issues(jql, limit, batch_size):
+            result = results.get(jql, [])
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        self.issue_manager.search_issues = MagicMock(side_effect=search_issues)
+
+        self.assertEqual(self.issue_manager.get_epic_issues("EPIC-1"), ["linked"])
+        # The duplicate parent query only runs once
+        queries = [call.args[0] for call in self.issue_manager.search_issues.call_args_list]
+        self.assertEqual(queries.count("parent = EPIC-1"), 1)
+
+    def test_get_epic_issues_trusts_discovered_field(self):
+        """Test that an empty result on a discovered field is returned without trying fallbacks."""
+        self.issue_manager.jira.issue = MagicMock(return_value={"fields": {"issuetype": {"name": "Epic"}}})
+        self.issue_manager.get_jira_field_ids = MagicMock(return_value={"epic_link": "customfield_10100"})
+        self.issue_manager.search_issues = MagicMock(return_value=[])
+
+        self.assertEqual(self.issue_manager.get_epic_issues("EPIC-1"), [])
+        self.issue_manager.search_issues.assert_called_once_with(
+            '"customfield_10100" = EPIC-1', limit=50, batch_size=500
+        )
+
+        # Fallbacks can still be requested explicitly
+        self.issue_manager.search_issues.reset_mock()
+        self.issue_manager.get_epic_issues("EPIC-1", try_fallbacks=True)
+        self.assertEqual(self.issue_manager.search_issues.call_count, 6)
+
+    def test_get_worklogs(self):
+        """Test that worklogs are formatted, leaving missing timestamps empty."""
+        self.issue_manager.jira.resource_url = MagicMock(return_value="rest/api/2/issue")
+        self.issue_manager.jira.get = MagicMock(return_value={
+            "total": 1,
+            "worklogs": [
+                {
+                    "id": "100",
+                    "comment": "Fixed it",
+                    "started": "2024-01-02T09:00:00.000+0000",
+                    "timeSpent": "1h",
+                    "timeSpentSeconds": 3600,
+                    "author": {"displayName": "Test User"},
+                }
+            ]
+        })
+
+        worklogs = self.issue_manager.get_worklogs("TEST-1")
+
+        self.assertEqual(worklogs, [{
+            "id": "100",
+            "comment": "Cleaned text",
+            "created": "",
+            "updated": "",
+            "started": "2024-01-02",
+            "timeSpent": "1h",
+            "timeSpentSeconds": 3600,
+            "author": "Test User",
+        }])
+        self.issue_manager.jira.get.assert_called_once_with(
+            "rest/api/2/issue/TEST-1/worklog", params={"startAt": 0, "maxResults": 1000}
+        )
+
+    def test_iter_worklogs_pages(self):
+        """Test that worklogs are fetched page by page until the total is reached."""
+        self.issue_manager.jira.resource_url = MagicMock(return_value="rest/api/2/issue")
+        self.issue_manager.jira.get = MagicMock(side_effect=[
+            {"total": 3, "worklogs": [{"id": "1"}, {"id": "2"}]},
+            {"total": 3, "worklogs": [{"id": "3"}]},
+        ])
+
+        worklogs = self.issue_manager.iter_worklogs("TEST-1", page_size=2)
+
+        self.assertEqual([worklog["id"] for worklog in worklogs], ["1", "2", "3"])
+        self.assertEqual(self.issue_manager.jira.get.call_args.kwargs["params"], {"startAt": 2, "maxResults": 2})
+
+    def test_search_issues_batches(self):
+        """Test that search_issues pages through results and follows a server-capped page size."""
+        def jql(query, fields, start, limit, expand):
+            issues = [
+                {
+                    "key": f"TEST-{i + 1}",
+                    "fields": {
+                        "summary": "Test",
+                        "issuetype": {"name": "Task"},
+                        "status": {"name": "Open"},
+                        "created": "2024-01-01T10:00:00.000+0000",
+                    },
+                }
+                for i in range(start, min(start + min(limit, 100), 250))
+            ]
+            return {"startAt": start, "total": 250, "issues": issues}
+
+        self.issue_manager.jira.jql = MagicMock(side_effect=jql)
+
+        # Call the method
+        with self.assertLogs("mcp-jira", level="WARNING"):
+            result = self.issue_manager.search_issues("project = TEST", limit=220, batch_size=500)
+
+        # Verify all requested issues were fetched with the capped page size
+        self.assertEqual([doc.metadata["key"] for doc in result], [f"TEST-{i + 1}" for i in range(220)])
+        requested = [(c.kwargs["start"], c.kwargs["limit"]) for c in self.issue_manager.jira.jql.call_args_list]
+        self.assertEqual(requested, [(0, 220), (100, 100), (200, 20)])
+
+    def test_bulk_create_issues(self):
+        """Test creating several issues with one request."""
+        self.issue_manager.jira.create_issues = MagicMock(return_value={
+            "issues": [{"id": "1", "key": "TEST-1"}, {"id": "2", "key": "TEST-2"}],
+            "errors": [],
+        })
+
+        # Call the method
+        result = self.issue_manager.bulk_create_issues([
+            {"project_key": "TEST", "summary": "First", "issue_type": "Task"},
+            {"project_key": "TEST", "summary": "Second", "issue_type": "Bug", "labels": ["x"]},
+        ])
+
+        # Verify result
+        self.assertEqual(result, ["TEST-1", "TEST-2"])
+        issue_updates = self.issue_manager.jira.create_issues.call_args[0][0]
+        self.assertEqual(issue_updates[1]["fields"]["issuetype"], {"name": "Bug"})
+        self.assertEqual(issue_updates[1]["fields"]["labels"], ["x"])
+
+    def test_bulk_delete_issues_and_wait(self):
+        """Test starting a bulk delete and polling its task until it completes."""
+        self.issue_manager.jira.post = MagicMock(return_value={"taskId": "10641"})
+        self.issue_manager.jira.get = MagicMock(side_effect=[
+            {"taskId": "10641", "status": "RUNNING"},
+            {"taskId": "10641", "status": "COMPLETE"},
+        ])
+
+        # Call the methods
+        task_id = self.issue_manager.bulk_delete_issues(["TEST-1", "TEST-2"])
+        with patch("mcp_atlassian.jira.issues.time.sleep") as mock_sleep:
+            progress = self.issue_manager.wait_for_bulk_task(task_id, poll_interval=0.5)
+
+        # Verify result
+        self.assertEqual(task_id, "10641")
+        self.assertEqual(progress["status"], "COMPLETE")
+        self.assertEqual(
+            self.issue_manager.jira.post.call_args.kwargs["data"]["selectedIssueIdsOrKeys"],
+            ["TEST-1", "TEST-2"],
+        )
+        self.issue_manager.jira.get.assert_called_with("rest/api/3/bulk/queue/10641")
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_delete_issues(self):
+        """Test deleting several issues in bulk on Cloud and one at a time on Server."""
+        self.issue_manager.jira.post = MagicMock(return_value={"taskId": "10641"})
+        self.issue_manager.jira.get = MagicMock(return_value={"status": "COMPLETE"})
+        self.issue_manager.jira.delete_issue = MagicMock()
+
+        # Empty lists send nothing
+        self.assertTrue(self.issue_manager.delete_issues([]))
+        self.issue_manager.jira.post.assert_not_called()
+
+        # Cloud uses one bulk operation
+        self.assertTrue(self.issue_manager.delete_issues(["TEST-1", "TEST-2"]))
+        self.issue_manager.jira.post.assert_called_once()
+        self.issue_manager.jira.delete_issue.assert_not_called()
+
+        # Server/Data Center has no bulk operations
+        self.issue_manager.config = JiraConfig(url="https://jira.example.com", personal_token="token")
+        self.assertTrue(self.issue_manager.delete_issues(["TEST-1", "TEST-2"]))
+        self.assertEqual(self.issue_manager.jira.post.call_count, 1)
+        self.assertEqual(
+            [c.args[0] for c in self.issue_manager.jira.delete_issue.call_args_list], ["TEST-1", "TEST-2"]
+        )
+
+    def test_delete_issues_bulk_failure(self):
+        """Test that a bulk delete leaving issues behind raises an error naming them."""
+        self.issue_manager.jira.post = MagicMock(return_value={"taskId": "10641"})
+        self.issue_manager.jira.get = MagicMock(return_value={
+            "status": "COMPLETE",
+            "failedAccessibleIssues": {"10001": ["Issue is locked"]},
+        })
+
+        with self.assertRaises(JiraAPIError) as context:
+            self.issue_manager.delete_issues(["TEST-1", "TEST-2"])
+
+        self.assertIn("10001", str(context.exception))
+
+
 if __name__ == "__main__":
     unittest.main()
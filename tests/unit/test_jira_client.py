@@ -1,10 +1,15 @@
 """
 Unit tests for the JiraClient class that don't require actual API calls.
 """
+import os
+import tempfile
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 
-from mcp_atlassian.jira.client import JiraClient
+from requests import HTTPError
+
+from mcp_atlassian.jira.client import HTTP_POOL_SIZE, HTTP_RETRIES, JiraClient, _env_config_settings
 from mcp_atlassian.jira.exceptions import (
     JiraAuthenticationError,
     JiraPermissionError,
@@ -18,6 +23,14 @@ from mcp_atlassian.config import JiraConfig
 class TestJiraClientUnit(unittest.TestCase):
     """Unit tests for the JiraClient class using mocks."""
 
+    def setUp(self):
+        """Keep the on-disk field cache in a temporary directory."""
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        env_patcher = patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache_dir.name})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
     def test_handle_error_with_status_code(self):
         """Test handling of errors with HTTP status codes."""
         with patch("atlassian.Jira") as mock_jira_class:
@@ -29,9 +42,8 @@ class TestJiraClientUnit(unittest.TestCase):
             ))
             
             # Test 401 error
-            error = MagicMock()
+            error = Exception("Unauthorized")
             error.status_code = 401
-            error.__str__ = lambda x: "Unauthorized"
             
             with self.assertRaises(JiraAuthenticationError):
                 client._handle_error(error, "issue", "TEST-1")
@@ -62,27 +74,36 @@ class TestJiraClientUnit(unittest.TestCase):
             ))
             
             # Test authentication error
-            error = MagicMock()
-            error.status_code = None
-            error.__str__ = lambda x: "Authentication failed"
-            
             with self.assertRaises(JiraAuthenticationError):
-                client._handle_error(error, "issue", "TEST-1")
+                client._handle_error(Exception("Authentication failed"), "issue", "TEST-1")
             
             # Test permission error
-            error.__str__ = lambda x: "User does not have permission"
             with self.assertRaises(JiraPermissionError):
-                client._handle_error(error, "issue", "TEST-1")
+                client._handle_error(Exception("User does not have permission"), "issue", "TEST-1")
             
             # Test not found error
-            error.__str__ = lambda x: "Issue does not exist"
             with self.assertRaises(JiraResourceNotFoundError):
-                client._handle_error(error, "issue", "TEST-1")
+                client._handle_error(Exception("Issue does not exist"), "issue", "TEST-1")
             
             # Test generic error
-            error.__str__ = lambda x: "Some other error"
             with self.assertRaises(JiraAPIError):
-                client._handle_error(error, "issue", "TEST-1")
+                client._handle_error(Exception("Some other error"), "issue", "TEST-1")
+
+    def test_handle_error_chains_original_exception(self):
+        """Test that the raised error keeps the original exception as its cause."""
+        with patch("atlassian.Jira"):
+            client = JiraClient(config=JiraConfig(
+                url="https://example.atlassian.net",
+                username="test_user",
+                api_token="test_token"
+            ))
+
+        original = ValueError("Issue does not exist")
+        with self.assertRaises(JiraResourceNotFoundError) as ctx:
+            client._handle_error(original, "issue", "TEST-1")
+
+        self.assertIs(ctx.exception.__cause__, original)
+        self.assertEqual(str(ctx.exception), "Issue TEST-1 not found: Issue does not exist")
 
     def test_get_jira_field_ids_caching(self):
         """Test that get_jira_field_ids caches results."""
@@ -130,6 +151,308 @@ class TestJiraClientUnit(unittest.TestCase):
             mock_jira.fields.assert_not_called()
             self.assertEqual(field_ids_2, field_ids)
 
+    def test_get_jira_field_ids_rules(self):
+        """Test that fields are identified by exact name, name substring and schema type."""
+        client = JiraClient(config=JiraConfig(
+            url="https://example.atlassian.net",
+            username="test_user",
+            api_token="test_token"
+        ))
+        client.jira = MagicMock()
+        client.jira.fields.return_value = [
+            {"id": "customfield_1", "name": "Parent Link", "schema": {}},
+            {"id": "priority", "name": "Priority", "schema": {}},
+            {"id": "customfield_2", "name": "Team Sprint", "schema": {}},
+            {"id": "customfield_3", "name": "Colour", "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-color"}},
+            {"id": "customfield_4", "name": "Story point estimate", "schema": {}},
+            {"id": "customfield_5", "name": "Epic Theme", "schema": {}},
+            {"id": "summary", "name": "Summary", "schema": {}},
+        ]
+
+        self.assertEqual(client.get_jira_field_ids(), {
+            "parent": "customfield_1",
+            "priority": "priority",
+            "sprint": "customfield_2",
+            "epic_color": "customfield_3",
+            "story_points": "customfield_4",
+            "epic_epic_theme": "customfield_5",
+        })
+
+    def test_get_jira_field_ids_disk_cache(self):
+        """Test that field IDs are reused across clients until the cache is refreshed."""
+        config = JiraConfig(
+            url="https://example.atlassian.net",
+            username="test_user",
+            api_token="test_token"
+        )
+        mock_jira = MagicMock()
+        mock_jira.fields.return_value = [
+            {"id": "customfield_10001", "name": "Epic Link", "schema": {}},
+        ]
+
+        # First client queries the API and saves the result
+        client = JiraClient(config=config)
+        client.jira = mock_jira
+        self.assertEqual(client.get_jira_field_ids(), {"epic_link": "customfield_10001"})
+        self.assertTrue(client._field_cache_path().exists())
+
+        # A new client (e.g., after a restart) loads the saved result
+        client_2 = JiraClient(config=config)
+        client_2.jira = mock_jira
+        self.assertEqual(client_2.get_jira_field_ids(), {"epic_link": "customfield_10001"})
+        mock_jira.fields.assert_called_once()
+
+        # Refreshing forgets both caches
+        client_2.refresh_field_cache()
+        self.assertFalse(client_2._field_cache_path().exists())
+        client_2.get_jira_field_ids()
+        self.assertEqual(mock_jira.fields.call_count, 2)
+
+        # A cache file that can't be removed doesn't break the refresh
+        with patch("mcp_atlassian.jira.client.Path.unlink", side_effect=PermissionError("read-only")):
+            client_2.refresh_field_cache()
+        self.assertEqual(client_2._field_ids_cache, {})
+
+    def test_rediscover_field_ids(self):
+        """Test that rediscovery queries Jira at most once per lease and keeps the file cache."""
+        client = JiraClient(config=JiraConfig(
+            url="https://example.atlassian.net",
+            username="test_user",
+            api_token="test_token"
+        ))
+        client.jira = MagicMock()
+        client.jira.fields.return_value = [{"id": "customfield_10001", "name": "Epic Link", "schema": {}}]
+
+        # IDs queried during the caller's operation are not queried again
+        started = time.time()
+        field_ids = client.get_jira_field_ids()
+        self.assertIs(client._rediscover_field_ids(started), field_ids)
+        client.jira.fields.assert_called_once()
+
+        # An older lease is rediscovered once, replacing the cached dict instead of clearing it
+        client.jira.fields.return_value.append({"id": "customfield_10011", "name": "Epic Name", "schema": {}})
+        rediscovered = client._rediscover_field_ids(time.time() + 1)
+        self.assertEqual(rediscovered["epic_name"], "customfield_10011")
+        self.assertEqual(field_ids, {"epic_link": "customfield_10001"})
+        self.assertTrue(client._field_cache_path().exists())
+        self.assertIs(client._rediscover_field_ids(time.time() + 1), rediscovered)
+        self.assertEqual(client.jira.fields.call_count, 2)
+
+    def test_get_jira_field_ids_lease(self):
+        """Test that field IDs are rediscovered once their read budget or TTL runs out."""
+        client = JiraClient(config=JiraConfig(
+            url="https://example.atlassian.net",
+            username="test_user",
+            api_token="test_token",
+            field_cache_max_reads=2
+        ))
+        client.jira = MagicMock()
+        client.jira.fields.return_value = [{"id": "customfield_10001", "name": "Epic Link", "schema": {}}]
+
+        with patch("mcp_atlassian.jira.client.time.monotonic", return_value=1000.0) as mock_monotonic:
+            # Discovery followed by two cached reads
+            for _ in range(3):
+                client.get_jira_field_ids()
+            self.assertEqual(client.jira.fields.call_count, 1)
+
+            # The read budget is spent, Jira is queried again even though the file cache is fresh
+            client.get_jira_field_ids()
+            self.assertEqual(client.jira.fields.call_count, 2)
+
+            # The lease expires after the TTL
+            mock_monotonic.return_value = 1000.0 + 901
+            client.get_jira_field_ids()
+            self.assertEqual(client.jira.fields.call_count, 3)
+
+    def test_get_jira_field_ids_caches_empty_result(self):
+        """Test that an instance without matching fields is not queried again while the lease is valid."""
+        client = JiraClient(config=JiraConfig(
+            url="https://example.atlassian.net",
+            username="test_user",
+            api_token="test_token"
+        ))
+        client.jira = MagicMock()
+        client.jira.fields.return_value = [{"id": "summary", "name": "Summary", "schema": {}}]
+
+        self.assertEqual(client.get_jira_field_ids(), {})
+        self.assertEqual(client.get_jira_field_ids(), {})
+        client.jira.fields.assert_called_once()
+
+    def test_retry_rate_limited(self):
+        """Test that calls answered with status 429 are retried after the requested delay."""
+        client = JiraClient(config=JiraConfig(
+            url="https://example.atlassian.net",
+            username="test_user",
+            api_token="test_token"
+        ))
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "5"})
+        func = MagicMock(side_effect=[HTTPError("Too many requests", response=throttled), "done"])
+
+        with patch("mcp_atlassian.jira.client.time.sleep") as mock_sleep:
+            self.assertEqual(client._retry_rate_limited(func, "TEST-1", data={}), "done")
+
+        self.assertEqual(func.call_count, 2)
+        func.assert_called_with("TEST-1", data={})
+        delay = mock_sleep.call_args.args[0]
+        self.assertGreaterEqual(delay, 5)
+        self.assertLessEqual(delay, 6)
+
+        # Other errors are raised immediately
+        func = MagicMock(side_effect=HTTPError("Not found", response=MagicMock(status_code=404)))
+        with self.assertRaises(HTTPError):
+            client._retry_rate_limited(func)
+        func.assert_called_once()
+
+    def test_get_current_user_account_id_cached(self):
+        """Test that the current user's account ID is fetched once until invalidated."""
+        client = JiraClient(config=JiraConfig(
+            url="https://example.atlassian.net",
+            username="test_user",
+            api_token="test_token"
+        ))
+        client.jira = MagicMock()
+        client.jira.myself.return_value = {"accountId": "abc"}
+
+        # Repeated calls hit the API once
+        self.assertEqual(client.get_current_user_account_id(), "abc")
+        self.assertEqual(client.get_current_user_account_id(), "abc")
+        client.jira.myself.assert_called_once()
+
+        # Invalidating forces a new lookup
+        client.invalidate_identity()
+        client.get_current_user_account_id()
+        self.assertEqual(client.jira.myself.call_count, 2)
+
+    def test_create_config_from_env(self):
+        """Test that settings parsed from the environment follow environment changes."""
+        env = {"JIRA_URL": "https://example.atlassian.net", "JIRA_USERNAME": "user", "JIRA_API_TOKEN": "token"}
+        with patch.dict(os.environ, env):
+            client = JiraClient()
+            self.assertEqual(client.config.username, "user")
+            self.assertTrue(client.config.verify_ssl)
+
+            os.environ["JIRA_SSL_VERIFY"] = "false"
+            self.assertFalse(JiraClient().config.verify_ssl)
+
+    def test_create_config_from_env_numeric_settings(self):
+        """Test that numeric settings are read from the environment, ignoring invalid values."""
+        env = {"JIRA_URL": "https://example.atlassian.net", "JIRA_USERNAME": "user", "JIRA_API_TOKEN": "token"}
+        with patch.dict(os.environ, {**env, "JIRA_BOARD_PAGE_SIZE": "25"}):
+            self.assertEqual(JiraClient().config.board_page_size, 25)
+        with patch.dict(os.environ, {**env, "JIRA_BOARD_PAGE_SIZE": "many"}):
+            self.assertEqual(JiraClient().config.board_page_size, JiraConfig.board_page_size)
+        with patch.dict(os.environ, {**env, "JIRA_FIELD_CACHE_TTL": "0", "JIRA_FIELD_CACHE_READS": "x"}):
+            config = JiraClient().config
+            self.assertEqual(config.field_cache_ttl, 0)
+            self.assertEqual(config.field_cache_max_reads, JiraConfig.field_cache_max_reads)
+        with patch.dict(os.environ, {**env, "JIRA_TRUST_RESPONSES": "yes"}):
+            self.assertTrue(JiraClient().config.trust_responses)
+
+    def test_env_config_settings_rejects_mismatched_values(self):
+        """Test that a values tuple not matching JIRA_ENV_VARS fails instead of dropping settings."""
+        with self.assertRaises(ValueError):
+            _env_config_settings(("https://example.atlassian.net",))
+
+    def test_connection_pool_size(self):
+        """Test that the session keeps a larger connection pool per host."""
+        client = JiraClient(config=JiraConfig(
+            url="https://example.atlassian.net",
+            username="test_user",
+            api_token="test_token"
+        ))
+
+        adapter = client.jira._session.get_adapter("https://example.atlassian.net")
+        self.assertEqual(adapter._pool_maxsize, HTTP_POOL_SIZE)
+
+    def test_session_retries_unavailable_responses(self):
+        """Test that idempotent requests to an unavailable server are retried by the session."""
+        client = JiraClient(config=JiraConfig(
+            url="https://example.atlassian.net",
+            username="test_user",
+            api_token="test_token"
+        ))
+
+        retry = client.jira._session.get_adapter("https://example.atlassian.net").max_retries
+        self.assertEqual(retry.total, HTTP_RETRIES)
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertTrue(retry.is_retry("PUT", 502))
+        self.assertFalse(retry.is_retry("POST", 503))
+        # Rate limiting is handled by the callers, not stacked on session retries
+        self.assertFalse(retry.is_retry("GET", 429))
+        self.assertFalse(retry.is_retry("GET", 404))
+
+    def test_fast_json_hook(self):
+        """Test that responses are decoded with the fast JSON parser when it is available."""
+        import json
+        from requests import Response
+
+        fast_loads = MagicMock(side_effect=json.loads)
+        with patch("mcp_atlassian.jira.client._fast_json_loads", fast_loads):
+            client = JiraClient(config=JiraConfig(
+                url="https://example.atlassian.net",
+                username="test_user",
+                api_token="test_token"
+            ))
+
+            response = Response()
+            response._content = b'{"key": "TEST-1"}'
+            for hook in client.jira._session.hooks["response"]:
+                hook(response)
+
+            self.assertEqual(response.json(), {"key": "TEST-1"})
+            fast_loads.assert_called_once_with(b'{"key": "TEST-1"}')
+
+            # Empty bodies still raise the error atlassian-python-api expects
+            response._content = b""
+            with self.assertRaises(ValueError):
+                response.json()
+
+    def test_http2_adapter(self):
+        """Test that HTTPS requests are sent through the HTTP/2 adapter when enabled."""
+        import httpx
+
+        def handler(request):
+            return httpx.Response(200, json={"accountId": "abc"}, headers={"X-Test": "1"})
+
+        mock_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("mcp_atlassian.jira.transport.httpx.Client", return_value=mock_client) as client_class:
+            client = JiraClient(config=JiraConfig(
+                url="https://example.atlassian.net",
+                username="test_user",
+                api_token="test_token",
+                http2=True,
+            ))
+
+        self.assertTrue(client_class.call_args.kwargs["http2"])
+        response = client.jira._session.get("https://example.atlassian.net/rest/api/2/myself", timeout=5)
+        self.assertEqual(response.json(), {"accountId": "abc"})
+        self.assertEqual(response.headers["x-test"], "1")
+
+    def test_http2_adapter_retries_and_streams(self):
+        """Test that the HTTP/2 adapter keeps the retry policy and supports iter_content."""
+        import httpx
+
+        statuses = iter([503, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses), content=b"payload", headers={"Retry-After": "0"})
+
+        mock_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("mcp_atlassian.jira.transport.httpx.Client", return_value=mock_client):
+            client = JiraClient(config=JiraConfig(
+                url="https://example.atlassian.net",
+                username="test_user",
+                api_token="test_token",
+                http2=True,
+            ))
+
+        with patch("mcp_atlassian.jira.transport.time.sleep") as mock_sleep:
+            response = client.jira._session.get("https://example.atlassian.net/file", stream=True, timeout=5)
+
+        self.assertEqual(response.status_code, 200)
+        mock_sleep.assert_called_once_with(0)
+        self.assertEqual(b"".join(response.iter_content(chunk_size=3)), b"payload")
+
 
 if __name__ == "__main__":
     unittest.main()
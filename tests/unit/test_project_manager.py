@@ -30,6 +30,7 @@ class TestProjectManagerUnit(unittest.TestCase):
         self.mock_jira = MagicMock()
         self.mock_client = self.mock_client_class.return_value
         self.mock_client.jira = self.mock_jira
+        self.mock_client.config = JiraConfig(url="https://example.atlassian.net")
         
         # Create a project manager with the mock client
         self.project_manager = ProjectManager(self.mock_client)
@@ -59,14 +60,16 @@ class TestProjectManagerUnit(unittest.TestCase):
     def test_get_projects(self):
         """Test retrieving projects."""
         # Setup mock
-        projects_data = [self.sample_project_data]
-        self.mock_jira.projects.return_value = projects_data
+        self.mock_jira.get.return_value = {"values": [self.sample_project_data], "isLast": True}
         
         # Call the method
         projects = self.project_manager.get_projects()
         
         # Verify
-        self.mock_jira.projects.assert_called_once_with()
+        self.mock_jira.get.assert_called_once_with(
+            "rest/api/2/project/search",
+            params={"startAt": 0, "maxResults": 50},
+        )
         self.assertEqual(len(projects), 1)
         self.assertIsInstance(projects[0], Project)
         self.assertEqual(projects[0].key, "TEST")
@@ -75,8 +78,7 @@ class TestProjectManagerUnit(unittest.TestCase):
     def test_get_projects_with_params(self):
         """Test retrieving projects with parameters."""
         # Setup mock
-        projects_data = [self.sample_project_data]
-        self.mock_jira.projects.return_value = projects_data
+        self.mock_jira.get.return_value = {"values": [self.sample_project_data], "isLast": True}
         
         # Call the method with params
         projects = self.project_manager.get_projects(
@@ -92,19 +94,50 @@ class TestProjectManagerUnit(unittest.TestCase):
         )
         
         # Verify
-        self.mock_jira.projects.assert_called_once_with(
-            recent=5,
-            expand="description,lead",
-            orderBy="name",
-            query="Test",
-            status="active",
-            typeKey="software",
-            categoryId=123,
-            action="view",
-            properties="key1,key2"
+        self.mock_jira.get.assert_called_once_with(
+            "rest/api/2/project/search",
+            params={
+                "recent": 5,
+                "expand": "description,lead",
+                "orderBy": "name",
+                "query": "Test",
+                "status": "active",
+                "typeKey": "software",
+                "categoryId": 123,
+                "action": "view",
+                "properties": "key1,key2",
+                "startAt": 0,
+                "maxResults": 50,
+            },
         )
         self.assertEqual(len(projects), 1)
-    
+
+    def test_get_projects_paginated_and_cached(self):
+        """Test that all search pages are fetched once and issue types are read from them."""
+        # Setup mock
+        second_project = dict(self.sample_project_data, id="10001", key="OTHER",
+                              issueTypes=[{"id": "1", "name": "Bug"}])
+        self.mock_jira.get.side_effect = [
+            {"values": [self.sample_project_data], "isLast": False},
+            {"values": [second_project], "isLast": True},
+        ]
+
+        # Call the methods
+        issue_types = self.project_manager.get_project_issue_types("OTHER")
+        self.project_manager.get_project_issue_types("TEST")
+
+        # Verify
+        self.assertEqual(issue_types, [{"id": "1", "name": "Bug"}])
+        self.assertEqual(self.mock_jira.get.call_count, 2)
+        params = self.mock_jira.get.call_args.kwargs["params"]
+        self.assertEqual(params["startAt"], 1)
+        self.assertEqual(params["expand"], "issueTypes")
+
+        # Callers mutating a listing don't change the cached one
+        self.project_manager.get_projects(expand="issueTypes").clear()
+        self.assertEqual(len(self.project_manager.get_projects(expand="issueTypes")), 2)
+        self.assertEqual(self.mock_jira.get.call_count, 2)
+
     def test_get_project(self):
         """Test retrieving a single project."""
         # Setup mock
@@ -118,7 +151,26 @@ class TestProjectManagerUnit(unittest.TestCase):
         self.assertIsInstance(project, Project)
         self.assertEqual(project.key, "TEST")
         self.assertEqual(project.name, "Test Project")
-    
+
+    def test_get_project_trusted_response(self):
+        """Test that trusted responses are constructed without validation."""
+        self.mock_client.config = JiraConfig(url="https://example.atlassian.net", trust_responses=True)
+        self.mock_jira.project.return_value = {
+            **self.sample_project_data,
+            "components": [{"id": "1", "name": "API", "lead": {"accountId": "1", "displayName": "Lead"}}],
+            "versions": [{"id": "2", "name": "1.0", "released": True}],
+        }
+
+        with patch.object(Project, "model_validate") as mock_validate:
+            project = self.project_manager.get_project("TEST")
+
+        mock_validate.assert_not_called()
+        self.assertEqual(project.project_type_key, "software")
+        self.assertEqual(project.lead.display_name, "Test User")
+        self.assertEqual(project.components[0].lead.account_id, "1")
+        self.assertTrue(project.versions[0].released)
+        self.assertEqual(project.issue_types, [])
+
     def test_get_project_with_params(self):
         """Test retrieving a project with parameters."""
         # Setup mock
@@ -209,6 +261,22 @@ class TestProjectManagerUnit(unittest.TestCase):
         self.assertIn("Administrators", roles)
         self.assertIn("Developers", roles)
     
+    def test_project_metadata_cached(self):
+        """Test that project types and categories are fetched once."""
+        self.mock_jira.get_all_project_types.return_value = [{"key": "software"}]
+        self.mock_jira.get_project_category.return_value = {"id": "1", "name": "Internal"}
+
+        for _ in range(2):
+            self.assertEqual(self.project_manager.get_project_types(), [{"key": "software"}])
+            self.assertEqual(self.project_manager.get_project_category("1")["name"], "Internal")
+
+        self.mock_jira.get_all_project_types.assert_called_once_with()
+        self.mock_jira.get_project_category.assert_called_once_with("1")
+
+        uncached_manager = ProjectManager(self.mock_client, cache_metadata=False)
+        uncached_manager.get_project_types()
+        self.assertEqual(self.mock_jira.get_all_project_types.call_count, 2)
+
     def test_get_project_role(self):
         """Test retrieving a specific project role."""
         # Setup mock
@@ -290,7 +358,29 @@ class TestProjectManagerUnit(unittest.TestCase):
         self.assertEqual(project.key, "TEST")
         self.assertEqual(project.name, "Test Project")
         self.assertEqual(project.description, "This is a test project")
-    
+
+    def test_create_project_invalid_response(self):
+        """Test that an unexpected create response is not reported as invalid input."""
+        self.mock_jira.create_project.return_value = {"id": "10000"}
+        self.mock_client._handle_error.side_effect = JiraAPIError("Error with project creation")
+
+        with self.assertRaises(JiraAPIError) as context:
+            self.project_manager.create_project(key="TEST", name="Test Project", type_key="software")
+
+        self.assertNotIsInstance(context.exception, JiraValidationError)
+        self.mock_client._handle_error.assert_called_once()
+
+    def test_create_project_invalid_input(self):
+        """Test that invalid input raises a validation error carrying the details."""
+        with self.assertRaises(JiraValidationError) as context:
+            self.project_manager.create_project(
+                key="TEST", name="Test Project", type_key="software", avatar_id="not-a-number"
+            )
+
+        self.mock_jira.create_project.assert_not_called()
+        self.assertEqual(context.exception.errors[0]["loc"], ("avatar_id",))
+        self.assertTrue(str(context.exception).startswith("Invalid project data: avatar_id: "))
+
     def test_update_project(self):
         """Test updating a project."""
         # Setup mock